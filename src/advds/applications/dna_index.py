@@ -1,27 +1,54 @@
 from advds.succinct.wavelet_tree import WaveletTree
 
+# The FM-index (with its SA-IS construction) and the 2-bit genome packing
+# live in the string-search package and are reused rather than duplicated
+# here, so this module also needs the repository root importable (pytest.ini
+# sets pythonpath = .), not just src/.
+from src.strings.fm_index import FMIndex
+from src.strings.packed_dna import PackedDNA
+
 
 class DNAIndex:
+    """
+    Range counts, quantiles and pattern search over a DNA sequence.
+
+    The sequence is stored 2-bit packed, so it may only contain A, C, G
+    and T (either case); anything else, such as N, raises ValueError.
+    Queries are case-insensitive, and symbols outside ACGT never match.
+    """
+
     def __init__(self, sequence):
-        self.sequence = list(sequence)
+        self.sequence = PackedDNA(sequence)
         self.wavelet_tree = WaveletTree(self.sequence)
+        self._fm_index = None
 
     def range_count(self, nucleotide, left, right):
-        return self.wavelet_tree.frequency(nucleotide, left, right)
+        return self.wavelet_tree.frequency(nucleotide.upper(), left, right)
 
     def kth_smallest(self, left, right, k):
         return self.wavelet_tree.quantile(left, right, k)
 
+    @property
+    def fm_index(self):
+        if self._fm_index is None:
+            self._fm_index = FMIndex(str(self.sequence))
+        return self._fm_index
+
     def pattern_frequency(self, pattern):
-        pattern = list(pattern)
+        """
+        Count occurrences of pattern by FM-index backward search, O(m).
+        """
+        pattern = "".join(pattern).upper()
         m = len(pattern)
         n = len(self.sequence)
 
         if m == 0 or m > n:
             return 0
 
-        count = 0
-        for i in range(n - m + 1):
-            if self.sequence[i:i + m] == pattern:
-                count += 1
-        return count
\ No newline at end of file
+        return self.fm_index.count(pattern)
+
+    def pattern_positions(self, pattern):
+        pattern = "".join(pattern).upper()
+        if not pattern or len(pattern) > len(self.sequence):
+            return []
+        return self.fm_index.locate(pattern)
\ No newline at end of file
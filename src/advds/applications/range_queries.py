@@ -1,44 +1,149 @@
 from advds.trees.segment_tree import SegmentTree
 from advds.trees.fenwick_tree import FenwickTree
 from advds.trees.persistent_tree import PersistentSegmentTree
+from advds.trees.sparse_table import SparseTable
+
+
+BACKENDS = ("segment", "fenwick", "persistent")
 
 
 class RangeQueryEngine:
-    def __init__(self, arr):
+    def __init__(self, arr, backends=BACKENDS):
+        """
+        backends: which of "segment", "fenwick" and "persistent" to build
+        and keep up to date; the others are skipped on every update.
+        """
         self.arr = list(arr)
-        self.segment_tree = SegmentTree(self.arr)
-        self.fenwick_tree = FenwickTree(self.arr)
-        self.persistent_tree = PersistentSegmentTree(self.arr)
+        self.backends = tuple(backends)
+        unknown = [name for name in self.backends if name not in BACKENDS]
+        if unknown:
+            raise ValueError(f"unknown backend {unknown[0]!r}; expected one of {BACKENDS}")
+
+        self.segment_tree = SegmentTree(self.arr) if "segment" in self.backends else None
+        self.fenwick_tree = FenwickTree(self.arr) if "fenwick" in self.backends else None
+        self.persistent_tree = PersistentSegmentTree(self.arr) if "persistent" in self.backends else None
+
+        # Range min/max: sparse tables (O(1) query) while the array is
+        # static, replaced by min/max segment trees after the first update
+        self._min_max_tables = None
+        self._min_max_trees = None
+
+    def _backend(self, name):
+        tree = {
+            "segment": self.segment_tree,
+            "fenwick": self.fenwick_tree,
+            "persistent": self.persistent_tree,
+        }[name]
+        if tree is None:
+            raise ValueError(f"backend {name!r} is not enabled")
+        return tree
 
     def range_sum_segment(self, left, right):
-        return self.segment_tree.query(left, right)
+        return self._backend("segment").query(left, right)
 
     def range_sum_fenwick(self, left, right):
-        return self.fenwick_tree.range_sum(left, right)
+        return self._backend("fenwick").range_sum(left, right)
+
+    def _latest_version(self):
+        if self.persistent_tree is None:
+            return None
+        return len(self.persistent_tree.versions) - 1
+
+    def _switch_min_max_to_trees(self):
+        if self._min_max_tables is not None:
+            self._min_max_tables = None
+            self._min_max_trees = (SegmentTree(self.arr, "min"), SegmentTree(self.arr, "max"))
 
     def point_update(self, index, new_value):
         delta = new_value - self.arr[index]
         self.arr[index] = new_value
 
         # update segment tree
-        try:
+        if self.segment_tree is not None:
             self.segment_tree.update(index, new_value)
-        except AttributeError:
-            current_value = self.segment_tree.query(index, index)
-            self.segment_tree.range_update(index, index, new_value - current_value)
 
         # update fenwick tree
-        self.fenwick_tree.update(index, delta)
+        if self.fenwick_tree is not None:
+            self.fenwick_tree.update(index, delta)
+
+        # update min/max structures
+        if self._min_max_trees is not None:
+            for tree in self._min_max_trees:
+                tree.update(index, new_value)
+        else:
+            self._switch_min_max_to_trees()
 
         # create new persistent version based on latest version
-        latest_version = len(self.persistent_tree.versions) - 1
-        return self.persistent_tree.update(latest_version, index, new_value)
+        if self.persistent_tree is None:
+            return None
+        return self.persistent_tree.update(self._latest_version(), index, new_value)
+
+    def apply_updates(self, updates):
+        """
+        Apply a batch of (index, new_value) assignments.
+
+        Repeated indices are coalesced (the last value wins). Batches that
+        touch a large part of the array rebuild the Fenwick tree in O(n)
+        instead of updating it point by point, and the whole batch becomes
+        one persistent version.
+
+        Returns:
+            the new persistent version, or the latest one for an empty
+            batch (None without the persistent backend)
+        """
+        n = len(self.arr)
+        coalesced = {}
+        for index, new_value in updates:
+            if not 0 <= index < n:
+                raise IndexError("update index out of range")
+            coalesced[index] = new_value
+        if not coalesced:
+            return self._latest_version()
+
+        batch = list(coalesced.items())
+        bulk = len(batch) * max(1, n.bit_length()) >= n
+
+        if self.fenwick_tree is not None and not bulk:
+            for index, new_value in batch:
+                self.fenwick_tree.update(index, new_value - self.arr[index])
+
+        for index, new_value in batch:
+            self.arr[index] = new_value
+
+        if self.fenwick_tree is not None and bulk:
+            self.fenwick_tree = FenwickTree(self.arr)
+
+        if self.segment_tree is not None:
+            self.segment_tree.update_many(batch)
+
+        if self._min_max_trees is not None:
+            for tree in self._min_max_trees:
+                tree.update_many(batch)
+        else:
+            self._switch_min_max_to_trees()
+
+        if self.persistent_tree is None:
+            return None
+        return self.persistent_tree.update_many(self._latest_version(), batch)
 
     def time_travel_sum(self, version, left, right):
-        return self.persistent_tree.query(version, left, right)
+        return self._backend("persistent").query(version, left, right)
+
+    def _check_range(self, left, right):
+        if left < 0 or right >= len(self.arr) or left > right:
+            raise ValueError("Invalid range")
+
+    def _min_max_index(self):
+        if self._min_max_trees is not None:
+            return self._min_max_trees
+        if self._min_max_tables is None:
+            self._min_max_tables = (SparseTable(self.arr, min), SparseTable(self.arr, max))
+        return self._min_max_tables
 
     def range_min(self, left, right):
-        return min(self.arr[left:right + 1])
+        self._check_range(left, right)
+        return self._min_max_index()[0].query(left, right)
 
     def range_max(self, left, right):
-        return max(self.arr[left:right + 1])
\ No newline at end of file
+        self._check_range(left, right)
+        return self._min_max_index()[1].query(left, right)
@@ -103,11 +103,7 @@ def benchmark_segment_vs_fenwick():
 
         def run_seg_updates():
             for idx, new_val in updates:
-                try:
-                    seg.update(idx, new_val)
-                except AttributeError:
-                    current = seg.query(idx, idx)
-                    seg.range_update(idx, idx, new_val - current)
+                seg.update(idx, new_val)
 
         def run_fen_updates():
             for idx, new_val in updates:
@@ -328,7 +324,7 @@ def benchmark_wavelet_tree():
         query_time, _ = time_call(run_queries)
 
         raw_chars = len(data)
-        bitvector_bits = sum(len(node.bitvector.bits) for node in _collect_wavelet_nodes(wt))
+        bitvector_bits = sum(len(bitvector) for bitvector in wt.bitvectors)
         compression_ratio = bitvector_bits / raw_chars if raw_chars else 0.0
 
         rows.append({
@@ -381,15 +377,6 @@ def benchmark_wavelet_tree():
     )
 
 
-def _collect_wavelet_nodes(node):
-    if node is None:
-        return []
-    nodes = [node]
-    nodes.extend(_collect_wavelet_nodes(node.left))
-    nodes.extend(_collect_wavelet_nodes(node.right))
-    return nodes
-
-
 def benchmark_matrix_ops():
     sizes = [2, 4, 8, 16]
     rows = []
@@ -1,20 +1,192 @@
+from array import array
+
+# Bits are packed 64 per word (bit i lives in word i // 64 at position i % 64)
+WORD_BITS = 64
+# Rank directory: absolute counts per superblock, relative counts per word
+SUPERBLOCK_WORDS = 8
+SUPERBLOCK_BITS = WORD_BITS * SUPERBLOCK_WORDS
+# Select samples: the superblock of every SELECT_SAMPLE-th 1 (and 0)
+SELECT_SAMPLE = 512
+# A sample interval spread over more superblocks than this is sparse and
+# stores its positions outright (at most n / 4 bits over all intervals)
+SELECT_SPARSE_SPAN = 256
+
+# _BYTE_SELECT[b][r]: position of the (r + 1)-th set bit of byte b
+_BYTE_SELECT = [[j for j in range(8) if b >> j & 1] for b in range(256)]
+
+
+def _select_in_word(word, r):
+    """
+    Position of the r-th (1-based) set bit of a 64-bit word.
+    """
+    shift = 0
+    while True:
+        byte = (word >> shift) & 0xFF
+        count = byte.bit_count()
+        if r <= count:
+            return shift + _BYTE_SELECT[byte][r - 1]
+        r -= count
+        shift += 8
+
+
 class BitVector:
+    """
+    Static bit vector with constant-time rank and select.
+
+    Storage is n bits packed into array('Q') words, plus a two-level rank
+    directory (one 64-bit count per 512 bits and one 16-bit count per word)
+    and one select sample per 512 ones / zeros.
+
+    Select splits the sample intervals like Clark's scheme: a dense
+    interval (its 512 ones / zeros within SELECT_SPARSE_SPAN superblocks)
+    is binary searched over at most that many superblocks, a constant 8
+    steps; a sparse one keeps the positions of its 512 ones / zeros, which
+    costs at most a quarter of the bits it spans.
+    """
+
     def __init__(self, bits):
-        self.bits = list(bits)
-        self.n = len(self.bits)
+        words = array("Q")
+        word = 0
+        shift = 0
+        n = 0
 
-        if any(bit not in (0, 1) for bit in self.bits):
-            raise ValueError("BitVector must contain only 0s and 1s")
+        for bit in bits:
+            if bit == 1:
+                word |= 1 << shift
+            elif bit != 0:
+                raise ValueError("BitVector must contain only 0s and 1s")
+            shift += 1
+            n += 1
+            if shift == WORD_BITS:
+                words.append(word)
+                word = 0
+                shift = 0
 
-        self.prefix_ones = [0] * (self.n + 1)
-        for i in range(self.n):
-            self.prefix_ones[i + 1] = self.prefix_ones[i] + self.bits[i]
+        # Trailing partial word, or an all-zero sentinel so that rank at
+        # position n never indexes past the end
+        words.append(word)
+
+        self.n = n
+        self._words = words
+        self._build_rank_directory()
+        self._build_select_samples()
+
+    def _build_rank_directory(self):
+        words = self._words
+        superblocks = array("Q")
+        blocks = array("H")
+        total = 0
+        relative = 0
+
+        for w, word in enumerate(words):
+            if w % SUPERBLOCK_WORDS == 0:
+                superblocks.append(total)
+                relative = 0
+            blocks.append(relative)
+            count = word.bit_count()
+            relative += count
+            total += count
+
+        self._superblocks = superblocks
+        self._blocks = blocks
+        self.ones = total
+        self.zeros = self.n - total
+
+    def _build_select_samples(self):
+        samples1 = array("Q")
+        samples0 = array("Q")
+        superblocks = self._superblocks
+
+        next1 = 1
+        next0 = 1
+        for s in range(len(superblocks)):
+            end = min((s + 1) * SUPERBLOCK_BITS, self.n)
+            ones_end = superblocks[s + 1] if s + 1 < len(superblocks) else self.ones
+            zeros_end = end - ones_end
+            while next1 <= ones_end:
+                samples1.append(s)
+                next1 += SELECT_SAMPLE
+            while next0 <= zeros_end:
+                samples0.append(s)
+                next0 += SELECT_SAMPLE
+
+        self._samples1 = samples1
+        self._samples0 = samples0
+        self._sparse1 = self._build_sparse_positions(samples1, True)
+        self._sparse0 = self._build_sparse_positions(samples0, False)
+
+    def _build_sparse_positions(self, samples, ones):
+        """
+        Explicit positions for every sample interval wider than
+        SELECT_SPARSE_SPAN superblocks, keyed by interval index.
+        """
+        superblocks = self._superblocks
+        words = self._words
+        total = self.ones if ones else self.zeros
+        sparse = {}
+
+        for index in range(len(samples)):
+            lo = samples[index]
+            hi = samples[index + 1] if index + 1 < len(samples) else len(superblocks) - 1
+            if hi - lo <= SELECT_SPARSE_SPAN:
+                continue
+
+            first = index * SELECT_SAMPLE + 1
+            needed = min(SELECT_SAMPLE, total - first + 1)
+            seen = superblocks[lo] if ones else lo * SUPERBLOCK_BITS - superblocks[lo]
+            positions = array("Q")
+            w = lo * SUPERBLOCK_WORDS
+            while len(positions) < needed:
+                word = words[w] if ones else ~words[w] & 0xFFFFFFFFFFFFFFFF
+                while word and len(positions) < needed:
+                    low = word & -word
+                    word ^= low
+                    seen += 1
+                    if seen >= first:
+                        positions.append(w * WORD_BITS + low.bit_length() - 1)
+                w += 1
+            sparse[index] = positions
+
+        return sparse
 
     def __len__(self):
         return self.n
 
+    def __iter__(self):
+        for i in range(self.n):
+            yield (self._words[i >> 6] >> (i & 63)) & 1
+
+    @property
+    def size_in_bits(self):
+        """
+        Total storage of bits, rank directory and select samples.
+        """
+        return (
+            self._words.itemsize * 8 * len(self._words)
+            + self._superblocks.itemsize * 8 * len(self._superblocks)
+            + self._blocks.itemsize * 8 * len(self._blocks)
+            + self._samples1.itemsize * 8 * (len(self._samples1) + len(self._samples0))
+            + sum(
+                positions.itemsize * 8 * len(positions)
+                for sparse in (self._sparse1, self._sparse0)
+                for positions in sparse.values()
+            )
+        )
+
     def access(self, i):
-        return self.bits[i]
+        if i < 0:
+            i += self.n
+        if not 0 <= i < self.n:
+            raise IndexError("BitVector index out of range")
+        return (self._words[i >> 6] >> (i & 63)) & 1
+
+    def _rank1_prefix(self, pos):
+        """
+        Number of 1s in bits[0:pos], exclusive.
+        """
+        w = pos >> 6
+        partial = self._words[w] & ((1 << (pos & 63)) - 1)
+        return self._superblocks[w // SUPERBLOCK_WORDS] + self._blocks[w] + partial.bit_count()
 
     def rank1(self, i):
         """
@@ -23,8 +195,8 @@ class BitVector:
         if i < 0:
             return 0
         if i >= self.n:
-            i = self.n - 1
-        return self.prefix_ones[i + 1]
+            return self.ones
+        return self._rank1_prefix(i + 1)
 
     def rank0(self, i):
         """
@@ -33,39 +205,58 @@ class BitVector:
         if i < 0:
             return 0
         if i >= self.n:
-            i = self.n - 1
-        return (i + 1) - self.rank1(i)
+            return self.zeros
+        return (i + 1) - self._rank1_prefix(i + 1)
+
+    def _select(self, k, ones):
+        index = (k - 1) // SELECT_SAMPLE
+        positions = (self._sparse1 if ones else self._sparse0).get(index)
+        if positions is not None:
+            return positions[k - 1 - index * SELECT_SAMPLE]
+
+        samples = self._samples1 if ones else self._samples0
+        superblocks = self._superblocks
+
+        # Dense interval: the sampled superblocks bracket the answer within
+        # SELECT_SPARSE_SPAN superblocks; binary search between them
+        lo = samples[index]
+        hi = samples[index + 1] if index + 1 < len(samples) else len(superblocks) - 1
+        while lo < hi:
+            mid = (lo + hi + 1) // 2
+            before = superblocks[mid] if ones else mid * SUPERBLOCK_BITS - superblocks[mid]
+            if before < k:
+                lo = mid
+            else:
+                hi = mid - 1
+
+        w = lo * SUPERBLOCK_WORDS
+        last = min(w + SUPERBLOCK_WORDS, len(self._words)) - 1
+        base = superblocks[lo] if ones else lo * SUPERBLOCK_BITS - superblocks[lo]
+        r = k - base
+        blocks = self._blocks
+        while w < last:
+            next_before = blocks[w + 1] if ones else (w + 1 - lo * SUPERBLOCK_WORDS) * WORD_BITS - blocks[w + 1]
+            if next_before >= r:
+                break
+            w += 1
+
+        before = blocks[w] if ones else (w - lo * SUPERBLOCK_WORDS) * WORD_BITS - blocks[w]
+        word = self._words[w] if ones else ~self._words[w] & 0xFFFFFFFFFFFFFFFF
+        return w * WORD_BITS + _select_in_word(word, r - before)
 
     def select1(self, k):
         """
         Return the index of the k-th 1, 1-based.
         Example: select1(1) = index of first 1
         """
-        if k <= 0 or k > self.prefix_ones[-1]:
+        if k <= 0 or k > self.ones:
             return -1
-
-        lo, hi = 0, self.n - 1
-        while lo < hi:
-            mid = (lo + hi) // 2
-            if self.rank1(mid) >= k:
-                hi = mid
-            else:
-                lo = mid + 1
-        return lo
+        return self._select(k, True)
 
     def select0(self, k):
         """
         Return the index of the k-th 0, 1-based.
         """
-        total_zeros = self.n - self.prefix_ones[-1]
-        if k <= 0 or k > total_zeros:
+        if k <= 0 or k > self.zeros:
             return -1
-
-        lo, hi = 0, self.n - 1
-        while lo < hi:
-            mid = (lo + hi) // 2
-            if self.rank0(mid) >= k:
-                hi = mid
-            else:
-                lo = mid + 1
-        return lo
\ No newline at end of file
+        return self._select(k, False)
@@ -1,84 +1,152 @@
+import heapq
+from array import array
+from bisect import bisect_left, bisect_right
+
 from advds.succinct.bit_vector import BitVector
 
 
 class WaveletTree:
+    """
+    Wavelet matrix over an arbitrary sequence of comparable symbols.
+
+    Symbols are mapped to codes 0..sigma-1 in sorted order. Level l holds
+    one packed BitVector with bit (levels - 1 - l) of every code, in the
+    order left by the previous level's stable partition (0s before 1s),
+    plus the number of 0s on that level. There are no child objects and no
+    per-level copies of the data, so the structure is n * ceil(log sigma)
+    bits plus the rank/select directories, and every query walks the
+    levels iteratively.
+
+    data may also be a packed container with an alphabet attribute (its
+    symbols in code order) and an iter_codes() method, such as PackedDNA;
+    its codes are used directly instead of materializing the symbols.
+    """
+
     def __init__(self, data, alphabet=None):
-        self.data = list(data)
-        if not self.data:
-            self.low = None
-            self.high = None
-            self.mid = None
-            self.bitvector = BitVector([])
-            self.left = None
-            self.right = None
-            self.leaf_value = None
-            return
-
-        if alphabet is None:
-            alphabet = sorted(set(self.data))
-
-        self.alphabet = alphabet
-        self.low = alphabet[0]
-        self.high = alphabet[-1]
-
-        if len(alphabet) == 1:
-            self.mid = None
-            self.bitvector = BitVector([0] * len(self.data))
-            self.left = None
-            self.right = None
-            self.leaf_value = alphabet[0]
-            return
-
-        mid_idx = len(alphabet) // 2
-        left_alphabet = alphabet[:mid_idx]
-        right_alphabet = alphabet[mid_idx:]
-
-        self.mid = left_alphabet[-1]
-        bits = []
-        left_data = []
-        right_data = []
-
-        left_set = set(left_alphabet)
-
-        for x in self.data:
-            if x in left_set:
-                bits.append(0)
-                left_data.append(x)
+        packed = alphabet is None and hasattr(data, "iter_codes") and hasattr(data, "alphabet")
+        if packed:
+            alphabet = data.alphabet
+        elif alphabet is None:
+            if not isinstance(data, (list, tuple)):
+                data = list(data)
+            alphabet = sorted(set(data))
+
+        self.alphabet = list(alphabet)
+        self._codes = {symbol: code for code, symbol in enumerate(self.alphabet)}
+        self.levels = max(1, (len(self.alphabet) - 1).bit_length())
+
+        # Narrowest code width: one byte per symbol for alphabets up to 256
+        sigma = len(self.alphabet)
+        typecode = "B" if sigma <= 1 << 8 else "H" if sigma <= 1 << 16 else "I"
+        if packed:
+            codes = array(typecode, data.iter_codes())
+        else:
+            codes = array(typecode, (self._codes[x] for x in data))
+        self.length = len(codes)
+
+        # Partition into one preallocated buffer, swapped with codes per level
+        buffer = array(typecode, bytes(codes.itemsize * self.length)) if self.levels > 1 else None
+
+        self.bitvectors = []
+        self.zeros = []
+        for level in range(self.levels):
+            shift = self.levels - 1 - level
+            bitvector = BitVector((code >> shift) & 1 for code in codes)
+            self.bitvectors.append(bitvector)
+            self.zeros.append(bitvector.zeros)
+
+            # Stable partition by the current bit for the next level
+            if level + 1 < self.levels:
+                zero_at = 0
+                one_at = bitvector.zeros
+                for code in codes:
+                    if (code >> shift) & 1:
+                        buffer[one_at] = code
+                        one_at += 1
+                    else:
+                        buffer[zero_at] = code
+                        zero_at += 1
+                codes, buffer = buffer, codes
+
+    def __len__(self):
+        return self.length
+
+    def _code(self, char):
+        return self._codes.get(char, -1)
+
+    def access(self, i):
+        if i < 0:
+            i += self.length
+        if not 0 <= i < self.length:
+            raise IndexError("WaveletTree index out of range")
+
+        code = 0
+        for bitvector, zeros in zip(self.bitvectors, self.zeros):
+            bit = bitvector.access(i)
+            code = (code << 1) | bit
+            if bit:
+                i = zeros + bitvector.rank1(i) - 1
             else:
-                bits.append(1)
-                right_data.append(x)
+                i = bitvector.rank0(i) - 1
+        return self.alphabet[code]
 
-        self.bitvector = BitVector(bits)
-        self.left = WaveletTree(left_data, left_alphabet) if left_data else None
-        self.right = WaveletTree(right_data, right_alphabet) if right_data else None
-        self.leaf_value = None
+    def _rank_prefix(self, code, end):
+        """
+        Occurrences of code in positions [0, end).
+        """
+        start = 0
+        for level, bitvector in enumerate(self.bitvectors):
+            if (code >> (self.levels - 1 - level)) & 1:
+                zeros = self.zeros[level]
+                start = zeros + bitvector.rank1(start - 1)
+                end = zeros + bitvector.rank1(end - 1)
+            else:
+                start = bitvector.rank0(start - 1)
+                end = bitvector.rank0(end - 1)
+        return end - start
 
     def rank(self, char, index):
         """
         Count occurrences of char in positions [0..index], inclusive.
         """
-        if not self.data or index < 0:
+        if not self.length or index < 0:
+            return 0
+        code = self._code(char)
+        if code < 0:
             return 0
+        return self._rank_prefix(code, min(index, self.length - 1) + 1)
 
-        if index >= len(self.data):
-            index = len(self.data) - 1
+    def select(self, char, k):
+        """
+        Return the index of the k-th occurrence of char, 1-based, or -1.
+        """
+        code = self._code(char)
+        if code < 0 or k <= 0:
+            return -1
+
+        # Walk down to the start of char's run on the last level
+        start = 0
+        for level, bitvector in enumerate(self.bitvectors):
+            if (code >> (self.levels - 1 - level)) & 1:
+                start = self.zeros[level] + bitvector.rank1(start - 1)
+            else:
+                start = bitvector.rank0(start - 1)
 
-        if self.leaf_value is not None:
-            return index + 1 if char == self.leaf_value else 0
+        if k > self._rank_prefix(code, self.length):
+            return -1
 
-        if char <= self.mid:
-            next_index = self.bitvector.rank0(index) - 1
-            if self.left is None:
-                return 0
-            return self.left.rank(char, next_index)
-        else:
-            next_index = self.bitvector.rank1(index) - 1
-            if self.right is None:
-                return 0
-            return self.right.rank(char, next_index)
+        # Walk back up, mapping the position through each level's select
+        position = start + k - 1
+        for level in range(self.levels - 1, -1, -1):
+            bitvector = self.bitvectors[level]
+            if (code >> (self.levels - 1 - level)) & 1:
+                position = bitvector.select1(position - self.zeros[level] + 1)
+            else:
+                position = bitvector.select0(position + 1)
+        return position
 
     def frequency(self, char, left, right):
-        if left > right or not self.data:
+        if left > right or not self.length:
             return 0
         return self.rank(char, right) - self.rank(char, left - 1)
 
@@ -86,24 +154,101 @@ class WaveletTree:
         """
         Return the k-th smallest element in data[left:right+1], 1-based.
         """
-        if left > right or k <= 0 or k > (right - left + 1):
+        if left < 0 or right >= self.length or left > right or k <= 0 or k > (right - left + 1):
             raise ValueError("Invalid range or k")
 
-        return self._quantile(left, right, k)
-
-    def _quantile(self, left, right, k):
-        if self.leaf_value is not None:
-            return self.leaf_value
+        start, end = left, right + 1
+        code = 0
+        for level, bitvector in enumerate(self.bitvectors):
+            zeros_before = bitvector.rank0(start - 1)
+            zeros_until = bitvector.rank0(end - 1)
+            in_zeros = zeros_until - zeros_before
+            if k <= in_zeros:
+                code <<= 1
+                start, end = zeros_before, zeros_until
+            else:
+                code = (code << 1) | 1
+                k -= in_zeros
+                zeros = self.zeros[level]
+                start = zeros + (start - zeros_before)
+                end = zeros + (end - zeros_until)
+        return self.alphabet[code]
+
+    def _count_less(self, start, end, code):
+        """
+        Number of positions in [start, end) whose code is < code.
+        """
+        if code <= 0:
+            return 0
+        if code >= 1 << self.levels:
+            return end - start
+
+        less = 0
+        for level, bitvector in enumerate(self.bitvectors):
+            zeros_before = bitvector.rank0(start - 1)
+            zeros_until = bitvector.rank0(end - 1)
+            if (code >> (self.levels - 1 - level)) & 1:
+                less += zeros_until - zeros_before
+                zeros = self.zeros[level]
+                start = zeros + (start - zeros_before)
+                end = zeros + (end - zeros_until)
+            else:
+                start, end = zeros_before, zeros_until
+        return less
 
-        left_before = self.bitvector.rank0(left - 1)
-        left_total = self.bitvector.rank0(right) - left_before
+    def range_freq(self, left, right, low, high):
+        """
+        Count elements x in data[left:right+1] with low <= x <= high.
+        """
+        if left > right or not self.length:
+            return 0
+        left = max(left, 0)
+        right = min(right, self.length - 1)
+        low_code = bisect_left(self.alphabet, low)
+        high_code = bisect_right(self.alphabet, high)
+        if low_code >= high_code:
+            return 0
+        start, end = left, right + 1
+        return self._count_less(start, end, high_code) - self._count_less(start, end, low_code)
 
-        if k <= left_total:
-            new_left = left_before
-            new_right = self.bitvector.rank0(right) - 1
-            return self.left._quantile(new_left, new_right, k)
-        else:
-            right_before = self.bitvector.rank1(left - 1)
-            new_left = right_before
-            new_right = self.bitvector.rank1(right) - 1
-            return self.right._quantile(new_left, new_right, k - left_total)
\ No newline at end of file
+    def top_k(self, left, right, k):
+        """
+        Return up to k (symbol, count) pairs occurring most often in
+        data[left:right+1], ties broken by symbol order.
+        """
+        if k <= 0 or left > right or not self.length:
+            return []
+        left = max(left, 0)
+        right = min(right, self.length - 1)
+
+        # Best-first search: a node's count bounds every symbol below it
+        result = []
+        heap = [(-(right + 1 - left), 0, 0, left, right + 1)]
+        while heap and len(result) < k:
+            negative_count, code, level, start, end = heapq.heappop(heap)
+            if level == self.levels:
+                result.append((self.alphabet[code], -negative_count))
+                continue
+
+            bitvector = self.bitvectors[level]
+            zeros_before = bitvector.rank0(start - 1)
+            zeros_until = bitvector.rank0(end - 1)
+            shift = self.levels - 1 - level
+            if zeros_until > zeros_before:
+                heapq.heappush(
+                    heap, (zeros_before - zeros_until, code, level + 1, zeros_before, zeros_until)
+                )
+            ones = (end - start) - (zeros_until - zeros_before)
+            if ones:
+                zeros = self.zeros[level]
+                heapq.heappush(
+                    heap,
+                    (
+                        -ones,
+                        code | (1 << shift),
+                        level + 1,
+                        zeros + (start - zeros_before),
+                        zeros + (end - zeros_until),
+                    ),
+                )
+        return result
@@ -4,11 +4,13 @@ class FenwickTree:
             self.n = size_or_arr
             self.tree = [0] * (self.n + 1)
         else:
-            arr = size_or_arr
-            self.n = len(arr)
-            self.tree = [0] * (self.n + 1)
-            for i, value in enumerate(arr):
-                self.update(i, value)
+            # O(n) build: each node passes its total on to its parent
+            self.n = len(size_or_arr)
+            self.tree = [0] + list(size_or_arr)
+            for i in range(1, self.n + 1):
+                parent = i + (i & -i)
+                if parent <= self.n:
+                    self.tree[parent] += self.tree[i]
 
     def update(self, index, delta):
         i = index + 1
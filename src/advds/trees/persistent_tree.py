@@ -1,3 +1,7 @@
+from bisect import bisect_right
+from operator import itemgetter
+
+
 class Node:
     def __init__(self, value=0, left=None, right=None):
         self.value = value
@@ -39,6 +43,33 @@ class PersistentSegmentTree:
         self.versions.append(new_root)
         return len(self.versions) - 1
 
+    def _update_many(self, node, start, end, updates, lo, hi):
+        """
+        Copy the paths to updates[lo:hi] (sorted by index) once, sharing
+        every untouched subtree with the previous version.
+        """
+        if lo == hi:
+            return node
+
+        if start == end:
+            return Node(updates[hi - 1][1])
+
+        mid = (start + end) // 2
+        split = bisect_right(updates, mid, lo, hi, key=itemgetter(0))
+        new_left = self._update_many(node.left, start, mid, updates, lo, split)
+        new_right = self._update_many(node.right, mid + 1, end, updates, split, hi)
+        return Node(new_left.value + new_right.value, new_left, new_right)
+
+    def update_many(self, version, updates):
+        """
+        Apply a batch of (idx, value) assignments as a single new version;
+        the last value wins for repeated indices.
+        """
+        updates = sorted(dict(updates).items())
+        new_root = self._update_many(self.versions[version], 0, self.n - 1, updates, 0, len(updates))
+        self.versions.append(new_root)
+        return len(self.versions) - 1
+
     def _query(self, node, start, end, left, right):
         if right < start or end < left:
             return 0
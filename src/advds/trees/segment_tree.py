@@ -1,71 +1,283 @@
+import math
+import operator
+
+# Named monoids: (associative op, identity)
+_OPS = {
+    "sum": (operator.add, 0),
+    "min": (min, math.inf),
+    "max": (max, -math.inf),
+    "gcd": (math.gcd, 0),
+}
+
+# How a pending "add delta" changes a node covering `length` elements
+_RANGE_ADD = {
+    "sum": lambda value, delta, length: value + delta * length,
+    "min": lambda value, delta, length: value + delta,
+    "max": lambda value, delta, length: value + delta,
+}
+
+# Ops for which combining a value with itself gives the value back
+_IDEMPOTENT = {"min", "max"}
+
+_NO_TAG = object()
+
+
 class SegmentTree:
-    def __init__(self, arr):
-        self.n = len(arr)
-        self.tree = [0] * (4 * self.n)
-        self.lazy = [0] * (4 * self.n)
-        self._build(arr, 0, 0, self.n - 1)
+    """
+    Iterative segment tree over an associative op with lazy range updates.
 
-    def _build(self, arr, node, start, end):
-        if start == end:
-            self.tree[node] = arr[start]
+    Leaves live at tree[size:size + n], where size is n rounded up to a
+    power of two so that every node covers one contiguous, ordered block
+    and custom ops need not be commutative. Internal node i combines
+    children 2i and 2i + 1; nothing is recursive.
+
+    Supported:
+    - op: "sum" (default), "min", "max", "gcd", or any associative
+      callable together with its identity
+    - O(n) bulk build, point assign, range query
+    - lazy range add (sum, min, max) and range assign (any op)
+    - query_many / update_many for batches
+    """
+
+    def __init__(self, arr, op="sum", identity=None):
+        if callable(op):
+            if identity is None:
+                raise ValueError("identity is required for a custom op")
+            self.op_name = None
+            self.op = op
+            self.identity = identity
         else:
-            mid = (start + end) // 2
-            left = 2 * node + 1
-            right = 2 * node + 2
+            if op not in _OPS:
+                raise ValueError("op must be one of: 'sum', 'min', 'max', 'gcd', or a callable")
+            self.op_name = op
+            self.op, self.identity = _OPS[op]
+            if identity is not None:
+                self.identity = identity
 
-            self._build(arr, left, start, mid)
-            self._build(arr, right, mid + 1, end)
+        self.n = len(arr)
+        self.height = max(1, (self.n - 1).bit_length())
+        self.size = 1 << self.height
+        self.tree = [self.identity] * (2 * self.size)
+        self.tree[self.size:self.size + self.n] = arr
+        self.lazy_set = [_NO_TAG] * self.size
+        self.lazy_add = [0] * self.size
+        # False until the first range update, so point-only use skips pushes
+        self._lazy_pending = False
+        self._build()
 
-            self.tree[node] = self.tree[left] + self.tree[right]
+    def __len__(self):
+        return self.n
 
-    def _push(self, node, start, end):
-        if self.lazy[node] != 0:
-            # apply pending update
-            self.tree[node] += (end - start + 1) * self.lazy[node]
+    def _build(self):
+        op = self.op
+        tree = self.tree
+        for node in range(self.size - 1, 0, -1):
+            tree[node] = op(tree[2 * node], tree[2 * node + 1])
 
-            if start != end:
-                self.lazy[2 * node + 1] += self.lazy[node]
-                self.lazy[2 * node + 2] += self.lazy[node]
+    def _repeat(self, value, length):
+        """
+        value combined with itself length times (length a power of two).
+        """
+        if self.op_name == "sum":
+            return value * length
+        if self.op_name in _IDEMPOTENT:
+            return value
+        while length > 1:
+            value = self.op(value, value)
+            length //= 2
+        return value
 
-            self.lazy[node] = 0
+    def _apply_set(self, node, value, length):
+        self.tree[node] = self._repeat(value, length)
+        if node < self.size:
+            self.lazy_set[node] = value
+            self.lazy_add[node] = 0
 
-    def range_update(self, l, r, val):
-        self._range_update(0, 0, self.n - 1, l, r, val)
+    def _apply_add(self, node, delta, length):
+        self.tree[node] = _RANGE_ADD[self.op_name](self.tree[node], delta, length)
+        if node < self.size:
+            if self.lazy_set[node] is not _NO_TAG:
+                self.lazy_set[node] += delta
+            else:
+                self.lazy_add[node] += delta
 
-    def _range_update(self, node, start, end, l, r, val):
-        self._push(node, start, end)
+    def _push(self, node, length):
+        """
+        Hand node's pending tag to its two children (each length // 2).
+        """
+        half = length // 2
+        value = self.lazy_set[node]
+        if value is not _NO_TAG:
+            self._apply_set(2 * node, value, half)
+            self._apply_set(2 * node + 1, value, half)
+            self.lazy_set[node] = _NO_TAG
+        elif self.lazy_add[node]:
+            delta = self.lazy_add[node]
+            self._apply_add(2 * node, delta, half)
+            self._apply_add(2 * node + 1, delta, half)
+            self.lazy_add[node] = 0
 
-        if r < start or end < l:
+    def _push_boundaries(self, lo, hi):
+        """
+        Push tags on the root paths of leaves lo and hi - 1, top-down.
+        """
+        if not self._lazy_pending:
             return
+        for shift in range(self.height, 0, -1):
+            if ((lo >> shift) << shift) != lo:
+                self._push(lo >> shift, 1 << shift)
+            if ((hi >> shift) << shift) != hi:
+                self._push((hi - 1) >> shift, 1 << shift)
 
-        if l <= start and end <= r:
-            self.lazy[node] += val
-            self._push(node, start, end)
+    def _pull_boundaries(self, lo, hi):
+        op = self.op
+        tree = self.tree
+        for shift in range(1, self.height + 1):
+            if ((lo >> shift) << shift) != lo:
+                node = lo >> shift
+                tree[node] = op(tree[2 * node], tree[2 * node + 1])
+            if ((hi >> shift) << shift) != hi:
+                node = (hi - 1) >> shift
+                tree[node] = op(tree[2 * node], tree[2 * node + 1])
+
+    def _clamp(self, l, r):
+        """
+        Inclusive [l, r] to half-open leaf positions, or None if empty.
+        """
+        l = max(l, 0)
+        r = min(r, self.n - 1)
+        if l > r:
+            return None
+        return l + self.size, r + 1 + self.size
+
+    def query(self, l, r):
+        """
+        Combine arr[l..r], inclusive; the identity for an empty range.
+        """
+        bounds = self._clamp(l, r)
+        if bounds is None:
+            return self.identity
+        lo, hi = bounds
+        self._push_boundaries(lo, hi)
+
+        op = self.op
+        tree = self.tree
+        left_result = self.identity
+        right_result = self.identity
+        while lo < hi:
+            if lo & 1:
+                left_result = op(left_result, tree[lo])
+                lo += 1
+            if hi & 1:
+                hi -= 1
+                right_result = op(tree[hi], right_result)
+            lo >>= 1
+            hi >>= 1
+        return op(left_result, right_result)
+
+    def update(self, index, value):
+        """
+        Assign arr[index] = value.
+        """
+        if not 0 <= index < self.n:
+            raise IndexError("SegmentTree index out of range")
+
+        node = index + self.size
+        if self._lazy_pending:
+            for shift in range(self.height, 0, -1):
+                self._push(node >> shift, 1 << shift)
+
+        op = self.op
+        tree = self.tree
+        tree[node] = value
+        node >>= 1
+        while node:
+            tree[node] = op(tree[2 * node], tree[2 * node + 1])
+            node >>= 1
+
+    def _range_apply(self, l, r, apply, argument):
+        bounds = self._clamp(l, r)
+        if bounds is None:
             return
+        lo, hi = bounds
+        self._push_boundaries(lo, hi)
+        self._lazy_pending = True
 
-        mid = (start + end) // 2
-        self._range_update(2 * node + 1, start, mid, l, r, val)
-        self._range_update(2 * node + 2, mid + 1, end, l, r, val)
+        left, right = lo, hi
+        length = 1
+        while left < right:
+            if left & 1:
+                apply(left, argument, length)
+                left += 1
+            if right & 1:
+                right -= 1
+                apply(right, argument, length)
+            left >>= 1
+            right >>= 1
+            length <<= 1
 
-        self.tree[node] = (
-            self.tree[2 * node + 1] +
-            self.tree[2 * node + 2]
-        )
+        self._pull_boundaries(lo, hi)
 
-    def query(self, l, r):
-        return self._query(0, 0, self.n - 1, l, r)
+    def range_add(self, l, r, delta):
+        """
+        Add delta to every element of arr[l..r], inclusive.
+        """
+        if self.op_name not in _RANGE_ADD:
+            raise ValueError("range_add is only supported for 'sum', 'min' and 'max'")
+        self._range_apply(l, r, self._apply_add, delta)
 
-    def _query(self, node, start, end, l, r):
-        self._push(node, start, end)
+    # Historical name of range_add
+    range_update = range_add
 
-        if r < start or end < l:
-            return 0
+    def range_assign(self, l, r, value):
+        """
+        Set every element of arr[l..r], inclusive, to value.
+        """
+        self._range_apply(l, r, self._apply_set, value)
 
-        if l <= start and end <= r:
-            return self.tree[node]
+    def _push_all(self):
+        if not self._lazy_pending:
+            return
+        length = self.size
+        level_start = 1
+        while level_start < self.size:
+            for node in range(level_start, 2 * level_start):
+                self._push(node, length)
+            level_start *= 2
+            length //= 2
+        self._lazy_pending = False
+
+    def query_many(self, ranges):
+        """
+        Answer a batch of inclusive (l, r) queries, in order.
+        """
+        query = self.query
+        return [query(l, r) for l, r in ranges]
+
+    def update_many(self, updates):
+        """
+        Apply a batch of (index, value) point assignments, in order.
+
+        Batches large enough to touch a good part of the tree are written
+        straight into the leaves and followed by one O(n) rebuild instead
+        of a root-to-leaf walk per update.
+        """
+        if not isinstance(updates, (list, tuple)):
+            updates = list(updates)
+
+        if len(updates) * self.height < self.n:
+            update = self.update
+            for index, value in updates:
+                update(index, value)
+            return
 
-        mid = (start + end) // 2
-        left = self._query(2 * node + 1, start, mid, l, r)
-        right = self._query(2 * node + 2, mid + 1, end, l, r)
+        for index, _ in updates:
+            if not 0 <= index < self.n:
+                raise IndexError("SegmentTree index out of range")
 
-        return left + right
\ No newline at end of file
+        self._push_all()
+        tree = self.tree
+        size = self.size
+        for index, value in updates:
+            tree[size + index] = value
+        self._build()
@@ -0,0 +1,29 @@
+class SparseTable:
+    """
+    Static range queries for an idempotent operation (min, max, gcd, ...).
+
+    Level k stores op over every window of 2^k elements, so a query
+    combines two overlapping windows: O(n log n) build, O(1) query.
+    """
+
+    def __init__(self, arr, op=min):
+        self.n = len(arr)
+        self.op = op
+        self.table = [list(arr)]
+
+        width = 1
+        while 2 * width <= self.n:
+            previous = self.table[-1]
+            self.table.append(list(map(op, previous[:-width], previous[width:])))
+            width *= 2
+
+    def query(self, left, right):
+        """
+        Combine arr[left..right], inclusive.
+        """
+        if left < 0 or right >= self.n or left > right:
+            raise ValueError("Invalid range")
+
+        level = (right - left + 1).bit_length() - 1
+        row = self.table[level]
+        return self.op(row[left], row[right - (1 << level) + 1])
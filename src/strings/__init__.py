@@ -1,7 +1,36 @@
-from .kmp import compute_lps, kmp_search, kmp_search_all
-from .rabin_karp import rabin_karp_search, rabin_karp_search_all, rolling_hash
-from .suffix_array import build_suffix_array, build_lcp_array, suffix_array_search
+from .kmp import compute_lps, kmp_search, kmp_search_all, kmp_search_stream
+from .rabin_karp import (
+    rabin_karp_search,
+    rabin_karp_search_all,
+    rabin_karp_search_many,
+    rabin_karp_search_stats,
+    rabin_karp_search_stream,
+    rolling_hash,
+)
+from .suffix_array import (
+    build_suffix_array,
+    build_suffix_array_ints,
+    build_lcp_array,
+    build_lcp_lr,
+    count_distinct_substrings,
+    longest_repeated_substring,
+    maximal_repeats,
+    most_frequent_repeats,
+    suffix_array_range,
+    suffix_array_search,
+    suffix_array_search_batch,
+)
+from .segmented_suffix_array import SegmentedSuffixArray
 from .suffix_tree import CompressedSuffixTree
+from .aho_corasick import AhoCorasick, aho_corasick_search_all
+from .fm_index import FMIndex
+from .document_index import DocumentIndex
+from .approximate import bitap_hamming_search, myers_edit_search
+from .parallel_search import parallel_search_all
+from .cost_model import CostModel
 from .search_engine import StringSearchEngine
+from .packed_dna import PackedDNA
 from .dna_search import DNASearchEngine
-from .plagiarism import plagiarism_similarity, longest_common_substring
\ No newline at end of file
+from .suffix_automaton import SuffixAutomaton
+from .plagiarism import plagiarism_similarity, longest_common_substring, longest_common_substring_many
+from .plagiarism_index import PlagiarismIndex, winnow_fingerprints
@@ -0,0 +1,145 @@
+"""
+Aho-Corasick multi-pattern string matching.
+
+Implements:
+- trie + failure-link construction over the pattern alphabet
+- full goto (DFA) table stored as one flat integer array
+- dictionary (output) links so every match is reported in one scan
+
+Complexity:
+- preprocessing: O(total pattern length * alphabet size)
+- search: O(n + number of matches)
+
+Characters that do not occur in any pattern reset the automaton to the
+root, so the table only needs one column per pattern character.
+"""
+
+from array import array
+from collections import deque
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+
+class AhoCorasick:
+    def __init__(self, patterns: Iterable[str]):
+        # Distinct patterns in first-seen order
+        self.patterns: List[str] = list(dict.fromkeys(patterns))
+        self._has_empty = any(len(pattern) == 0 for pattern in self.patterns)
+
+        alphabet = sorted({ch for pattern in self.patterns for ch in pattern})
+        self.alphabet: Dict[str, int] = {ch: i for i, ch in enumerate(alphabet)}
+        self._sigma = max(len(alphabet), 1)
+
+        self._build()
+
+    def _build(self) -> None:
+        sigma = self._sigma
+        alphabet = self.alphabet
+
+        goto = [-1] * sigma
+        terminal = [-1]
+
+        for pid, pattern in enumerate(self.patterns):
+            if len(pattern) == 0:
+                continue
+            state = 0
+            for ch in pattern:
+                slot = state * sigma + alphabet[ch]
+                nxt = goto[slot]
+                if nxt == -1:
+                    nxt = len(terminal)
+                    goto[slot] = nxt
+                    goto.extend([-1] * sigma)
+                    terminal.append(-1)
+                state = nxt
+            terminal[state] = pid
+
+        num_states = len(terminal)
+        fail = [0] * num_states
+        dict_link = [0] * num_states
+
+        queue = deque()
+        for c in range(sigma):
+            nxt = goto[c]
+            if nxt == -1:
+                goto[c] = 0
+            else:
+                queue.append(nxt)
+
+        while queue:
+            state = queue.popleft()
+            base = state * sigma
+            fail_base = fail[state] * sigma
+            for c in range(sigma):
+                nxt = goto[base + c]
+                if nxt == -1:
+                    goto[base + c] = goto[fail_base + c]
+                else:
+                    f = goto[fail_base + c]
+                    fail[nxt] = f
+                    dict_link[nxt] = f if terminal[f] >= 0 else dict_link[f]
+                    queue.append(nxt)
+
+        self._goto = array("l", goto)
+        self._fail = array("l", fail)
+        self._terminal = array("l", terminal)
+        self._dict_link = array("l", dict_link)
+        self._lengths = array("l", (len(p) for p in self.patterns))
+
+    @property
+    def num_states(self) -> int:
+        return len(self._terminal)
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, int]]:
+        """
+        Yield (start index, pattern id) for every match of every non-empty
+        pattern, in order of match end position.
+        """
+        goto = self._goto
+        terminal = self._terminal
+        dict_link = self._dict_link
+        lengths = self._lengths
+        alphabet = self.alphabet
+        sigma = self._sigma
+
+        state = 0
+        for i, ch in enumerate(text):
+            c = alphabet.get(ch)
+            if c is None:
+                state = 0
+                continue
+
+            state = goto[state * sigma + c]
+            out = state if terminal[state] >= 0 else dict_link[state]
+            while out:
+                pid = terminal[out]
+                yield i - lengths[pid] + 1, pid
+                out = dict_link[out]
+
+    def search(self, text: str) -> Dict[str, List[int]]:
+        """
+        Return a mapping pattern -> sorted list of match starting indices.
+        """
+        matches: List[List[int]] = [[] for _ in self.patterns]
+        for start, pid in self.iter_matches(text):
+            matches[pid].append(start)
+
+        if self._has_empty:
+            for pid, pattern in enumerate(self.patterns):
+                if len(pattern) == 0:
+                    matches[pid] = list(range(len(text) + 1))
+
+        return dict(zip(self.patterns, matches))
+
+
+def aho_corasick_search_all(text: str, patterns: Iterable[str]) -> Dict[str, List[int]]:
+    """
+    Return all starting indices of every pattern in text using one scan.
+
+    Args:
+        text: text to search
+        patterns: patterns to find
+
+    Returns:
+        dict mapping each distinct pattern to its match starting indices
+    """
+    return AhoCorasick(patterns).search(text)
@@ -0,0 +1,129 @@
+"""
+Bit-parallel approximate string matching.
+
+Implements:
+- Shift-And / Bitap with k+1 state vectors for Hamming distance
+  (up to k mismatches)
+- Myers' bit-vector algorithm for edit distance (up to k insertions,
+  deletions and substitutions)
+
+Both algorithms keep one bit per pattern position in a Python int, so each
+text character costs O(k) (Bitap) or O(1) (Myers) big-int word operations
+instead of a full DP row.
+
+Complexity:
+- preprocessing: O(m + sigma)
+- search: O(n * k * ceil(m / w)) for Bitap, O(n * ceil(m / w)) for Myers
+"""
+
+from typing import Dict, List, Tuple
+
+
+def _pattern_masks(pattern: str) -> Dict[str, int]:
+    """
+    Bit j of masks[c] is set when pattern[j] == c.
+    """
+    masks: Dict[str, int] = {}
+    for j, ch in enumerate(pattern):
+        masks[ch] = masks.get(ch, 0) | (1 << j)
+    return masks
+
+
+def bitap_hamming_search(text: str, pattern: str, k: int) -> List[Tuple[int, int]]:
+    """
+    Find all windows of text within Hamming distance k of pattern.
+
+    Args:
+        text: text to search
+        pattern: non-empty pattern
+        k: maximum number of mismatches
+
+    Returns:
+        list of (start index, mismatches) with the smallest mismatch count
+        per window, in increasing start order
+    """
+    m = len(pattern)
+    if m == 0:
+        raise ValueError("pattern must be non-empty")
+    if k < 0:
+        raise ValueError("k must be non-negative")
+    if m > len(text):
+        return []
+
+    k = min(k, m)
+    masks = _pattern_masks(pattern)
+    high = 1 << (m - 1)
+    # states[d]: bit j set if pattern[0..j] matches the text ending here
+    # with at most d mismatches
+    states = [0] * (k + 1)
+    matches = []
+
+    for i, ch in enumerate(text):
+        eq = masks.get(ch, 0)
+        previous = states[0]
+        states[0] = ((previous << 1) | 1) & eq
+        for d in range(1, k + 1):
+            current = states[d]
+            states[d] = (((current << 1) | 1) & eq) | ((previous << 1) | 1)
+            previous = current
+
+        if i >= m - 1:
+            for d in range(k + 1):
+                if states[d] & high:
+                    matches.append((i - m + 1, d))
+                    break
+
+    return matches
+
+
+def myers_edit_search(text: str, pattern: str, k: int) -> List[Tuple[int, int]]:
+    """
+    Find all text positions where an occurrence of pattern with edit
+    distance at most k ends (Myers, 1999).
+
+    Args:
+        text: text to search
+        pattern: non-empty pattern
+        k: maximum edit distance
+
+    Returns:
+        list of (end index, distance), end index inclusive, where distance
+        is the smallest edit distance of pattern to any substring ending there
+    """
+    m = len(pattern)
+    if m == 0:
+        raise ValueError("pattern must be non-empty")
+    if k < 0:
+        raise ValueError("k must be non-negative")
+
+    peq = _pattern_masks(pattern)
+    mask = (1 << m) - 1
+    high = 1 << (m - 1)
+
+    pv = mask
+    mv = 0
+    score = m
+    matches = []
+
+    for i, ch in enumerate(text):
+        eq = peq.get(ch, 0)
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+        ph = mv | (~(xh | pv) & mask)
+        mh = pv & xh
+
+        if ph & high:
+            score += 1
+        elif mh & high:
+            score -= 1
+
+        # Free start in the text: no carry into the first row
+        ph = (ph << 1) & mask
+        mh = (mh << 1) & mask
+        pv = mh | (~(xv | ph) & mask)
+        mv = ph & xv
+
+        if score <= k:
+            matches.append((i, score))
+
+    return matches
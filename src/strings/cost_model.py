@@ -0,0 +1,207 @@
+"""
+Cost model for choosing a string search method.
+
+Each method is described by per-character coefficients (seconds):
+- scans (kmp, rk): cost per text character
+- index builds (sa, tree, fm): cost per text character
+- index queries: cost per pattern character / binary-search step
+
+The alphabet size sigma scales the estimates where it changes the work:
+- kmp: a partial match (probability ~1/sigma per character) is later
+  undone by a prefix-function fallback, so a scan costs ~(1 + 1/sigma)
+  comparisons per character; rk hashes every window regardless
+- fm build: one occurrence bitmap per symbol, i.e. sigma / 64 extra words
+  written per 64 BWT rows on top of the per-row work
+- fm query: a rank is a checkpoint plus a fixed number of popcounts, so
+  the per-character cost does not grow with sigma
+
+Coefficients come from a small built-in micro-benchmark run on a sample
+of the text to be searched, normalized by the sample's own alphabet size
+so they can be applied to texts with a different one.
+
+Choosing between scanning and building an index is a ski-rental problem:
+scan until the total cost of the scans so far would pay for building the
+suffix array, then build it. This is never worse than twice the cost of
+the best fixed choice in hindsight.
+"""
+
+import math
+import random
+import time
+from typing import Callable, Dict, Iterable, Optional
+
+from src.strings.fm_index import FMIndex
+from src.strings.kmp import kmp_search_all
+from src.strings.rabin_karp import rabin_karp_search_all
+from src.strings.suffix_array import (
+    build_suffix_array,
+    build_lcp_array,
+    build_lcp_lr,
+    suffix_array_range,
+)
+from src.strings.suffix_tree import CompressedSuffixTree
+
+CALIBRATION_SAMPLE_SIZE = 4096
+_MIN_CALIBRATION_SIZE = 256
+_SCAN_METHODS = ("kmp", "rk")
+_INDEX_METHODS = ("sa", "tree", "fm")
+
+# BWT rows per occurrence-bitmap word in the FM-index
+_FM_WORD_BITS = 64
+
+# Typical CPython coefficients, used when the text is too short to sample
+DEFAULT_COEFFICIENTS: Dict[str, float] = {
+    "kmp_scan": 1.5e-7,
+    "rk_scan": 3.5e-7,
+    "sa_build": 2.0e-6,
+    "tree_build": 2.0e-6,
+    "fm_build": 3.0e-7,
+    "sa_query": 5.0e-7,
+    "tree_query": 4.0e-7,
+    "fm_query": 8.0e-7,
+}
+
+
+def _kmp_factor(sigma: Optional[int]) -> float:
+    return 1.0 if sigma is None else 1.0 + 1.0 / max(1, sigma)
+
+
+def _fm_build_factor(sigma: Optional[int]) -> float:
+    return 1.0 if sigma is None else 1.0 + sigma / _FM_WORD_BITS
+
+
+def _best_time(fn: Callable[[], object], repeats: int) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+class CostModel:
+    def __init__(self, coefficients: Optional[Dict[str, float]] = None):
+        self.coefficients = dict(DEFAULT_COEFFICIENTS)
+        if coefficients:
+            self.coefficients.update(coefficients)
+
+    @classmethod
+    def calibrate(
+        cls,
+        text: str,
+        sample_size: int = CALIBRATION_SAMPLE_SIZE,
+        repeats: int = 3,
+    ) -> "CostModel":
+        """
+        Measure every method on a sample of text.
+
+        Args:
+            text: text the model will be used for (only a sample is timed)
+            sample_size: number of characters to time on
+            repeats: best-of repeats for the scans and queries
+
+        Returns:
+            calibrated CostModel (defaults if text is too short to sample)
+        """
+        if len(text) < _MIN_CALIBRATION_SIZE:
+            return cls()
+
+        # A random window avoids timing only a header or preamble
+        offset = random.Random(len(text)).randrange(max(1, len(text) - sample_size + 1))
+        sample = text[offset:offset + sample_size]
+        n = len(sample)
+        sigma = len(set(sample))
+        pattern = sample[n // 2:n // 2 + 8]
+        m = len(pattern)
+
+        coefficients = {
+            "kmp_scan": _best_time(lambda: kmp_search_all(sample, pattern), repeats)
+            / (n * _kmp_factor(sigma)),
+            "rk_scan": _best_time(lambda: rabin_karp_search_all(sample, pattern), repeats) / n,
+        }
+
+        start = time.perf_counter()
+        sa = build_suffix_array(sample)
+        lcp_lr = build_lcp_lr(build_lcp_array(sample, sa))
+        coefficients["sa_build"] = (time.perf_counter() - start) / n
+
+        start = time.perf_counter()
+        tree = CompressedSuffixTree(sample)
+        coefficients["tree_build"] = (time.perf_counter() - start) / n
+
+        coefficients["sa_query"] = _best_time(
+            lambda: suffix_array_range(sample, pattern, sa, lcp_lr), repeats
+        ) / (m + math.log2(n))
+        coefficients["tree_query"] = _best_time(lambda: tree.count(pattern), repeats) / m
+
+        start = time.perf_counter()
+        fm = FMIndex(sample, suffix_array=sa)
+        coefficients["fm_build"] = (time.perf_counter() - start) / (n * _fm_build_factor(sigma))
+        coefficients["fm_query"] = _best_time(lambda: fm.count(pattern), repeats) / m
+
+        return cls(coefficients)
+
+    def scan_cost(self, method: str, n: int, m: int, sigma: Optional[int] = None) -> float:
+        """
+        Estimated seconds for one scan of an n-character text over an
+        alphabet of sigma symbols (None: no alphabet adjustment).
+        """
+        cost = self.coefficients[f"{method}_scan"] * (n + m)
+        if method == "kmp":
+            cost *= _kmp_factor(sigma)
+        return cost
+
+    def build_cost(self, method: str, n: int, sigma: Optional[int] = None) -> float:
+        """
+        Estimated seconds to build the index for method.
+        """
+        cost = self.coefficients[f"{method}_build"] * n
+        if method == "fm":
+            cost = cost * _fm_build_factor(sigma) + self.coefficients["sa_build"] * n
+        return cost
+
+    def query_cost(self, method: str, n: int, m: int, sigma: Optional[int] = None) -> float:
+        """
+        Estimated seconds for one query against a built index. sigma is
+        accepted for symmetry; no index's query cost depends on it.
+        """
+        if method == "sa":
+            return self.coefficients["sa_query"] * (m + math.log2(max(2, n)))
+        return self.coefficients[f"{method}_query"] * m
+
+    def choose(
+        self,
+        n: int,
+        m: int,
+        sigma: int,
+        queries_seen: int,
+        built: Iterable[str] = (),
+    ) -> str:
+        """
+        Pick the cheapest method for the next query.
+
+        Args:
+            n: text length
+            m: pattern length
+            sigma: alphabet size of the text
+            queries_seen: queries already answered on this text
+            built: index methods whose index already exists
+
+        Returns:
+            one of "kmp", "rk", "sa", "tree", "fm"
+        """
+        built = [method for method in built if method in _INDEX_METHODS]
+
+        scan = min(_SCAN_METHODS, key=lambda method: self.scan_cost(method, n, m, sigma))
+        scan_cost = self.scan_cost(scan, n, m, sigma)
+
+        if built:
+            index = min(built, key=lambda method: self.query_cost(method, n, m, sigma))
+            if self.query_cost(index, n, m, sigma) <= scan_cost:
+                return index
+            return scan
+
+        # Ski rental: build once the scans would have paid for the index
+        if (queries_seen + 1) * scan_cost >= self.build_cost("sa", n, sigma):
+            return "sa"
+        return scan
@@ -4,13 +4,28 @@ DNA sequence search application.
 Uses the unified string search engine for exact pattern matching over DNA strings.
 Supports:
 - validation of DNA alphabet
-- exact gene / motif search
-- batch query search
+- exact gene / motif search (including an FM-index backend, method="fm")
+- batch query search (single Aho-Corasick scan by default)
+- approximate search with a mismatch or edit-distance budget
+
+The genome is held 2-bit packed (PackedDNA). Scans (kmp, rk, ac and
+approximate search) decode it one chunk at a time and never hold the whole
+decoded genome. Index methods (sa, tree, fm) need the full text to build
+and query their index, so their first query decodes the genome into a
+StringSearchEngine that keeps the str next to the index; for those methods
+packing only reduces the storage of the genome itself.
 """
 
-from typing import Dict, List, Any
+import time
+from typing import Callable, Dict, Iterator, List, Any, Optional, Tuple, Union
 
-from src.strings.search_engine import StringSearchEngine
+from src.strings.aho_corasick import AhoCorasick
+from src.strings.approximate import bitap_hamming_search, myers_edit_search
+from src.strings.kmp import kmp_search_all
+from src.strings.packed_dna import PackedDNA
+from src.strings.rabin_karp import rabin_karp_search_stats
+from src.strings.search_engine import METHOD_RECOMMENDATIONS, StringSearchEngine
+from src.strings.streaming import DEFAULT_CHUNK_SIZE
 
 
 VALID_DNA_CHARS = {"A", "C", "G", "T"}
@@ -30,11 +45,69 @@ class DNASearchEngine:
     DNA-specific wrapper around StringSearchEngine.
     """
 
-    def __init__(self, genome: str):
-        genome = genome.upper()
-        validate_dna_sequence(genome)
-        self.genome = genome
-        self.engine = StringSearchEngine(genome)
+    def __init__(self, genome: Union[str, PackedDNA], chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """
+        Args:
+            genome: A/C/G/T sequence (any case) or an existing PackedDNA
+            chunk_size: bases decoded at a time by the scanning methods
+        """
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+        self.packed = genome if isinstance(genome, PackedDNA) else PackedDNA(genome)
+        self.chunk_size = chunk_size
+        self._engine: Optional[StringSearchEngine] = None
+
+    @property
+    def genome(self) -> str:
+        """
+        The genome as an uppercase str (decoded from the packed form on
+        every access).
+        """
+        return str(self.packed)
+
+    @property
+    def engine(self) -> StringSearchEngine:
+        if self._engine is None:
+            self._engine = StringSearchEngine(str(self.packed))
+        return self._engine
+
+    def _windows(self, before: int, after: int) -> Iterator[Tuple[int, int, int, str]]:
+        """
+        Yield (lo, hi, offset, text) for consecutive chunks [lo, hi) of the
+        genome; text is decoded from offset = lo - before up to hi + after,
+        so matches owned by the chunk are fully contained in it.
+        """
+        n = len(self.packed)
+        for lo in range(0, max(n, 1), self.chunk_size):
+            hi = min(lo + self.chunk_size, n)
+            offset = max(0, lo - before)
+            yield lo, hi, offset, self.packed.decode(offset, min(n, hi + after))
+
+    def _owns(self, lo: int, hi: int, position: int) -> bool:
+        # The last chunk also owns position n (empty-pattern matches)
+        return lo <= position < hi or position == hi == len(self.packed)
+
+    def _scan(self, search: Callable[[str], List[int]], m: int) -> List[int]:
+        """
+        Start positions of a scanner's matches over the chunked genome.
+        """
+        matches = []
+        for lo, hi, offset, text in self._windows(0, max(m - 1, 0)):
+            matches.extend(
+                offset + i for i in search(text) if self._owns(lo, hi, offset + i)
+            )
+        return matches
+
+    def _result(self, method, pattern, matches, search_time, preprocessing_time=0.0) -> Dict[str, Any]:
+        return {
+            "method": method,
+            "pattern": pattern,
+            "matches": matches,
+            "match_count": len(matches),
+            "search_time_sec": search_time,
+            "preprocessing_time_sec": preprocessing_time,
+            "recommendation": METHOD_RECOMMENDATIONS[method],
+        }
 
     def find_gene(self, pattern: str, method: str = "sa") -> Dict[str, Any]:
         """
@@ -42,20 +115,128 @@ class DNASearchEngine:
 
         Args:
             pattern: DNA substring
-            method: kmp, rk, sa, or tree
+            method: kmp, rk, ac (chunked scans over the packed genome), or
+                sa, tree, fm, auto (through the decoded engine)
 
         Returns:
             search result dictionary
         """
         pattern = pattern.upper()
         validate_dna_sequence(pattern)
+        method = method.lower()
+
+        if method == "kmp":
+            start = time.perf_counter()
+            matches = self._scan(lambda text: kmp_search_all(text, pattern), len(pattern))
+            return self._result(method, pattern, matches, time.perf_counter() - start)
+
+        if method == "rk":
+            collisions = 0
+
+            def search(text):
+                nonlocal collisions
+                stats = rabin_karp_search_stats(text, pattern)
+                collisions += stats["collisions"]
+                return stats["matches"]
+
+            start = time.perf_counter()
+            matches = self._scan(search, len(pattern))
+            result = self._result(method, pattern, matches, time.perf_counter() - start)
+            result["hash_collisions"] = collisions
+            return result
+
+        if method == "ac":
+            return self.find_many([pattern])[pattern]
+
         return self.engine.find(pattern, method=method)
 
-    def find_many(self, patterns: List[str], method: str = "sa") -> Dict[str, Dict[str, Any]]:
+    def find_many(self, patterns: List[str], method: str = "ac") -> Dict[str, Dict[str, Any]]:
         """
         Search for multiple DNA patterns.
+
+        With method="ac" all patterns are located in one chunked pass over
+        the packed genome. Results are keyed by the patterns as given.
         """
-        results = {}
+        normalized = {}
         for pattern in patterns:
-            results[pattern] = self.find_gene(pattern, method=method)
-        return results
\ No newline at end of file
+            upper = pattern.upper()
+            validate_dna_sequence(upper)
+            normalized[pattern] = upper
+
+        if method.lower() != "ac":
+            return {
+                pattern: self.find_gene(upper, method=method)
+                for pattern, upper in normalized.items()
+            }
+
+        queries = list(dict.fromkeys(normalized.values()))
+        if not queries:
+            return {}
+        start = time.perf_counter()
+        automaton = AhoCorasick(queries)
+        preprocessing_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        found: Dict[str, List[int]] = {query: [] for query in queries}
+        longest = max(len(query) for query in queries)
+        for lo, hi, offset, text in self._windows(0, longest - 1):
+            for query, starts in automaton.search(text).items():
+                found[query].extend(
+                    offset + i for i in starts if self._owns(lo, hi, offset + i)
+                )
+        search_time = time.perf_counter() - start
+
+        return {
+            pattern: self._result("ac", upper, found[upper], search_time, preprocessing_time)
+            for pattern, upper in normalized.items()
+        }
+
+    def find_approx(self, pattern: str, k: int, metric: str = "hamming") -> Dict[str, Any]:
+        """
+        Find occurrences of a DNA pattern with at most k errors.
+
+        Args:
+            pattern: DNA substring
+            k: error budget
+            metric: hamming (bit-parallel Bitap) or edit (Myers' bit-vector)
+
+        Returns:
+            search result dictionary
+        """
+        pattern = pattern.upper()
+        validate_dna_sequence(pattern)
+        metric = metric.lower()
+        m = len(pattern)
+
+        # Hamming hits are keyed by start, edit hits by (inclusive) end; an
+        # edit alignment with <= k errors spans at most m + k bases
+        if metric == "hamming":
+            method, position, search = "bitap", "start", bitap_hamming_search
+            before, after = 0, max(m - 1, 0)
+        elif metric == "edit":
+            method, position, search = "myers", "end", myers_edit_search
+            before, after = m + k - 1, 0
+        else:
+            raise ValueError("metric must be one of: 'hamming', 'edit'")
+
+        start = time.perf_counter()
+        hits = []
+        for lo, hi, offset, text in self._windows(before, after):
+            hits.extend(
+                (offset + index, distance)
+                for index, distance in search(text, pattern, k)
+                if lo <= offset + index < hi
+            )
+        search_time = time.perf_counter() - start
+
+        return {
+            "method": method,
+            "pattern": pattern,
+            "k": k,
+            "position": position,
+            "matches": [index for index, _ in hits],
+            "distances": [distance for _, distance in hits],
+            "match_count": len(hits),
+            "search_time_sec": search_time,
+            "preprocessing_time_sec": 0.0,
+        }
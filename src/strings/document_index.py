@@ -0,0 +1,188 @@
+"""
+Generalized suffix array over a collection of documents.
+
+Implements:
+- one SA-IS suffix array over all documents joined by a separator
+- document array: the document of every suffix array row
+- document listing (Muthukrishnan, 2002): the distinct documents in an SA
+  interval are found with range-minimum queries over the "previous row of
+  the same document" array, in O(ndoc log n) rather than O(occ)
+- per-document occurrence counts by binary search over each document's
+  sorted SA rows, giving top-k documents in O(ndoc log n)
+
+Documents must not contain the separator character (NUL), so no match
+can cross from one document into the next.
+"""
+
+import heapq
+from bisect import bisect_left
+from typing import Dict, Hashable, List, Mapping, Sequence, Tuple, Union
+
+from src.strings.suffix_array import build_suffix_array, suffix_array_range
+
+_SEPARATOR = "\x00"
+
+
+class DocumentIndex:
+    def __init__(self, documents: Union[Sequence[str], Mapping[Hashable, str]]):
+        """
+        Args:
+            documents: list of texts (ids are list positions) or a mapping
+                from document id to text
+        """
+        if isinstance(documents, Mapping):
+            self.doc_ids: List[Hashable] = list(documents.keys())
+            texts = list(documents.values())
+        else:
+            texts = list(documents)
+            self.doc_ids = list(range(len(texts)))
+
+        self.doc_starts: List[int] = []
+        offset = 0
+        for i, text in enumerate(texts):
+            if _SEPARATOR in text:
+                raise ValueError(f"document {self.doc_ids[i]!r} contains the separator character")
+            self.doc_starts.append(offset)
+            offset += len(text) + 1
+
+        self.text = "".join(text + _SEPARATOR for text in texts)
+        self.suffix_array = build_suffix_array(self.text)
+        self._build_document_arrays()
+
+    def __len__(self) -> int:
+        return len(self.doc_ids)
+
+    def _build_document_arrays(self) -> None:
+        n = len(self.text)
+        position_doc = [0] * n
+        for doc, start in enumerate(self.doc_starts):
+            end = self.doc_starts[doc + 1] if doc + 1 < len(self.doc_starts) else n
+            position_doc[start:end] = [doc] * (end - start)
+
+        # doc_array[row]: document of the suffix at that SA row
+        # previous[row]: the last earlier row of the same document, or -1
+        self.doc_array = [position_doc[position] for position in self.suffix_array]
+        self._doc_rows: List[List[int]] = [[] for _ in self.doc_ids]
+        previous = [-1] * n
+        for row, doc in enumerate(self.doc_array):
+            rows = self._doc_rows[doc]
+            if rows:
+                previous[row] = rows[-1]
+            rows.append(row)
+        self._previous = previous
+
+        # Bottom-up tree of argmin(previous) positions for range-minimum queries
+        size = 1
+        while size < max(1, n):
+            size *= 2
+        tree = [-1] * (2 * size)
+        tree[size:size + n] = range(n)
+        for node in range(size - 1, 0, -1):
+            left, right = tree[2 * node], tree[2 * node + 1]
+            if right == -1 or (left != -1 and previous[left] <= previous[right]):
+                tree[node] = left
+            else:
+                tree[node] = right
+        self._rmq_size = size
+        self._rmq_tree = tree
+
+    def _range_argmin(self, lo: int, hi: int) -> int:
+        previous = self._previous
+        tree = self._rmq_tree
+        best = -1
+        lo += self._rmq_size
+        hi += self._rmq_size
+        while lo < hi:
+            if lo & 1:
+                candidate = tree[lo]
+                if best == -1 or previous[candidate] < previous[best]:
+                    best = candidate
+                lo += 1
+            if hi & 1:
+                hi -= 1
+                candidate = tree[hi]
+                if best == -1 or previous[candidate] < previous[best]:
+                    best = candidate
+            lo >>= 1
+            hi >>= 1
+        return best
+
+    def _interval(self, pattern: str) -> Tuple[int, int]:
+        if pattern == "":
+            raise ValueError("pattern must be non-empty")
+        if _SEPARATOR in pattern:
+            return 0, 0
+        return suffix_array_range(self.text, pattern, self.suffix_array)
+
+    def _list_documents(self, lo: int, hi: int) -> List[int]:
+        """
+        Internal ids of the distinct documents in SA rows [lo, hi).
+
+        A row is the first of its document in the interval exactly when its
+        previous same-document row lies before lo.
+        """
+        docs = []
+        stack = [(lo, hi)]
+        while stack:
+            left, right = stack.pop()
+            if left >= right:
+                continue
+            row = self._range_argmin(left, right)
+            if self._previous[row] >= lo:
+                continue
+            docs.append(self.doc_array[row])
+            stack.append((row + 1, right))
+            stack.append((left, row))
+        docs.sort()
+        return docs
+
+    def count(self, pattern: str) -> int:
+        """
+        Return the total number of occurrences of pattern in all documents.
+        """
+        lo, hi = self._interval(pattern)
+        return hi - lo
+
+    def search(self, pattern: str) -> List[Tuple[Hashable, int]]:
+        """
+        Return every occurrence as (doc_id, offset within the document),
+        in collection order.
+        """
+        lo, hi = self._interval(pattern)
+        hits = []
+        for row in range(lo, hi):
+            doc = self.doc_array[row]
+            hits.append((doc, self.suffix_array[row] - self.doc_starts[doc]))
+        hits.sort()
+        return [(self.doc_ids[doc], offset) for doc, offset in hits]
+
+    def documents(self, pattern: str) -> List[Hashable]:
+        """
+        Return the ids of documents containing pattern, in collection order.
+        """
+        lo, hi = self._interval(pattern)
+        return [self.doc_ids[doc] for doc in self._list_documents(lo, hi)]
+
+    def document_counts(self, pattern: str) -> Dict[Hashable, int]:
+        """
+        Return {doc_id: occurrences} for every document containing pattern.
+        """
+        lo, hi = self._interval(pattern)
+        counts = {}
+        for doc in self._list_documents(lo, hi):
+            rows = self._doc_rows[doc]
+            counts[self.doc_ids[doc]] = bisect_left(rows, hi) - bisect_left(rows, lo)
+        return counts
+
+    def top_k(self, pattern: str, k: int = 10) -> List[Tuple[Hashable, int]]:
+        """
+        Return up to k (doc_id, occurrences) pairs with the most occurrences,
+        ties broken by collection order.
+        """
+        lo, hi = self._interval(pattern)
+        scored = []
+        for doc in self._list_documents(lo, hi):
+            rows = self._doc_rows[doc]
+            scored.append((bisect_left(rows, hi) - bisect_left(rows, lo), -doc))
+        best = heapq.nlargest(k, scored)
+        return [(self.doc_ids[-neg_doc], count) for count, neg_doc in best]
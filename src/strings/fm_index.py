@@ -0,0 +1,209 @@
+"""
+FM-index over the Burrows-Wheeler transform.
+
+Implements:
+- BWT derived from the SA-IS suffix array of text + sentinel
+- occurrence bitmaps with sampled counts for O(1) rank queries
+- backward search for counting in O(m) rank steps
+- locate through text-position sampled suffix array entries
+
+Memory:
+- BWT: one byte per symbol (alphabets up to 255 characters)
+- occurrence bitmaps: one bit per BWT row for every alphabet symbol,
+  packed 64 per word, so a rank is a checkpoint plus a few popcounts
+- occurrence checkpoints: sigma integers every ``occ_sample_rate`` symbols
+  (rounded down to whole 64-row words)
+- SA samples: one integer every ``sa_sample_rate`` text positions, found
+  through a marked-row bitmap ranked the same way
+
+The full suffix array is only needed during construction.
+"""
+
+from array import array
+from typing import Iterator, List, Optional, Sequence
+
+from src.strings.suffix_array import _encode_text, build_suffix_array_ints
+
+_SENTINEL = 0
+_WORD_BITS = 64
+
+
+class _RankedBits:
+    """
+    Bitmap packed into array('Q') words with a count checkpoint every
+    block_words words; rank(row) touches at most block_words words and
+    never copies.
+    """
+
+    __slots__ = ("words", "checkpoints", "block_words")
+
+    def __init__(self, words: array, block_words: int, int_code: str):
+        self.words = words
+        self.block_words = block_words
+        self.checkpoints = array(int_code)
+        total = 0
+        for w, word in enumerate(words):
+            if w % block_words == 0:
+                self.checkpoints.append(total)
+            total += word.bit_count()
+
+    def __getitem__(self, row: int) -> int:
+        return (self.words[row >> 6] >> (row & 63)) & 1
+
+    def rank(self, row: int) -> int:
+        """
+        Number of set bits in rows [0, row).
+        """
+        w = row >> 6
+        block = w // self.block_words
+        words = self.words
+        count = self.checkpoints[block]
+        for i in range(block * self.block_words, w):
+            count += words[i].bit_count()
+        return count + (words[w] & ((1 << (row & 63)) - 1)).bit_count()
+
+
+class FMIndex:
+    def __init__(
+        self,
+        text: str,
+        sa_sample_rate: int = 32,
+        occ_sample_rate: int = 128,
+        suffix_array: Optional[Sequence[int]] = None,
+    ):
+        """
+        Args:
+            text: text to index
+            sa_sample_rate: keep SA entries for text positions divisible by this
+            occ_sample_rate: distance between occurrence-table checkpoints,
+                rounded down to a multiple of 64 rows
+            suffix_array: optional precomputed suffix array of text
+        """
+        if sa_sample_rate <= 0 or occ_sample_rate <= 0:
+            raise ValueError("sample rates must be positive")
+
+        self.n = len(text)
+        self.sa_sample_rate = sa_sample_rate
+        self.occ_sample_rate = occ_sample_rate
+
+        alphabet = sorted(set(text))
+        # Code 0 is reserved for the sentinel
+        self._codes = {ch: i + 1 for i, ch in enumerate(alphabet)}
+        self._sigma = len(alphabet) + 1
+
+        values, upper = _encode_text(text)
+        values = [v + 1 for v in values]
+        values.append(_SENTINEL)
+
+        if suffix_array is None:
+            sa = build_suffix_array_ints(values, upper + 1)
+        else:
+            # The sentinel suffix sorts first
+            sa = [self.n]
+            sa.extend(suffix_array)
+
+        self._build(values, sa)
+
+    def _build(self, values: List[int], sa: Sequence[int]) -> None:
+        size = self.n + 1
+        sigma = self._sigma
+        rate = self.occ_sample_rate
+        sa_rate = self.sa_sample_rate
+        int_code = "I" if size < 2 ** 32 else "Q"
+
+        bwt_codes = [values[i - 1] if i > 0 else _SENTINEL for i in sa]
+        self._bwt = bytes(bwt_codes) if sigma <= 256 else array(int_code, bwt_codes)
+
+        counts = [0] * sigma
+        for code in values:
+            counts[code] += 1
+        self._c = [0] * (sigma + 1)
+        for code in range(sigma):
+            self._c[code + 1] = self._c[code] + counts[code]
+
+        # One spare word so that rank(size) stays in range
+        word_count = (size >> 6) + 1
+        block_words = max(1, rate // _WORD_BITS)
+        occ_words = [array("Q", bytes(8 * word_count)) for _ in range(sigma)]
+        for row, code in enumerate(bwt_codes):
+            occ_words[code][row >> 6] |= 1 << (row & 63)
+        self._occ = [_RankedBits(words, block_words, int_code) for words in occ_words]
+
+        marks = array("Q", bytes(8 * word_count))
+        samples = array(int_code)
+        for row, pos in enumerate(sa):
+            if pos % sa_rate == 0:
+                marks[row >> 6] |= 1 << (row & 63)
+                samples.append(pos)
+        self._marks = _RankedBits(marks, block_words, int_code)
+        self._samples = samples
+
+    def _rank(self, code: int, row: int) -> int:
+        """
+        Number of occurrences of code in bwt[0:row].
+        """
+        return self._occ[code].rank(row)
+
+    def _lf(self, row: int) -> int:
+        code = self._bwt[row]
+        return self._c[code] + self._rank(code, row)
+
+    def _interval(self, pattern: str):
+        lo = 0
+        hi = self.n + 1
+        for ch in reversed(pattern):
+            code = self._codes.get(ch)
+            if code is None:
+                return 0, 0
+            lo = self._c[code] + self._rank(code, lo)
+            hi = self._c[code] + self._rank(code, hi)
+            if lo >= hi:
+                return 0, 0
+        return lo, hi
+
+    def count(self, pattern: str) -> int:
+        """
+        Return the number of occurrences of pattern.
+        """
+        if len(pattern) == 0:
+            return self.n + 1
+        lo, hi = self._interval(pattern)
+        return hi - lo
+
+    def _sa_at(self, row: int) -> int:
+        steps = 0
+        while not self._marks[row]:
+            row = self._lf(row)
+            steps += 1
+
+        return self._samples[self._marks.rank(row)] + steps
+
+    def locate(self, pattern: str) -> List[int]:
+        """
+        Return sorted starting indices of pattern.
+        """
+        if len(pattern) == 0:
+            return list(range(self.n + 1))
+        lo, hi = self._interval(pattern)
+        return sorted(self._sa_at(row) for row in range(lo, hi))
+
+    def iter_locate(self, pattern: str) -> Iterator[int]:
+        """
+        Lazily yield starting indices of pattern, in suffix-array order.
+        """
+        if len(pattern) == 0:
+            yield from range(self.n + 1)
+            return
+        lo, hi = self._interval(pattern)
+        for row in range(lo, hi):
+            yield self._sa_at(row)
+
+    def bwt(self) -> str:
+        """
+        Return the Burrows-Wheeler transform as a string, with "$" for the sentinel.
+        """
+        symbols = ["$"] + [
+            chr(symbol) if isinstance(symbol, int) else symbol
+            for symbol in sorted(self._codes, key=self._codes.get)
+        ]
+        return "".join(symbols[code] for code in self._bwt)
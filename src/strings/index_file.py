@@ -0,0 +1,173 @@
+"""
+Persistent suffix-array / LCP index files.
+
+File layout (all integers in native byte order, recorded in the header):
+- header: magic, byte-order flag, integer width, text kind, text length
+  (code units), encoded text length (bytes)
+- the text, zero-padded to an 8-byte boundary: UTF-8 encoded for a str
+  text, or the raw bytes of a binary (bytes / memoryview / mmap) text
+- suffix array as fixed-width unsigned integers
+- LCP array as fixed-width unsigned integers
+- LCP-LR arrays (llcp, then rlcp) as fixed-width unsigned integers
+
+Loading maps the file with mmap and exposes SA / LCP / LCP-LR (and the
+text of a binary index) as memoryviews, so no per-element Python objects are created, nothing is
+rebuilt on load, and several processes reading the same file share one
+copy in the page cache.
+"""
+
+import mmap
+import struct
+import sys
+from array import array
+from typing import Optional, Sequence, Tuple, Union
+
+from src.strings.streaming import as_searchable
+from src.strings.suffix_array import build_lcp_lr
+
+MAGIC = b"SAIDX\x00\x00\x01"
+_HEADER = struct.Struct("<8sBBB5xQQ")
+# SA, LCP, llcp, rlcp
+_ARRAYS = 4
+_BYTE_ORDER_FLAGS = {"little": 0, "big": 1}
+_TEXT_STR = 0
+_TEXT_BINARY = 1
+
+
+def _typecode_for(n: int) -> str:
+    """
+    Pick the narrowest unsigned array typecode able to store values up to n.
+    """
+    if n < 2 ** 32 and array("I").itemsize == 4:
+        return "I"
+    return "Q"
+
+
+def _padding(length: int) -> int:
+    return (-length) % 8
+
+
+def save_suffix_index(
+    path: str,
+    text: str,
+    suffix_array: Sequence[int],
+    lcp_array: Sequence[int],
+    lcp_lr: Optional[Tuple[Sequence[int], Sequence[int]]] = None,
+) -> None:
+    """
+    Write text, suffix array, LCP array and LCP-LR arrays to a binary
+    index file.
+
+    Args:
+        path: destination file path
+        text: indexed text; str is stored UTF-8 encoded, bytes /
+            bytearray / memoryview / mmap as is
+        suffix_array: suffix array of text
+        lcp_array: LCP array of text
+        lcp_lr: (llcp, rlcp) arrays from build_lcp_lr (built if omitted)
+    """
+    text = as_searchable(text)
+    n = len(text)
+    if len(suffix_array) != n or len(lcp_array) != n:
+        raise ValueError("suffix_array and lcp_array must have the same length as text")
+    if lcp_lr is None:
+        lcp_lr = build_lcp_lr(lcp_array)
+
+    typecode = _typecode_for(n)
+    if isinstance(text, str):
+        kind = _TEXT_STR
+        encoded = text.encode("utf-8")
+    else:
+        kind = _TEXT_BINARY
+        encoded = text
+
+    with open(path, "wb") as f:
+        f.write(
+            _HEADER.pack(
+                MAGIC,
+                _BYTE_ORDER_FLAGS[sys.byteorder],
+                array(typecode).itemsize,
+                kind,
+                n,
+                len(encoded),
+            )
+        )
+        f.write(encoded)
+        f.write(b"\x00" * _padding(len(encoded)))
+        f.write(array(typecode, suffix_array).tobytes())
+        f.write(array(typecode, lcp_array).tobytes())
+        for values in lcp_lr:
+            f.write(array(typecode, values).tobytes())
+
+
+def _check_header(mm: mmap.mmap, path: str) -> Tuple[str, int, int, int]:
+    """
+    Validate the header and file size.
+
+    Returns:
+        (array typecode, text kind, text length, encoded text bytes)
+    """
+    if len(mm) < _HEADER.size:
+        raise ValueError(f"{path} is not a suffix index file")
+
+    magic, order_flag, width, kind, n, text_bytes = _HEADER.unpack_from(mm, 0)
+    if magic != MAGIC:
+        raise ValueError(f"{path} is not a suffix index file")
+    if order_flag != _BYTE_ORDER_FLAGS[sys.byteorder]:
+        raise ValueError("index file was written on a machine with a different byte order")
+
+    typecode = "I" if width == 4 else "Q"
+    if array(typecode).itemsize != width:
+        raise ValueError(f"unsupported integer width in index file: {width}")
+    if kind not in (_TEXT_STR, _TEXT_BINARY) or (kind == _TEXT_BINARY and n != text_bytes):
+        raise ValueError(f"{path} is not a suffix index file")
+
+    if len(mm) < _HEADER.size + text_bytes + _padding(text_bytes) + _ARRAYS * n * width:
+        raise ValueError(f"{path} is truncated")
+
+    return typecode, kind, n, text_bytes
+
+
+def load_suffix_index(
+    path: str,
+) -> Tuple[
+    Union[str, memoryview], memoryview, memoryview, Tuple[memoryview, memoryview], mmap.mmap
+]:
+    """
+    Memory-map an index file written by save_suffix_index.
+
+    Args:
+        path: index file path
+
+    Returns:
+        (text, suffix array view, LCP array view, (llcp, rlcp) views,
+        underlying mmap); text is a str, or a byte view of the mapping
+        for a binary index
+
+    The returned memoryviews index like read-only integer lists and stay
+    valid for as long as they are referenced.
+    """
+    with open(path, "rb") as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    try:
+        typecode, kind, n, text_bytes = _check_header(mm, path)
+        if kind == _TEXT_STR:
+            text = mm[_HEADER.size:_HEADER.size + text_bytes].decode("utf-8")
+    except ValueError:
+        # No views of the mapping exist yet, so it can still be closed
+        mm.close()
+        raise
+
+    view = memoryview(mm)
+    if kind == _TEXT_BINARY:
+        text = view[_HEADER.size:_HEADER.size + text_bytes]
+    width = array(typecode).itemsize
+    array_bytes = n * width
+    offset = _HEADER.size + text_bytes + _padding(text_bytes)
+    views = []
+    for _ in range(_ARRAYS):
+        views.append(view[offset:offset + array_bytes].cast(typecode))
+        offset += array_bytes
+
+    return text, views[0], views[1], (views[2], views[3]), mm
@@ -5,26 +5,38 @@ Implements:
 - LPS / prefix-function computation
 - first-match search
 - all-match search
+- streaming all-match search over files, mmaps and chunk iterators
+- str texts, or bytes / bytearray / memoryview / mmap texts searched in
+  place as byte code units
 
 Complexity:
 - preprocessing: O(m)
 - search: O(n + m)
 """
 
-from typing import List
+from typing import Iterator, List
 
+from src.strings.streaming import (
+    DEFAULT_CHUNK_SIZE,
+    as_searchable,
+    coerce_pattern,
+    iter_chunks,
+    iter_codes,
+    to_codes,
+)
 
-def compute_lps(pattern: str) -> List[int]:
+
+def compute_lps(pattern) -> List[int]:
     """
     Compute the LPS (longest proper prefix which is also suffix) array.
 
     Args:
-        pattern: pattern string
+        pattern: pattern string (or any sequence of comparable symbols)
 
     Returns:
         list of LPS values
     """
-    if pattern == "":
+    if len(pattern) == 0:
         return []
 
     lps = [0] * len(pattern)
@@ -57,7 +69,9 @@ def kmp_search(text: str, pattern: str) -> int:
     Returns:
         starting index of first match, or -1
     """
-    if pattern == "":
+    text = as_searchable(text)
+    pattern = coerce_pattern(text, pattern)
+    if len(pattern) == 0:
         return 0
     if len(pattern) > len(text):
         return -1
@@ -87,13 +101,15 @@ def kmp_search_all(text: str, pattern: str) -> List[int]:
     Return all starting indices where pattern appears in text.
 
     Args:
-        text: text to search
+        text: text to search (str, or bytes-like / mmap for byte offsets)
         pattern: pattern to find
 
     Returns:
         list of match starting indices
     """
-    if pattern == "":
+    text = as_searchable(text)
+    pattern = coerce_pattern(text, pattern)
+    if len(pattern) == 0:
         return list(range(len(text) + 1))
     if len(pattern) > len(text):
         return []
@@ -118,4 +134,45 @@ def kmp_search_all(text: str, pattern: str) -> List[int]:
             else:
                 i += 1
 
-    return matches
\ No newline at end of file
+    return matches
+
+
+def kmp_search_stream(source, pattern, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[int]:
+    """
+    Yield all starting offsets of pattern in a streamed text.
+
+    The KMP state is carried across chunk boundaries, so memory use is
+    O(m + chunk_size) regardless of the total text length.
+
+    Args:
+        source: text, file object, mmap, or iterable of str/bytes chunks
+        pattern: pattern to find (str or bytes)
+        chunk_size: read size for file-like sources
+
+    Returns:
+        generator of absolute match starting offsets, in increasing order
+    """
+    codes = to_codes(pattern)
+    m = len(codes)
+    offset = 0
+
+    if m == 0:
+        for chunk in iter_chunks(source, chunk_size):
+            yield from range(offset, offset + len(chunk))
+            offset += len(chunk)
+        yield offset
+        return
+
+    lps = compute_lps(codes)
+    j = 0
+
+    for chunk in iter_chunks(source, chunk_size):
+        for i, code in enumerate(iter_codes(chunk)):
+            while j and code != codes[j]:
+                j = lps[j - 1]
+            if code == codes[j]:
+                j += 1
+                if j == m:
+                    yield offset + i - m + 1
+                    j = lps[j - 1]
+        offset += len(chunk)
@@ -0,0 +1,183 @@
+"""
+2-bit packed nucleotide storage.
+
+Stores an A/C/G/T sequence four bases per byte in a bytearray
+(A=0, C=1, G=2, T=3, little-endian within each byte), which is 4x smaller
+than a str and 32x smaller than a list of 1-character strings.
+
+Supports:
+- len, indexing, slicing (returns str) and iteration
+- chunked decoding for streaming matchers
+- per-byte 2-bit k-mer extraction
+"""
+
+from typing import Iterable, Iterator, Optional, Union
+
+BASES = "ACGT"
+
+_INVALID = 0xFF
+_ENCODE = bytearray([_INVALID]) * 256
+for _code, _base in enumerate(BASES):
+    _ENCODE[ord(_base)] = _code
+    _ENCODE[ord(_base.lower())] = _code
+_ENCODE = bytes(_ENCODE)
+
+# Each packed byte decodes to four bases / four 2-bit codes
+_BYTE_TO_BASES = [
+    "".join(BASES[(b >> shift) & 3] for shift in (0, 2, 4, 6)) for b in range(256)
+]
+_BYTE_TO_CODES = [
+    tuple((b >> shift) & 3 for shift in (0, 2, 4, 6)) for b in range(256)
+]
+
+
+class PackedDNA:
+    __slots__ = ("_data", "_length")
+
+    # Symbols in code order: iter_codes() yields indices into this
+    alphabet = BASES
+
+    def __init__(self, sequence: Union[str, bytes, Iterable[str]] = ""):
+        if isinstance(sequence, PackedDNA):
+            self._data = bytearray(sequence._data)
+            self._length = sequence._length
+            return
+
+        if isinstance(sequence, (bytes, bytearray, memoryview)):
+            raw = bytes(sequence)
+        else:
+            if not isinstance(sequence, str):
+                sequence = "".join(sequence)
+            raw = sequence.encode("ascii", errors="replace")
+
+        codes = raw.translate(_ENCODE)
+        if _INVALID in codes:
+            text = sequence if isinstance(sequence, str) else raw.decode("latin-1")
+            invalid = sorted(set(text.upper()) - set(BASES))
+            raise ValueError(f"Invalid DNA characters found: {invalid}")
+
+        self._length = len(codes)
+        padded = codes + bytes(-len(codes) % 4)
+        self._data = bytearray(
+            a | (b << 2) | (c << 4) | (d << 6)
+            for a, b, c, d in zip(padded[0::4], padded[1::4], padded[2::4], padded[3::4])
+        )
+
+    def __len__(self) -> int:
+        return self._length
+
+    @property
+    def nbytes(self) -> int:
+        return len(self._data)
+
+    def code_at(self, index: int) -> int:
+        """
+        Return the 2-bit code of the base at index.
+        """
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("PackedDNA index out of range")
+        return (self._data[index >> 2] >> ((index & 3) << 1)) & 3
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            start, stop, step = key.indices(self._length)
+            if step != 1:
+                return self.decode()[key]
+            return self.decode(start, stop)
+        return BASES[self.code_at(key)]
+
+    def decode(self, start: int = 0, stop: Optional[int] = None) -> str:
+        """
+        Decode bases [start, stop) to a str.
+        """
+        if stop is None or stop > self._length:
+            stop = self._length
+        if start >= stop:
+            return ""
+        first = start >> 2
+        last = (stop + 3) >> 2
+        text = "".join([_BYTE_TO_BASES[b] for b in self._data[first:last]])
+        offset = first << 2
+        return text[start - offset:stop - offset]
+
+    def __str__(self) -> str:
+        return self.decode()
+
+    def __repr__(self) -> str:
+        preview = self.decode(0, 20)
+        suffix = "..." if self._length > 20 else ""
+        return f"PackedDNA('{preview}{suffix}', length={self._length})"
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, PackedDNA):
+            return self._length == other._length and self._data == other._data
+        if isinstance(other, str):
+            return self.decode() == other.upper()
+        return NotImplemented
+
+    def __iter__(self) -> Iterator[str]:
+        for chunk in self.iter_chunks():
+            yield from chunk
+
+    def iter_chunks(self, chunk_size: int = 1 << 16) -> Iterator[str]:
+        """
+        Yield the sequence as decoded str chunks of at most chunk_size bases.
+        """
+        chunk_size = max(4, chunk_size - chunk_size % 4)
+        for start in range(0, self._length, chunk_size):
+            yield self.decode(start, start + chunk_size)
+
+    def iter_codes(self) -> Iterator[int]:
+        """
+        Yield the 2-bit code of every base, decoding one byte at a time.
+        """
+        remaining = self._length
+        for b in self._data:
+            codes = _BYTE_TO_CODES[b]
+            if remaining < 4:
+                yield from codes[:remaining]
+                return
+            yield from codes
+            remaining -= 4
+
+    def iter_kmers(self, k: int) -> Iterator[int]:
+        """
+        Yield every k-mer as a 2k-bit integer (first base in the highest
+        bits), sliding one base at a time.
+        """
+        if k <= 0:
+            raise ValueError("k must be positive")
+
+        mask = (1 << (2 * k)) - 1
+        kmer = 0
+        seen = 0
+        for code in self.iter_codes():
+            kmer = ((kmer << 2) | code) & mask
+            seen += 1
+            if seen >= k:
+                yield kmer
+
+    def kmer_at(self, index: int, k: int) -> int:
+        """
+        Return the k-mer starting at index as a 2k-bit integer.
+        """
+        if index < 0 or index + k > self._length:
+            raise IndexError("k-mer out of range")
+        kmer = 0
+        for i in range(index, index + k):
+            kmer = (kmer << 2) | self.code_at(i)
+        return kmer
+
+    @staticmethod
+    def encode_kmer(kmer: str) -> int:
+        """
+        Encode a k-mer string in the same 2k-bit layout as iter_kmers.
+        """
+        value = 0
+        for code in kmer.encode("ascii", errors="replace").translate(_ENCODE):
+            if code == _INVALID:
+                raise ValueError(f"Invalid DNA k-mer: {kmer!r}")
+            value = (value << 2) | code
+        return value
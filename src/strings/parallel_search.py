@@ -0,0 +1,145 @@
+"""
+Process-parallel exact matching over large texts.
+
+The text is copied once into a shared memory block; each worker process
+attaches to it by name and scans one shard, so the text itself is never
+pickled. Shards overlap by len(pattern) - 1 characters, which is exactly
+enough for every occurrence to lie entirely inside the shard its start
+position belongs to.
+
+Supported scanners:
+- KMP ("kmp")
+- Rabin-Karp ("rk")
+
+ASCII texts are stored one byte per character, other texts as UTF-32 so
+that shard boundaries stay on character positions. Binary texts (bytes,
+memoryview, mmap) are copied into shared memory as they are.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import List, Optional, Tuple
+
+from src.strings.kmp import kmp_search_all
+from src.strings.rabin_karp import rabin_karp_search_all
+from src.strings.streaming import as_searchable, coerce_pattern
+
+_SCANNERS = {
+    "kmp": kmp_search_all,
+    "rk": rabin_karp_search_all,
+}
+
+# Below this many characters per shard, process start-up dominates the scan
+MIN_SHARD_SIZE = 1 << 16
+
+
+def _encode_shared_text(text) -> Tuple[bytes, Optional[str], int]:
+    if not isinstance(text, str):
+        return text, None, 1
+    if text.isascii():
+        return text.encode("ascii"), "ascii", 1
+    return text.encode("utf-32-le"), "utf-32-le", 4
+
+
+def _scan_shard(
+    shm_name: str,
+    encoding: Optional[str],
+    width: int,
+    start: int,
+    stop: int,
+    pattern: str,
+    method: str,
+) -> List[int]:
+    """
+    Worker: decode text[start:stop] from shared memory and scan it.
+    """
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        shard = bytes(shm.buf[start * width:stop * width])
+    finally:
+        shm.close()
+    if encoding is not None:
+        shard = shard.decode(encoding)
+    return [start + i for i in _SCANNERS[method](shard, pattern)]
+
+
+def shard_bounds(n: int, m: int, shards: int) -> List[Tuple[int, int]]:
+    """
+    Split text[0:n] into shards whose start positions partition [0, n - m].
+
+    Args:
+        n: text length
+        m: pattern length (>= 1)
+        shards: number of shards
+
+    Returns:
+        list of (start, stop) slices, each overlapping the next by m - 1
+    """
+    starts = n - m + 1
+    if starts <= 0:
+        return []
+    shards = max(1, min(shards, starts))
+    step = -(-starts // shards)
+    return [(lo, min(lo + step, starts) + m - 1) for lo in range(0, starts, step)]
+
+
+def parallel_search_all(
+    text: str,
+    pattern: str,
+    method: str = "kmp",
+    workers: Optional[int] = None,
+    min_shard_size: int = MIN_SHARD_SIZE,
+) -> List[int]:
+    """
+    Find all occurrences of pattern using a pool of worker processes.
+
+    Args:
+        text: text to search
+        pattern: pattern to find
+        method: "kmp" or "rk"
+        workers: number of processes (default: os.cpu_count())
+        min_shard_size: smallest shard worth sending to a worker; shorter
+            texts are scanned in the calling process
+
+    Returns:
+        sorted list of starting indices
+    """
+    method = method.lower()
+    if method not in _SCANNERS:
+        raise ValueError("method must be one of: 'kmp', 'rk'")
+
+    scan = _SCANNERS[method]
+    text = as_searchable(text)
+    pattern = coerce_pattern(text, pattern)
+    n = len(text)
+    m = len(pattern)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError("workers must be positive")
+
+    shards = min(workers, n // max(1, min_shard_size))
+    if m == 0 or m > n or shards <= 1:
+        return scan(text, pattern)
+
+    data, encoding, width = _encode_shared_text(text)
+    shm = shared_memory.SharedMemory(create=True, size=len(data))
+    try:
+        shm.buf[:len(data)] = data
+        del data
+        with ProcessPoolExecutor(max_workers=shards) as executor:
+            futures = [
+                executor.submit(_scan_shard, shm.name, encoding, width, lo, hi, pattern, method)
+                for lo, hi in shard_bounds(n, m, shards)
+            ]
+            # Shards own disjoint, increasing start ranges, so concatenating
+            # their results in order is already sorted and duplicate-free
+            matches: List[int] = []
+            for future in futures:
+                matches.extend(future.result())
+    finally:
+        shm.close()
+        shm.unlink()
+
+    return matches
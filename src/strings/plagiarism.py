@@ -2,13 +2,16 @@
 Plagiarism / document similarity application.
 
 Implements:
-- longest common substring using suffix-array-style approach on combined text
+- longest common substring using a suffix automaton (linear time and space)
+- longest common substring across k documents at once
 - simple overlap-based similarity score using fixed-length shingles
 
 This keeps the implementation practical and report-friendly.
 """
 
-from typing import Dict, Any, Set
+from typing import Dict, Any, Sequence, Set
+
+from src.strings.suffix_automaton import SuffixAutomaton
 
 
 def _normalize_text(text: str) -> str:
@@ -20,11 +23,38 @@ def _normalize_text(text: str) -> str:
 
 def longest_common_substring(text1: str, text2: str) -> str:
     """
-    Compute one longest common substring between two texts using
-    a dynamic programming approach.
+    Compute one longest common substring between two texts.
+
+    Builds a suffix automaton of the shorter normalized text and scans the
+    other one, so time and memory are O(len(text1) + len(text2)).
+    """
+    return longest_common_substring_many([text1, text2])
+
+
+def longest_common_substring_many(texts: Sequence[str]) -> str:
+    """
+    Compute one longest substring common to all texts.
+
+    The suffix automaton of the shortest text is matched against every
+    other text, keeping per-state minima of the match lengths.
+    """
+    normalized = [_normalize_text(text) for text in texts]
+
+    if not normalized or any(not text for text in normalized):
+        return ""
+
+    base_index = min(range(len(normalized)), key=lambda i: len(normalized[i]))
+    base = normalized[base_index]
+    others = normalized[:base_index] + normalized[base_index + 1:]
 
-    This is practical for moderate-sized documents and sufficient for
-    a course application module.
+    end, length = SuffixAutomaton(base).longest_common_substring(others)
+    return base[end - length + 1:end + 1]
+
+
+def longest_common_substring_dp(text1: str, text2: str) -> str:
+    """
+    Reference O(n*m) dynamic programming implementation of
+    longest_common_substring, kept for testing and benchmarking.
     """
     a = _normalize_text(text1)
     b = _normalize_text(text2)
@@ -0,0 +1,270 @@
+"""
+Corpus-scale plagiarism index using winnowed k-gram fingerprints.
+
+Implements:
+- deterministic rolling hashes of character k-grams (the Mersenne-61
+  window hashes from the rabin_karp module)
+- winnowing fingerprint selection (as used by MOSS): the rightmost minimum
+  hash of every window of w consecutive k-gram hashes
+- inverted postings: fingerprint hash -> [(document, position), ...]
+- top-k similar documents with merged match spans
+- JSON persistence
+
+A query only touches the postings of its own fingerprints, so its cost
+depends on the number of matching documents rather than the corpus size.
+Winnowing guarantees that any shared substring of length >= w + k - 1
+produces at least one shared fingerprint.
+
+All positions refer to the normalized text (lowercased, whitespace
+collapsed), as produced by the plagiarism module.
+"""
+
+import heapq
+import json
+from collections import deque
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Tuple
+
+from src.strings.plagiarism import _normalize_text
+from src.strings.rabin_karp import window_hashes
+
+
+def kgram_hashes(text: str, k: int) -> List[int]:
+    """
+    Return rolling hashes of every length-k substring of text.
+
+    Args:
+        text: input text
+        k: k-gram length
+
+    Returns:
+        list of len(text) - k + 1 hash values
+    """
+    if k <= 0:
+        raise ValueError("k must be positive")
+    return window_hashes(text, k)
+
+
+def winnow_fingerprints(text: str, k: int = 5, window: int = 4) -> List[Tuple[int, int]]:
+    """
+    Select winnowing fingerprints from normalized text.
+
+    Args:
+        text: input text (normalized by the caller)
+        k: k-gram length
+        window: winnowing window size in k-grams
+
+    Returns:
+        list of (hash, k-gram start position), in position order
+    """
+    if window <= 0:
+        raise ValueError("window must be positive")
+
+    hashes = kgram_hashes(text, k)
+    if not hashes:
+        return []
+    if len(hashes) < window:
+        # Short documents: one fingerprint for the whole text
+        position = min(range(len(hashes)), key=lambda i: (hashes[i], -i))
+        return [(hashes[position], position)]
+
+    fingerprints = []
+    candidates = deque()
+    last_selected = -1
+
+    for i, h in enumerate(hashes):
+        # Keep candidates increasing so the front is the rightmost minimum
+        while candidates and hashes[candidates[-1]] >= h:
+            candidates.pop()
+        candidates.append(i)
+
+        if candidates[0] <= i - window:
+            candidates.popleft()
+
+        if i >= window - 1 and candidates[0] != last_selected:
+            last_selected = candidates[0]
+            fingerprints.append((hashes[last_selected], last_selected))
+
+    return fingerprints
+
+
+def _merge_spans(pairs: List[Tuple[int, int]], k: int) -> List[Tuple[int, int, int, int]]:
+    """
+    Merge matching (query_pos, doc_pos) k-gram pairs into spans.
+
+    Returns:
+        list of (query_start, query_end, doc_start, doc_end), ends exclusive
+    """
+    spans: List[List[int]] = []
+    for q, d in sorted(pairs):
+        if spans:
+            span = spans[-1]
+            if q <= span[1] and span[2] <= d <= span[3]:
+                span[1] = max(span[1], q + k)
+                span[3] = max(span[3], d + k)
+                continue
+        spans.append([q, q + k, d, d + k])
+    return [tuple(span) for span in spans]
+
+
+def _encode_doc_id(doc_id: Hashable) -> Any:
+    if isinstance(doc_id, tuple):
+        return {"tuple": [_encode_doc_id(part) for part in doc_id]}
+    if doc_id is None or isinstance(doc_id, (str, int, float)):
+        return doc_id
+    raise TypeError(f"cannot save document id of type {type(doc_id).__name__}")
+
+
+def _decode_doc_id(value: Any) -> Hashable:
+    if isinstance(value, dict):
+        return tuple(_decode_doc_id(part) for part in value["tuple"])
+    return value
+
+
+class PlagiarismIndex:
+    def __init__(self, k: int = 5, window: int = 4):
+        """
+        Args:
+            k: k-gram length in characters
+            window: winnowing window size (guarantee threshold is window + k - 1)
+        """
+        if k <= 0 or window <= 0:
+            raise ValueError("k and window must be positive")
+
+        self.k = k
+        self.window = window
+        self.doc_ids: List[Hashable] = []
+        self.doc_lengths: List[int] = []
+        self.doc_fingerprint_counts: List[int] = []
+        self.postings: Dict[int, List[Tuple[int, int]]] = {}
+        self._doc_index: Dict[Hashable, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.doc_ids)
+
+    def _fingerprints(self, text: str) -> List[Tuple[int, int]]:
+        return winnow_fingerprints(_normalize_text(text), k=self.k, window=self.window)
+
+    def add_document(self, doc_id: Hashable, text: str) -> None:
+        """
+        Fingerprint a document and add it to the postings.
+        """
+        if doc_id in self._doc_index:
+            raise ValueError(f"document already indexed: {doc_id!r}")
+
+        internal = len(self.doc_ids)
+        fingerprints = self._fingerprints(text)
+
+        self._doc_index[doc_id] = internal
+        self.doc_ids.append(doc_id)
+        self.doc_lengths.append(len(_normalize_text(text)))
+        self.doc_fingerprint_counts.append(len({h for h, _ in fingerprints}))
+
+        for h, position in fingerprints:
+            self.postings.setdefault(h, []).append((internal, position))
+
+    def add_documents(self, documents: Iterable[Tuple[Hashable, str]]) -> None:
+        for doc_id, text in documents:
+            self.add_document(doc_id, text)
+
+    def query(
+        self,
+        text: str,
+        top_k: int = 5,
+        max_doc_frequency: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Return the top_k most similar indexed documents.
+
+        Args:
+            text: submission to check
+            top_k: number of documents to return
+            max_doc_frequency: skip fingerprints with more postings than this
+                (e.g. boilerplate shared by many documents)
+
+        Returns:
+            list of dicts with doc_id, shared_fingerprints, similarity_score
+            (Jaccard over fingerprint sets), containment (share of the
+            query's fingerprints found in the document) and spans
+        """
+        fingerprints = self._fingerprints(text)
+        query_hashes: Dict[int, List[int]] = {}
+        for h, position in fingerprints:
+            query_hashes.setdefault(h, []).append(position)
+
+        # First pass: shared fingerprint counts only, to rank documents
+        usable: Dict[int, List[Tuple[int, int]]] = {}
+        shared: Dict[int, int] = {}
+        for h in query_hashes:
+            postings = self.postings.get(h)
+            if not postings:
+                continue
+            if max_doc_frequency is not None and len(postings) > max_doc_frequency:
+                continue
+            usable[h] = postings
+            for doc in {doc for doc, _ in postings}:
+                shared[doc] = shared.get(doc, 0) + 1
+
+        query_count = len(query_hashes)
+        best = heapq.nlargest(top_k, shared.items(), key=lambda item: (item[1], -item[0]))
+
+        # Second pass: match pairs for the selected documents only
+        pairs: Dict[int, List[Tuple[int, int]]] = {doc: [] for doc, _ in best}
+        for h, postings in usable.items():
+            query_positions = query_hashes[h]
+            for doc, doc_position in postings:
+                doc_pairs = pairs.get(doc)
+                if doc_pairs is not None:
+                    for query_position in query_positions:
+                        doc_pairs.append((query_position, doc_position))
+
+        results = []
+        for doc, count in best:
+            union = query_count + self.doc_fingerprint_counts[doc] - count
+            results.append({
+                "doc_id": self.doc_ids[doc],
+                "shared_fingerprints": count,
+                "similarity_score": count / union if union else 1.0,
+                "containment": count / query_count if query_count else 0.0,
+                "spans": _merge_spans(pairs[doc], self.k),
+            })
+        return results
+
+    def save(self, path: str) -> None:
+        """
+        Write the index to a JSON file.
+
+        Document ids may be str, int, float, bool, None, or tuples of
+        those; tuples are tagged so that load restores them as tuples.
+        """
+        data = {
+            "k": self.k,
+            "window": self.window,
+            "doc_ids": [_encode_doc_id(doc_id) for doc_id in self.doc_ids],
+            "doc_lengths": self.doc_lengths,
+            "doc_fingerprint_counts": self.doc_fingerprint_counts,
+            "postings": {
+                str(h): [value for entry in postings for value in entry]
+                for h, postings in self.postings.items()
+            },
+        }
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+
+    @classmethod
+    def load(cls, path: str) -> "PlagiarismIndex":
+        """
+        Read an index written by save.
+        """
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+
+        index = cls(k=data["k"], window=data["window"])
+        index.doc_ids = [_decode_doc_id(doc_id) for doc_id in data["doc_ids"]]
+        index.doc_lengths = data["doc_lengths"]
+        index.doc_fingerprint_counts = data["doc_fingerprint_counts"]
+        index._doc_index = {doc_id: i for i, doc_id in enumerate(index.doc_ids)}
+        index.postings = {
+            int(h): list(zip(flat[0::2], flat[1::2]))
+            for h, flat in data["postings"].items()
+        }
+        return index
@@ -2,28 +2,61 @@
 Rabin-Karp string matching.
 
 Implements:
-- rolling hash helper
+- rolling hash helpers (one string, or every window of a text)
 - single-pattern first match
 - single-pattern all matches
+- streaming all matches over files, mmaps and chunk iterators
+- str texts, or bytes / bytearray / memoryview / mmap texts searched in
+  place as byte code units
+- multi-pattern search over equal-length pattern sets (e.g. k-mers) in one
+  pass, with an optional NumPy-vectorized window-hash path
 
 Features:
 - rolling hash updates
+- Mersenne-61 modulus by default, optional second independent hash
+  (double hashing) so false positives are negligible
 - explicit substring verification to handle collisions
+- collision counters via rabin_karp_search_stats
 
 Complexity:
 - average: O(n + m)
-- worst case: O(nm)
+- worst case: O(nm) (requires a hash collision at almost every window)
 """
 
-from typing import List
+from collections import deque
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
-def rolling_hash(s: str, base: int = 256, modulus: int = 101) -> int:
+from src.strings.streaming import (
+    DEFAULT_CHUNK_SIZE,
+    as_searchable,
+    coerce_pattern,
+    iter_chunks,
+    iter_codes,
+    to_codes,
+)
+
+MERSENNE_61 = (1 << 61) - 1
+
+# Second, independent hash used when double_hash=True
+SECOND_BASE = 131
+SECOND_MODULUS = (1 << 31) - 1
+
+# Companion 31-bit hash for the NumPy multi-pattern path
+_NUMPY_BASE = 257
+_NUMPY_MODULUS = 2147483629
+
+
+def rolling_hash(s: str, base: int = 256, modulus: int = MERSENNE_61) -> int:
     """
     Compute polynomial rolling hash for a string.
 
     Args:
-        s: input string
+        s: input string (or bytes-like code units)
         base: hash base
         modulus: prime modulus
 
@@ -31,32 +64,52 @@ def rolling_hash(s: str, base: int = 256, modulus: int = 101) -> int:
         hash value
     """
     h = 0
-    for ch in s:
-        h = (h * base + ord(ch)) % modulus
+    for code in iter_codes(s):
+        h = (h * base + code) % modulus
     return h
 
 
-def _recompute_window_hash(
-    old_hash: int,
-    left_char: str,
-    right_char: str,
-    highest_power: int,
-    base: int,
-    modulus: int,
-) -> int:
+def window_hashes(text: str, m: int, base: int = 256, modulus: int = MERSENNE_61) -> List[int]:
     """
-    Update rolling hash when sliding the window by one character.
+    Compute the rolling hash of every length-m window of text.
+
+    Args:
+        text: input text (or bytes-like code units)
+        m: window length
+        base: hash base
+        modulus: prime modulus
+
+    Returns:
+        list of len(text) - m + 1 hash values, hash i covering text[i:i + m]
     """
-    new_hash = (old_hash - ord(left_char) * highest_power) % modulus
-    new_hash = (new_hash * base + ord(right_char)) % modulus
-    return new_hash
+    if m <= 0:
+        raise ValueError("window length must be positive")
+    text = as_searchable(text)
+    n = len(text)
+    if n < m:
+        return []
+
+    is_str = isinstance(text, str)
+    highest_power = pow(base, m - 1, modulus)
+    h = rolling_hash(text[:m], base=base, modulus=modulus)
+    hashes = [h]
+    for i in range(m, n):
+        left = text[i - m]
+        right = text[i]
+        if is_str:
+            left = ord(left)
+            right = ord(right)
+        h = ((h - left * highest_power) * base + right) % modulus
+        hashes.append(h)
+    return hashes
 
 
 def rabin_karp_search(
     text: str,
     pattern: str,
     base: int = 256,
-    modulus: int = 101,
+    modulus: int = MERSENNE_61,
+    double_hash: bool = False,
 ) -> int:
     """
     Return the index of the first match of pattern in text, or -1 if absent.
@@ -66,61 +119,334 @@ def rabin_karp_search(
         pattern: pattern to find
         base: rolling hash base
         modulus: prime modulus
+        double_hash: also require a second independent hash to match
 
     Returns:
         starting index of first match, or -1
     """
-    matches = rabin_karp_search_all(text, pattern, base=base, modulus=modulus)
+    matches = rabin_karp_search_all(
+        text, pattern, base=base, modulus=modulus, double_hash=double_hash
+    )
     return matches[0] if matches else -1
 
 
+def _rabin_karp_scan(
+    text: str,
+    pattern: str,
+    base: int,
+    modulus: int,
+    double_hash: bool,
+) -> Tuple[List[int], int]:
+    """
+    Scan text and return (matches, number of windows whose hashes matched).
+    """
+    n = len(text)
+    m = len(pattern)
+    is_str = isinstance(text, str)
+
+    if m == 0:
+        return list(range(n + 1)), n + 1
+    if m > n:
+        return [], 0
+
+    pattern_hash = rolling_hash(pattern, base=base, modulus=modulus)
+    window_hash = rolling_hash(text[:m], base=base, modulus=modulus)
+    highest_power = pow(base, m - 1, modulus)
+
+    if double_hash:
+        pattern_hash2 = rolling_hash(pattern, base=SECOND_BASE, modulus=SECOND_MODULUS)
+        window_hash2 = rolling_hash(text[:m], base=SECOND_BASE, modulus=SECOND_MODULUS)
+        highest_power2 = pow(SECOND_BASE, m - 1, SECOND_MODULUS)
+
+    matches = []
+    hash_hits = 0
+
+    for i in range(n - m + 1):
+        if pattern_hash == window_hash and (not double_hash or pattern_hash2 == window_hash2):
+            hash_hits += 1
+            # Verify to prevent false positive from hash collision
+            if text[i:i + m] == pattern:
+                matches.append(i)
+
+        if i < n - m:
+            left = text[i]
+            right = text[i + m]
+            if is_str:
+                left = ord(left)
+                right = ord(right)
+            window_hash = ((window_hash - left * highest_power) * base + right) % modulus
+            if double_hash:
+                window_hash2 = (
+                    (window_hash2 - left * highest_power2) * SECOND_BASE + right
+                ) % SECOND_MODULUS
+
+    return matches, hash_hits
+
+
 def rabin_karp_search_all(
     text: str,
     pattern: str,
     base: int = 256,
-    modulus: int = 101,
+    modulus: int = MERSENNE_61,
+    double_hash: bool = False,
 ) -> List[int]:
     """
     Return all starting indices where pattern appears in text.
 
     Args:
-        text: text to search
+        text: text to search (str, or bytes-like / mmap for byte offsets)
         pattern: pattern to find
         base: rolling hash base
-        modulus: prime modulus
+        modulus: prime modulus (small values collide often; the Mersenne-61
+            default keeps the expected false-positive rate negligible)
+        double_hash: also require a second independent hash to match
 
     Returns:
         list of match starting indices
     """
-    n = len(text)
-    m = len(pattern)
+    text = as_searchable(text)
+    pattern = coerce_pattern(text, pattern)
+    matches, _ = _rabin_karp_scan(text, pattern, base, modulus, double_hash)
+    return matches
+
+
+def rabin_karp_search_stats(
+    text: str,
+    pattern: str,
+    base: int = 256,
+    modulus: int = MERSENNE_61,
+    double_hash: bool = False,
+) -> Dict[str, Any]:
+    """
+    Search like rabin_karp_search_all and report hash collision counters.
+
+    Returns:
+        matches: list of match starting indices
+        hash_hits: windows whose hash equalled the pattern hash
+        collisions: hash hits rejected by substring verification
+        collision_rate: collisions per candidate window
+    """
+    text = as_searchable(text)
+    pattern = coerce_pattern(text, pattern)
+    matches, hash_hits = _rabin_karp_scan(text, pattern, base, modulus, double_hash)
+    collisions = hash_hits - len(matches)
+    windows = max(len(text) - len(pattern) + 1, 0)
+
+    return {
+        "matches": matches,
+        "hash_hits": hash_hits,
+        "collisions": collisions,
+        "collision_rate": collisions / windows if windows else 0.0,
+    }
+
 
-    if pattern == "":
-        return list(range(n + 1))
+def rabin_karp_search_many(
+    text: str,
+    patterns: Iterable[str],
+    base: int = 256,
+    modulus: int = MERSENNE_61,
+    use_numpy: bool = False,
+) -> Dict[str, List[int]]:
+    """
+    Return all starting indices of every pattern in an equal-length set.
+
+    Pattern hashes go into a dict, and a single rolling window is slid
+    across the text; each window costs one dict lookup regardless of the
+    number of patterns. Total time is O(n + total pattern length) expected.
+
+    Args:
+        text: text to search (str, or bytes-like / mmap for byte offsets)
+        patterns: non-empty patterns, all of the same length (in the
+            text's code units)
+        base: rolling hash base (pure-Python path)
+        modulus: prime modulus (pure-Python path)
+        use_numpy: compute all window hashes with NumPy (requires numpy;
+            texts with lone surrogates fall back to the Python path)
+
+    Returns:
+        dict mapping each distinct pattern to its match starting indices
+    """
+    text = as_searchable(text)
+    queries = {pattern: coerce_pattern(text, pattern) for pattern in patterns}
+    results: Dict[str, List[int]] = {pattern: [] for pattern in queries}
+    if not queries:
+        return results
+
+    m = len(next(iter(queries.values())))
+    if m == 0 or any(len(query) != m for query in queries.values()):
+        raise ValueError("patterns must be non-empty and of equal length")
+
+    n = len(text)
     if m > n:
-        return []
+        return results
 
-    pattern_hash = rolling_hash(pattern, base=base, modulus=modulus)
-    window = text[:m]
-    window_hash = rolling_hash(window, base=base, modulus=modulus)
+    if use_numpy:
+        if np is None:
+            raise ImportError("use_numpy=True requires numpy")
+        try:
+            _rabin_karp_many_numpy(text, m, queries, results)
+            return results
+        except UnicodeEncodeError:
+            # Lone surrogates have no UTF-32 code units; use the Python path
+            pass
+
+    by_hash: Dict[int, List[str]] = {}
+    for pattern, query in queries.items():
+        by_hash.setdefault(rolling_hash(query, base=base, modulus=modulus), []).append(pattern)
 
+    is_str = isinstance(text, str)
+    window_hash = rolling_hash(text[:m], base=base, modulus=modulus)
     highest_power = pow(base, m - 1, modulus)
-    matches = []
 
     for i in range(n - m + 1):
-        if pattern_hash == window_hash:
-            # Verify to prevent false positive from hash collision
-            if text[i:i + m] == pattern:
-                matches.append(i)
+        candidates = by_hash.get(window_hash)
+        if candidates is not None:
+            window = text[i:i + m]
+            for pattern in candidates:
+                if window == queries[pattern]:
+                    results[pattern].append(i)
 
         if i < n - m:
-            window_hash = _recompute_window_hash(
-                old_hash=window_hash,
-                left_char=text[i],
-                right_char=text[i + m],
-                highest_power=highest_power,
-                base=base,
-                modulus=modulus,
-            )
-
-    return matches
\ No newline at end of file
+            left = text[i]
+            right = text[i + m]
+            if is_str:
+                left = ord(left)
+                right = ord(right)
+            window_hash = ((window_hash - left * highest_power) * base + right) % modulus
+
+    return results
+
+
+def _numpy_powers(base: int, modulus: int, count: int):
+    """
+    base**j % modulus for j in range(count), built by repeated doubling
+    (O(log count) vectorized passes).
+    """
+    powers = np.ones(count, dtype=np.uint64)
+    size = 1
+    while size < count:
+        step = min(size, count - size)
+        factor = np.uint64(pow(base, size, modulus))
+        powers[size:size + step] = powers[:step] * factor % np.uint64(modulus)
+        size += step
+    return powers
+
+
+def _numpy_codes(data):
+    """
+    Code units of a str (as UTF-32) or of a bytes-like object, as uint64.
+    """
+    if isinstance(data, str):
+        return np.frombuffer(data.encode("utf-32-le"), dtype=np.uint32).astype(np.uint64)
+    return np.frombuffer(data, dtype=np.uint8).astype(np.uint64)
+
+
+def _rabin_karp_many_numpy(
+    text: str, m: int, queries: Dict[str, str], results: Dict[str, List[int]]
+) -> None:
+    """
+    NumPy path for rabin_karp_search_many.
+
+    With weights w_j = base**j, the prefix sums H[i] = sum(c_j * w_j, j < i)
+    give every window hash as a prefix-hash difference,
+    (H[i + m] - H[i]) * base**-i, in O(n) vectorized work independent of m.
+    This is done under two 31-bit moduli (so products fit in uint64), the
+    two hashes are packed into one 62-bit key and matched against the
+    pattern keys with np.isin. Candidates are verified against the text.
+
+    Raises:
+        UnicodeEncodeError: if a str text or pattern has no UTF-32 encoding
+            (lone surrogates)
+    """
+    codes = _numpy_codes(text)
+    pattern_codes = {pattern: _numpy_codes(query).tolist() for pattern, query in queries.items()}
+    n = len(codes)
+    windows = n - m + 1
+
+    text_keys = np.zeros(windows, dtype=np.uint64)
+    pattern_keys = {pattern: 0 for pattern in results}
+    for base, modulus in ((SECOND_BASE, SECOND_MODULUS), (_NUMPY_BASE, _NUMPY_MODULUS)):
+        mod = np.uint64(modulus)
+        powers = _numpy_powers(base, modulus, n)
+        inverse_powers = _numpy_powers(pow(base, -1, modulus), modulus, windows)
+
+        prefix = np.zeros(n + 1, dtype=np.uint64)
+        np.cumsum(codes * powers % mod, out=prefix[1:])
+        prefix %= mod
+        hashes = (prefix[m:] + mod - prefix[:windows]) % mod * inverse_powers % mod
+        text_keys = (text_keys << np.uint64(31)) | hashes
+
+        weights = powers[:m].tolist()
+        for pattern, values in pattern_codes.items():
+            h = sum(code * weight for code, weight in zip(values, weights)) % modulus
+            pattern_keys[pattern] = (pattern_keys[pattern] << 31) | h
+
+    by_key: Dict[int, List[str]] = {}
+    for pattern, key in pattern_keys.items():
+        by_key.setdefault(key, []).append(pattern)
+
+    lookup = np.fromiter(by_key, dtype=np.uint64, count=len(by_key))
+    candidate_positions = np.nonzero(np.isin(text_keys, lookup))[0]
+
+    for i, key in zip(candidate_positions.tolist(), text_keys[candidate_positions].tolist()):
+        window = text[i:i + m]
+        for pattern in by_key[key]:
+            if window == queries[pattern]:
+                results[pattern].append(i)
+
+
+def rabin_karp_search_stream(
+    source,
+    pattern,
+    base: int = 256,
+    modulus: int = MERSENNE_61,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[int]:
+    """
+    Yield all starting offsets of pattern in a streamed text.
+
+    The rolling hash and the current window (a deque of at most m code
+    units) are carried across chunk boundaries, so matches spanning two
+    chunks are found without re-reading.
+
+    Args:
+        source: text, file object, mmap, or iterable of str/bytes chunks
+        pattern: pattern to find (str or bytes)
+        base: rolling hash base
+        modulus: prime modulus
+        chunk_size: read size for file-like sources
+
+    Returns:
+        generator of absolute match starting offsets, in increasing order
+    """
+    codes = to_codes(pattern)
+    m = len(codes)
+    offset = 0
+
+    if m == 0:
+        for chunk in iter_chunks(source, chunk_size):
+            yield from range(offset, offset + len(chunk))
+            offset += len(chunk)
+        yield offset
+        return
+
+    pattern_hash = 0
+    for code in codes:
+        pattern_hash = (pattern_hash * base + code) % modulus
+
+    highest_power = pow(base, m - 1, modulus)
+    window = deque(maxlen=m)
+    window_hash = 0
+
+    for chunk in iter_chunks(source, chunk_size):
+        for i, code in enumerate(iter_codes(chunk)):
+            if len(window) == m:
+                window_hash = (window_hash - window[0] * highest_power) % modulus
+            window.append(code)
+            window_hash = (window_hash * base + code) % modulus
+
+            if len(window) == m and window_hash == pattern_hash:
+                # Verify to prevent false positive from hash collision
+                if list(window) == codes:
+                    yield offset + i - m + 1
+        offset += len(chunk)
@@ -6,71 +6,600 @@ Supports:
 - Rabin-Karp
 - Suffix Array
 - Compressed Suffix Tree
+- Aho-Corasick (multi-pattern, single scan)
+- FM-index (BWT backward search)
+- approximate matching (Bitap for Hamming distance, Myers for edit distance)
+- process-parallel sharded KMP / Rabin-Karp scans (parallel_find)
+- repeat analytics from the suffix array + LCP (no suffix tree needed)
+- method="auto": cost-model driven selection that scans until repeated
+  queries justify building an index
+
+Suffix array / LCP indexes can be saved to disk and memory-mapped back
+with save_index / load_index.
+
+The text may also be bytes, bytearray, memoryview or mmap; it is then
+searched in place without decoding, and positions are byte offsets. An
+mmap is held as is and viewed per operation, so it can be closed once no
+query (or unfinished iter_matches generator) is running.
+
+Text can be appended with append(chunk). Once a suffix array has been
+built, later appends are indexed as log-structured segments instead of
+rebuilding it from scratch.
 """
 
+import mmap
 import time
-from typing import Dict, Any, List, Optional
+from itertools import islice
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
 
-from src.strings.kmp import kmp_search_all
-from src.strings.rabin_karp import rabin_karp_search_all
-from src.strings.suffix_array import build_suffix_array, build_lcp_array, suffix_array_search
+from src.strings.aho_corasick import AhoCorasick
+from src.strings.approximate import bitap_hamming_search, myers_edit_search
+from src.strings.cost_model import CostModel
+from src.strings.fm_index import FMIndex
+from src.strings.index_file import save_suffix_index, load_suffix_index
+from src.strings.kmp import kmp_search_all, kmp_search_stream
+from src.strings.parallel_search import MIN_SHARD_SIZE, parallel_search_all
+from src.strings.rabin_karp import rabin_karp_search_stats, rabin_karp_search_stream
+from src.strings.segmented_suffix_array import DEFAULT_BUFFER_SIZE, SegmentedSuffixArray
+from src.strings.streaming import as_searchable, coerce_pattern
+from src.strings.suffix_array import (
+    build_suffix_array,
+    build_lcp_array,
+    build_lcp_lr,
+    count_distinct_substrings,
+    longest_repeated_substring,
+    maximal_repeats,
+    most_frequent_repeats,
+    suffix_array_range,
+    suffix_array_search,
+    suffix_array_search_batch,
+)
 from src.strings.suffix_tree import CompressedSuffixTree
 
 
+_METHODS = ("kmp", "rk", "sa", "tree", "ac", "fm")
+_METHOD_ERROR = "method must be one of: " + ", ".join(f"'{name}'" for name in _METHODS + ("auto",))
+
+METHOD_RECOMMENDATIONS = {
+    "kmp": "KMP is a good choice for deterministic linear-time single-pattern scanning.",
+    "rk": "Rabin-Karp is useful for rolling-hash based matching and large batch-style comparisons.",
+    "sa": "Suffix Arrays are best when the same text will be queried repeatedly after preprocessing.",
+    "tree": "Suffix Trees support very fast substring queries after preprocessing, at the cost of more memory and construction complexity.",
+    "fm": "FM-indexes count and locate patterns in a compressed BWT index, ideal for very large texts such as genomes.",
+    "ac": "Aho-Corasick finds every occurrence of many patterns in a single linear scan of the text.",
+    "auto": "Auto selection scans with KMP or Rabin-Karp until repeated queries pay for a suffix array, then uses the index.",
+}
+
+
 class StringSearchEngine:
-    def __init__(self, text: str):
-        self.text = text
-        self._suffix_array: Optional[List[int]] = None
-        self._lcp_array: Optional[List[int]] = None
+    def __init__(
+        self,
+        text: Union[str, bytes, bytearray, memoryview, mmap.mmap],
+        append_buffer_size: int = DEFAULT_BUFFER_SIZE,
+        cost_model: Optional[CostModel] = None,
+    ):
+        """
+        Args:
+            text: str, or bytes / bytearray / memoryview / mmap searched in
+                place as bytes (match positions are then byte offsets and
+                str patterns are UTF-8 encoded)
+            append_buffer_size: tail size at which appended text is indexed
+            cost_model: model for method="auto" (calibrated on first use
+                when omitted)
+        """
+        # Keep an mmap itself rather than a long-lived memoryview of it,
+        # which would stop the caller from closing the mapping
+        self._text = text if isinstance(text, mmap.mmap) else as_searchable(text)
+        self._empty = "" if isinstance(self._text, str) else b""
+        self._pending_chunks: List[str] = []
+        self._append_buffer_size = append_buffer_size
+        self._segments: Optional[SegmentedSuffixArray] = None
+
+        self._suffix_array: Optional[Sequence[int]] = None
+        self._lcp_array: Optional[Sequence[int]] = None
         self._sa_build_time: Optional[float] = None
+        self._lcp_lr = None
+        self._index_mmap = None
 
         self._suffix_tree: Optional[CompressedSuffixTree] = None
         self._tree_build_time: Optional[float] = None
 
+        self._fm_index: Optional[FMIndex] = None
+        self._fm_build_time: Optional[float] = None
+
+        self._cost_model = cost_model
+        self._queries_seen = 0
+        self._alphabet: Optional[set] = None
+
+    @property
+    def text(self) -> str:
+        """
+        The whole text. After appends to an indexed text the segments hold
+        the only copy, so reading this joins them (O(n)); queries answered
+        from the segments never do.
+        """
+        if self._segments is not None:
+            return self._segments.text
+        if self._pending_chunks:
+            self._text = self._empty.join([self._text] + self._pending_chunks)
+            self._pending_chunks = []
+        return as_searchable(self._text)
+
+    def _text_length(self) -> int:
+        if self._segments is not None:
+            return len(self._segments)
+        return len(self.text)
+
+    def _coerce(self, pattern: str) -> str:
+        return coerce_pattern(self._empty, pattern)
+
+    def append(self, chunk: str) -> None:
+        """
+        Append chunk to the end of the text.
+
+        If no suffix array has been built yet, the chunk is only buffered.
+        Otherwise the existing suffix array becomes the first segment of a
+        SegmentedSuffixArray and appended text is indexed incrementally,
+        so "sa" queries keep covering the whole text. The suffix tree and
+        FM-index are dropped and rebuilt on their next use.
+
+        Appending to a memoryview / mmap text copies it into bytes.
+        """
+        if not chunk:
+            return
+        chunk = self._coerce(chunk)
+
+        if self._segments is None and self._suffix_array is not None:
+            text = self.text
+            if isinstance(self._text, mmap.mmap):
+                text = bytes(text)
+            self._segments = SegmentedSuffixArray(
+                text,
+                buffer_size=self._append_buffer_size,
+                suffix_array=self._suffix_array,
+                lcp_array=self._lcp_array,
+                lcp_lr=self._lcp_lr,
+            )
+            self._segments.build_time = self._sa_build_time or 0.0
+            self._suffix_array = None
+            self._lcp_array = None
+            self._lcp_lr = None
+            self._text = None
+
+        if self._segments is not None:
+            self._segments.append(chunk)
+        else:
+            self._pending_chunks.append(chunk)
+        if self._alphabet is not None:
+            self._alphabet.update(chunk)
+
+        self._suffix_tree = None
+        self._tree_build_time = None
+        self._fm_index = None
+        self._fm_build_time = None
+
+    @property
+    def segments(self) -> Optional[SegmentedSuffixArray]:
+        return self._segments
+
+    def _merge_segments(self) -> None:
+        """
+        Collapse an appended (segmented) index into one suffix array.
+        """
+        if self._segments is not None:
+            start = time.perf_counter()
+            self._suffix_array, self._lcp_array, self._lcp_lr = self._segments.merged()
+            self._sa_build_time = self._segments.build_time + time.perf_counter() - start
+            self._text = self._segments.text
+            self._segments = None
+
     def _ensure_suffix_array(self) -> None:
-        if self._suffix_array is None:
+        if self._segments is not None:
+            self._sa_build_time = self._segments.build_time
+        elif self._suffix_array is None:
             start = time.perf_counter()
             self._suffix_array = build_suffix_array(self.text)
             self._lcp_array = build_lcp_array(self.text, self._suffix_array)
+            self._lcp_lr = build_lcp_lr(self._lcp_array)
             self._sa_build_time = time.perf_counter() - start
 
+    def save_index(self, path: str) -> None:
+        """
+        Build the suffix array / LCP index if needed and write it to path.
+        """
+        self._ensure_single_suffix_array()
+        save_suffix_index(path, self.text, self._suffix_array, self._lcp_array, self._lcp_lr)
+
+    @classmethod
+    def load_index(cls, path: str) -> "StringSearchEngine":
+        """
+        Create an engine from an index file written by save_index.
+
+        The suffix, LCP and LCP-LR arrays are memory-mapped rather than
+        rebuilt, so "sa" queries are available immediately. A binary index
+        is searched in place through a view of the mapped text.
+        """
+        start = time.perf_counter()
+        text, suffix_array, lcp_array, lcp_lr, mm = load_suffix_index(path)
+        engine = cls(text)
+        engine._suffix_array = suffix_array
+        engine._lcp_array = lcp_array
+        engine._lcp_lr = lcp_lr
+        engine._index_mmap = mm
+        engine._sa_build_time = time.perf_counter() - start
+        return engine
+
     def _ensure_suffix_tree(self) -> None:
         if self._suffix_tree is None:
             start = time.perf_counter()
             self._suffix_tree = CompressedSuffixTree(self.text)
             self._tree_build_time = time.perf_counter() - start
 
-    def find(self, pattern: str, method: str = "kmp") -> Dict[str, Any]:
+    def _ensure_fm_index(self) -> None:
+        if self._fm_index is None:
+            start = time.perf_counter()
+            self._fm_index = FMIndex(self.text, suffix_array=self._suffix_array)
+            self._fm_build_time = time.perf_counter() - start
+
+    @property
+    def cost_model(self) -> CostModel:
+        """
+        Cost model used by method="auto", calibrated on first use by
+        timing every method on a sample of the text.
+        """
+        if self._cost_model is None:
+            self._cost_model = CostModel.calibrate(self.text)
+        return self._cost_model
+
+    def choose_method(self, pattern: str) -> str:
+        """
+        Return the method "auto" would use for pattern right now.
+
+        Scans (kmp / rk) are used until the estimated cost of the queries
+        seen so far would have paid for a suffix array; once an index
+        exists, it is used whenever it is cheaper than a scan.
+        """
+        if self._alphabet is None:
+            self._alphabet = set(self.text)
+
+        built = []
+        if self._suffix_array is not None or self._segments is not None:
+            built.append("sa")
+        if self._suffix_tree is not None:
+            built.append("tree")
+        if self._fm_index is not None:
+            built.append("fm")
+
+        return self.cost_model.choose(
+            self._text_length(), len(pattern), len(self._alphabet), self._queries_seen, built
+        )
+
+    def _resolve_method(self, method: str, pattern: str) -> str:
         method = method.lower()
+        if method == "auto":
+            method = self.choose_method(pattern)
+        self._queries_seen += 1
+        return method
+
+    def find(self, pattern: str, method: str = "kmp") -> Dict[str, Any]:
+        method = self._resolve_method(method, pattern)
+        query = self._coerce(pattern)
         preprocessing_time = 0.0
 
         if method == "kmp":
             start = time.perf_counter()
-            matches = kmp_search_all(self.text, pattern)
+            matches = kmp_search_all(self.text, query)
             search_time = time.perf_counter() - start
 
         elif method == "rk":
             start = time.perf_counter()
-            matches = rabin_karp_search_all(self.text, pattern)
+            stats = rabin_karp_search_stats(self.text, query)
             search_time = time.perf_counter() - start
+            result = self._make_result(method, pattern, stats["matches"], search_time, 0.0)
+            result["hash_collisions"] = stats["collisions"]
+            return result
 
         elif method == "sa":
             self._ensure_suffix_array()
             preprocessing_time = self._sa_build_time or 0.0
             start = time.perf_counter()
-            matches = suffix_array_search(self.text, pattern, self._suffix_array)
+            if self._segments is not None:
+                matches = self._segments.search(query)
+            else:
+                matches = suffix_array_search(self.text, query, self._suffix_array, self._lcp_lr)
             search_time = time.perf_counter() - start
 
         elif method == "tree":
             self._ensure_suffix_tree()
             preprocessing_time = self._tree_build_time or 0.0
             start = time.perf_counter()
-            matches = self._suffix_tree.search(pattern)
+            matches = self._suffix_tree.search(query)
+            search_time = time.perf_counter() - start
+
+        elif method == "fm":
+            self._ensure_fm_index()
+            preprocessing_time = self._fm_build_time or 0.0
+            start = time.perf_counter()
+            matches = self._fm_index.locate(query)
+            search_time = time.perf_counter() - start
+
+        elif method == "ac":
+            start = time.perf_counter()
+            automaton = AhoCorasick([query])
+            preprocessing_time = time.perf_counter() - start
+            start = time.perf_counter()
+            matches = automaton.search(self.text)[query]
             search_time = time.perf_counter() - start
 
         else:
-            raise ValueError("method must be one of: 'kmp', 'rk', 'sa', 'tree'")
+            raise ValueError(_METHOD_ERROR)
+
+        return self._make_result(method, pattern, matches, search_time, preprocessing_time)
+
+    def parallel_find(
+        self,
+        pattern: str,
+        workers: Optional[int] = None,
+        method: str = "kmp",
+        min_shard_size: int = MIN_SHARD_SIZE,
+    ) -> Dict[str, Any]:
+        """
+        Scan the text with a pool of worker processes.
+
+        The text is split into overlapping shards that workers read from
+        shared memory. Texts shorter than min_shard_size per worker are
+        scanned in-process.
+
+        Args:
+            pattern: pattern to find
+            workers: number of processes (default: os.cpu_count())
+            method: "kmp" or "rk"
+            min_shard_size: smallest shard worth a separate process
+
+        Returns:
+            search result dictionary with matches in increasing order
+        """
+        method = method.lower()
+        start = time.perf_counter()
+        matches = parallel_search_all(
+            self.text, pattern, method=method, workers=workers, min_shard_size=min_shard_size
+        )
+        search_time = time.perf_counter() - start
+        return self._make_result(method, pattern, matches, search_time, 0.0)
+
+    def count(self, pattern: str, method: str = "sa") -> int:
+        """
+        Return the number of occurrences of pattern without building a
+        match list.
+
+        Index methods answer from the index directly: the SA interval width
+        ("sa"), the cached subtree leaf count ("tree") or the backward-search
+        interval ("fm"). Scanning methods count matches as they are found.
+        """
+        method = self._resolve_method(method, pattern)
+        pattern = self._coerce(pattern)
+        if len(pattern) == 0:
+            if method not in _METHODS:
+                raise ValueError(_METHOD_ERROR)
+            return self._text_length() + 1
+
+        if method == "sa":
+            self._ensure_suffix_array()
+            if self._segments is not None:
+                return self._segments.count(pattern)
+            lo, hi = suffix_array_range(self.text, pattern, self._suffix_array, self._lcp_lr)
+            return hi - lo
+        if method == "tree":
+            self._ensure_suffix_tree()
+            return self._suffix_tree.count(pattern)
+        if method == "fm":
+            self._ensure_fm_index()
+            return self._fm_index.count(pattern)
+
+        return sum(1 for _ in self._iter_matches(pattern, method))
+
+    def iter_matches(
+        self,
+        pattern: str,
+        method: str = "kmp",
+        limit: Optional[int] = None,
+    ) -> Iterator[int]:
+        """
+        Lazily yield match starting indices, stopping after limit hits.
+
+        Scanning methods ("kmp", "rk", "ac") yield matches in text order.
+        Index methods ("sa", "tree", "fm") yield them in index order, which
+        is not sorted by position.
+        """
+        method = self._resolve_method(method, pattern)
+        matches = self._iter_matches(self._coerce(pattern), method)
+        if limit is not None:
+            matches = islice(matches, limit)
+        return matches
+
+    def _iter_matches(self, pattern: str, method: str) -> Iterator[int]:
+        if method == "kmp":
+            matches = kmp_search_stream(self.text, pattern)
+        elif method == "rk":
+            matches = rabin_karp_search_stream(self.text, pattern)
+        elif method == "ac":
+            if len(pattern) == 0:
+                matches = iter(range(self._text_length() + 1))
+            else:
+                automaton = AhoCorasick([pattern])
+                matches = (start for start, _ in automaton.iter_matches(self.text))
+        elif method == "sa":
+            self._ensure_suffix_array()
+            if len(pattern) == 0:
+                matches = iter(range(self._text_length() + 1))
+            elif self._segments is not None:
+                matches = iter(self._segments.search(pattern))
+            else:
+                lo, hi = suffix_array_range(self.text, pattern, self._suffix_array, self._lcp_lr)
+                matches = (self._suffix_array[row] for row in range(lo, hi))
+        elif method == "tree":
+            self._ensure_suffix_tree()
+            matches = self._suffix_tree.iter_search(pattern)
+        elif method == "fm":
+            self._ensure_fm_index()
+            matches = self._fm_index.iter_locate(pattern)
+        else:
+            raise ValueError(_METHOD_ERROR)
+        return matches
+
+    def find_approx(self, pattern: str, k: int, metric: str = "hamming") -> Dict[str, Any]:
+        """
+        Find approximate occurrences of pattern with at most k errors.
+
+        Args:
+            pattern: non-empty pattern
+            k: error budget
+            metric: "hamming" (mismatches only, Bitap) or "edit"
+                (insertions/deletions/substitutions, Myers' bit-vector)
+
+        Returns:
+            result dictionary; "matches" holds start indices for Hamming
+            search and inclusive end indices for edit-distance search (see
+            "position"), with the error count of each in "distances"
+        """
+        metric = metric.lower()
+        query = self._coerce(pattern)
+        start = time.perf_counter()
+        if metric == "hamming":
+            method, position = "bitap", "start"
+            hits = bitap_hamming_search(self.text, query, k)
+        elif metric == "edit":
+            method, position = "myers", "end"
+            hits = myers_edit_search(self.text, query, k)
+        else:
+            raise ValueError("metric must be one of: 'hamming', 'edit'")
+        search_time = time.perf_counter() - start
+
+        return {
+            "method": method,
+            "pattern": pattern,
+            "k": k,
+            "position": position,
+            "matches": [index for index, _ in hits],
+            "distances": [distance for _, distance in hits],
+            "match_count": len(hits),
+            "search_time_sec": search_time,
+            "preprocessing_time_sec": 0.0,
+        }
+
+    def find_many(
+        self,
+        patterns: Union[Iterable[str], AhoCorasick],
+        method: str = "ac",
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Search for multiple patterns.
+
+        With method="ac" every pattern is matched in a single scan of the
+        text. A prebuilt AhoCorasick automaton may be passed instead of a
+        pattern list to reuse it across texts.
+        """
+        method = method.lower()
+
+        if method != "ac":
+            if isinstance(patterns, AhoCorasick):
+                patterns = patterns.patterns
+            return {pattern: self.find(pattern, method=method) for pattern in patterns}
+
+        preprocessing_time = 0.0
+        if isinstance(patterns, AhoCorasick):
+            automaton = patterns
+            queries = {pattern: pattern for pattern in automaton.patterns}
+        else:
+            queries = {pattern: self._coerce(pattern) for pattern in patterns}
+            start = time.perf_counter()
+            automaton = AhoCorasick(queries.values())
+            preprocessing_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        all_matches = automaton.search(self.text)
+        search_time = time.perf_counter() - start
+
+        return {
+            pattern: self._make_result(
+                method, pattern, all_matches[query], search_time, preprocessing_time
+            )
+            for pattern, query in queries.items()
+        }
+
+    def find_batch(self, patterns: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Answer many queries from the suffix array index.
+
+        Queries are deduplicated and answered with the LCP-LR accelerated
+        binary search (see suffix_array_search_batch).
+        """
+        self._ensure_suffix_array()
+        preprocessing_time = self._sa_build_time or 0.0
+
+        start = time.perf_counter()
+        if self._segments is not None:
+            all_matches = {
+                pattern: self._segments.search(self._coerce(pattern))
+                for pattern in patterns
+            }
+        else:
+            all_matches = suffix_array_search_batch(
+                self.text, patterns, self._suffix_array, self._lcp_lr
+            )
+        search_time = time.perf_counter() - start
 
+        return {
+            pattern: self._make_result("sa", pattern, matches, search_time, preprocessing_time)
+            for pattern, matches in all_matches.items()
+        }
+
+    def _ensure_single_suffix_array(self) -> None:
+        self._merge_segments()
+        self._ensure_suffix_array()
+
+    def longest_repeated_substring(self):
+        """
+        Return one longest substring occurring at least twice, from the
+        suffix array + LCP index.
+        """
+        self._ensure_single_suffix_array()
+        return longest_repeated_substring(self.text, self._suffix_array, self._lcp_array)
+
+    def count_distinct_substrings(self) -> int:
+        """
+        Return the number of distinct non-empty substrings of the text.
+        """
+        self._ensure_single_suffix_array()
+        return count_distinct_substrings(self.text, self._lcp_array)
+
+    def most_frequent_repeats(self, k: int = 10, min_length: int = 1) -> List[Tuple[Any, int]]:
+        """
+        Return up to k (substring, count) pairs for the most frequent
+        repeated substrings of length >= min_length.
+        """
+        self._ensure_single_suffix_array()
+        return most_frequent_repeats(
+            self.text, self._suffix_array, self._lcp_array, k=k, min_length=min_length
+        )
+
+    def maximal_repeats(self, min_length: int = 1) -> List[Tuple[Any, int]]:
+        """
+        Return (substring, count) for every maximal repeat of length >= min_length.
+        """
+        self._ensure_single_suffix_array()
+        return maximal_repeats(
+            self.text, self._suffix_array, self._lcp_array, min_length=min_length
+        )
+
+    def _make_result(
+        self,
+        method: str,
+        pattern: str,
+        matches: List[int],
+        search_time: float,
+        preprocessing_time: float,
+    ) -> Dict[str, Any]:
         return {
             "method": method,
             "pattern": pattern,
@@ -78,37 +607,34 @@ class StringSearchEngine:
             "match_count": len(matches),
             "search_time_sec": search_time,
             "preprocessing_time_sec": preprocessing_time,
-            "recommendation": self.recommend(method),
+            "recommendation": METHOD_RECOMMENDATIONS[method],
         }
 
     def recommend(self, method: Optional[str] = None) -> str:
-        recommendations = {
-            "kmp": "KMP is a good choice for deterministic linear-time single-pattern scanning.",
-            "rk": "Rabin-Karp is useful for rolling-hash based matching and large batch-style comparisons.",
-            "sa": "Suffix Arrays are best when the same text will be queried repeatedly after preprocessing.",
-            "tree": "Suffix Trees support very fast substring queries after preprocessing, at the cost of more memory and construction complexity.",
-        }
-
         if method is not None:
             method = method.lower()
-            if method not in recommendations:
-                raise ValueError("method must be one of: 'kmp', 'rk', 'sa', 'tree'")
-            return recommendations[method]
+            if method not in METHOD_RECOMMENDATIONS:
+                raise ValueError(_METHOD_ERROR)
+            return METHOD_RECOMMENDATIONS[method]
 
         return (
             "Use KMP for reliable one-off exact matching, Rabin-Karp for hash-based search, "
-            "Suffix Arrays for repeated indexed queries, and Suffix Trees for fast substring lookup "
-            "when preprocessing cost is acceptable."
+            "Suffix Arrays for repeated indexed queries, Suffix Trees for fast substring lookup "
+            "when preprocessing cost is acceptable, and Aho-Corasick for large pattern sets."
         )
 
     @property
-    def suffix_array(self) -> Optional[List[int]]:
+    def suffix_array(self) -> Optional[Sequence[int]]:
         return self._suffix_array
 
     @property
-    def lcp_array(self) -> Optional[List[int]]:
+    def lcp_array(self) -> Optional[Sequence[int]]:
         return self._lcp_array
 
     @property
     def suffix_tree(self) -> Optional[CompressedSuffixTree]:
-        return self._suffix_tree
\ No newline at end of file
+        return self._suffix_tree
+
+    @property
+    def fm_index(self) -> Optional[FMIndex]:
+        return self._fm_index
\ No newline at end of file
@@ -0,0 +1,234 @@
+"""
+Appendable suffix array index made of log-structured segments.
+
+Appended text first collects in an unindexed tail buffer, which queries
+scan with KMP. Once the tail reaches buffer_size it is sealed into a
+segment with its own suffix array, LCP and LCP-LR arrays. Adjacent segments
+of similar size are merged (rebuilt with SA-IS) like the levels of an
+LSM tree. This keeps O(log n) segments and indexes each character
+O(log n) times in total, instead of rebuilding the whole index on every
+append.
+
+Queries search every segment and the tail. They also check the few
+windows of length 2m - 2 around segment boundaries, so occurrences that
+straddle two segments are found as well.
+"""
+
+import time
+from typing import List, Optional, Sequence, Tuple
+
+from src.strings.kmp import kmp_search_all
+from src.strings.suffix_array import (
+    build_suffix_array,
+    build_lcp_array,
+    build_lcp_lr,
+    suffix_array_range,
+)
+
+DEFAULT_BUFFER_SIZE = 4096
+
+
+def _concat(parts):
+    """
+    Join str or binary parts into one str / bytes object.
+    """
+    if parts and not isinstance(parts[0], str):
+        return b"".join(parts)
+    return "".join(parts)
+
+
+class _Segment:
+    __slots__ = ("offset", "text", "sa", "lcp", "lcp_lr")
+
+    def __init__(self, offset: int, text: str, sa: Sequence[int], lcp: Sequence[int], lcp_lr):
+        self.offset = offset
+        self.text = text
+        self.sa = sa
+        self.lcp = lcp
+        self.lcp_lr = lcp_lr
+
+
+class SegmentedSuffixArray:
+    def __init__(
+        self,
+        text: str = "",
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+        suffix_array: Optional[Sequence[int]] = None,
+        lcp_array: Optional[Sequence[int]] = None,
+        lcp_lr=None,
+    ):
+        """
+        Args:
+            text: initial text
+            buffer_size: tail length at which appended text is indexed
+            suffix_array: optional prebuilt suffix array of text, reused as
+                the first segment (lcp_array must then be given too)
+            lcp_array: LCP array matching suffix_array
+            lcp_lr: optional LCP-LR arrays matching lcp_array
+        """
+        if buffer_size <= 0:
+            raise ValueError("buffer_size must be positive")
+
+        self.buffer_size = buffer_size
+        self.segments: List[_Segment] = []
+        self.build_time = 0.0
+        self._tail: List[str] = []
+        self._tail_length = 0
+        self._length = 0
+
+        if suffix_array is not None:
+            if lcp_array is None:
+                raise ValueError("lcp_array is required with suffix_array")
+            if lcp_lr is None:
+                lcp_lr = build_lcp_lr(lcp_array)
+            self.segments.append(_Segment(0, text, suffix_array, lcp_array, lcp_lr))
+            self._length = len(text)
+        elif text:
+            self.append(text)
+
+    def __len__(self) -> int:
+        return self._length
+
+    @property
+    def text(self) -> str:
+        return _concat([text for _, text in self._parts()])
+
+    @property
+    def segment_bounds(self) -> List[Tuple[int, int]]:
+        """
+        (start, end) of every indexed segment; the tail is not included.
+        """
+        return [(s.offset, s.offset + len(s.text)) for s in self.segments]
+
+    def _tail_text(self) -> str:
+        if len(self._tail) > 1:
+            self._tail = [_concat(self._tail)]
+        return self._tail[0] if self._tail else ""
+
+    def _build_segment(self, offset: int, text: str) -> _Segment:
+        start = time.perf_counter()
+        sa = build_suffix_array(text)
+        lcp = build_lcp_array(text, sa)
+        segment = _Segment(offset, text, sa, lcp, build_lcp_lr(lcp))
+        self.build_time += time.perf_counter() - start
+        return segment
+
+    def append(self, chunk: str) -> None:
+        """
+        Append chunk to the text, indexing the tail once it is large enough.
+        """
+        if not chunk:
+            return
+
+        self._tail.append(chunk)
+        self._tail_length += len(chunk)
+        self._length += len(chunk)
+        if self._tail_length >= self.buffer_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Seal the tail into a segment and merge segments of similar size.
+        """
+        if not self._tail_length:
+            return
+
+        tail = self._tail_text()
+        self._tail = []
+        self._tail_length = 0
+        self.segments.append(self._build_segment(self._length - len(tail), tail))
+
+        segments = self.segments
+        while len(segments) >= 2 and len(segments[-2].text) <= len(segments[-1].text):
+            right = segments.pop()
+            left = segments.pop()
+            segments.append(self._build_segment(left.offset, _concat([left.text, right.text])))
+
+    def merged(self) -> Tuple[Sequence[int], Sequence[int], Tuple[Sequence[int], Sequence[int]]]:
+        """
+        Return (suffix_array, lcp_array, lcp_lr) for the whole text,
+        merging all segments and the tail into one.
+        """
+        if self._tail_length or len(self.segments) > 1:
+            text = self.text
+            self._tail = []
+            self._tail_length = 0
+            self.segments = [self._build_segment(0, text)] if text else []
+
+        if not self.segments:
+            return [], [], ([], [])
+        segment = self.segments[0]
+        return segment.sa, segment.lcp, segment.lcp_lr
+
+    def _parts(self) -> List[Tuple[int, str]]:
+        parts = [(s.offset, s.text) for s in self.segments]
+        if self._tail_length:
+            parts.append((self._length - self._tail_length, self._tail_text()))
+        return parts
+
+    def _boundary_matches(self, pattern: str, parts: List[Tuple[int, str]]) -> List[int]:
+        """
+        Occurrences that start in one part and end in a later one.
+        """
+        m = len(pattern)
+        matches = []
+        if m < 2:
+            return matches
+
+        for i in range(1, len(parts)):
+            boundary = parts[i][0]
+            left_offset, left_text = parts[i - 1]
+            lo = max(left_offset, boundary - m + 1)
+            window = [left_text[lo - left_offset:]]
+
+            needed = m - 1
+            for _, text in parts[i:]:
+                window.append(text[:needed])
+                needed -= len(window[-1])
+                if needed <= 0:
+                    break
+
+            for j in kmp_search_all(_concat(window), pattern):
+                if lo + j < boundary:
+                    matches.append(lo + j)
+
+        return matches
+
+    def search(self, pattern: str) -> List[int]:
+        """
+        Return sorted start indices of pattern across all segments.
+        """
+        if len(pattern) == 0:
+            return list(range(self._length + 1))
+
+        matches = []
+        for segment in self.segments:
+            lo, hi = suffix_array_range(segment.text, pattern, segment.sa, segment.lcp_lr)
+            offset = segment.offset
+            matches.extend(offset + segment.sa[row] for row in range(lo, hi))
+
+        parts = self._parts()
+        if self._tail_length:
+            offset, tail = parts[-1]
+            matches.extend(offset + i for i in kmp_search_all(tail, pattern))
+
+        matches.extend(self._boundary_matches(pattern, parts))
+        matches.sort()
+        return matches
+
+    def count(self, pattern: str) -> int:
+        """
+        Return the number of occurrences of pattern across all segments.
+        """
+        if len(pattern) == 0:
+            return self._length + 1
+
+        total = 0
+        for segment in self.segments:
+            lo, hi = suffix_array_range(segment.text, pattern, segment.sa, segment.lcp_lr)
+            total += hi - lo
+
+        parts = self._parts()
+        if self._tail_length:
+            total += len(kmp_search_all(parts[-1][1], pattern))
+        return total + len(self._boundary_matches(pattern, parts))
@@ -0,0 +1,116 @@
+"""
+Chunked input helpers for streaming string search.
+
+Sources may be:
+- a str / bytes / bytearray / memoryview (treated as a single chunk)
+- a file object (read in fixed-size chunks)
+- an mmap.mmap (viewed in fixed-size chunks from offset 0, whatever its
+  file position)
+- any iterable of str or bytes chunks
+
+Streaming matchers work on integer code units so that str patterns can be
+searched in str chunks and ASCII str or bytes patterns in binary chunks.
+
+In-memory matchers accept bytes, bytearray, memoryview and mmap texts
+directly through as_searchable / coerce_pattern, which avoid decoding or
+copying the text; match offsets are then byte offsets.
+"""
+
+import mmap
+from typing import Iterable, Iterator, List, Union
+
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+Chunk = Union[str, bytes, bytearray, memoryview]
+
+BINARY_TYPES = (bytes, bytearray, memoryview, mmap.mmap)
+
+
+def as_searchable(data):
+    """
+    Return data in a form the in-memory matchers can index without copying.
+
+    str, bytes and bytearray are returned unchanged. mmap objects and other
+    memoryviews become flat memoryviews of unsigned bytes, so indexing and
+    iteration yield integer code units. An mmap cannot be closed while such
+    a view is still referenced, so callers take one per operation and let
+    it go when they return; objects that outlive the call (such as
+    StringSearchEngine) keep the mmap itself instead.
+    """
+    if isinstance(data, mmap.mmap):
+        return memoryview(data)
+    if isinstance(data, memoryview) and (data.format != "B" or data.ndim != 1):
+        return data.cast("B")
+    return data
+
+
+def coerce_pattern(text, pattern):
+    """
+    Express pattern in the same code units as text.
+
+    str patterns are UTF-8 encoded for binary texts, and binary patterns
+    are UTF-8 decoded for str texts. Binary patterns are returned as bytes
+    (patterns are short, so copying them is cheap and keeps them hashable).
+    """
+    if isinstance(text, str):
+        if isinstance(pattern, BINARY_TYPES):
+            return bytes(pattern).decode("utf-8")
+        return pattern
+    if isinstance(pattern, str):
+        return pattern.encode("utf-8")
+    return pattern if isinstance(pattern, bytes) else bytes(pattern)
+
+
+def iter_chunks(source, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Chunk]:
+    """
+    Yield successive non-empty chunks from source.
+
+    Args:
+        source: text, file object, mmap, or iterable of chunks
+        chunk_size: number of characters/bytes per read for file-like sources
+
+    Returns:
+        iterator over chunks
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+
+    if isinstance(source, (str, bytes, bytearray, memoryview)):
+        if len(source):
+            yield source
+        return
+
+    if isinstance(source, mmap.mmap):
+        # Slice a view from offset 0 rather than read(), which would start
+        # at and move the mapping's file position
+        view = memoryview(source)
+        for start in range(0, len(view), chunk_size):
+            yield view[start:start + chunk_size]
+        return
+
+    if hasattr(source, "read"):
+        while True:
+            chunk = source.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+    for chunk in source:
+        if len(chunk):
+            yield chunk
+
+
+def iter_codes(chunk: Chunk) -> Iterable[int]:
+    """
+    Iterate the integer code units of a chunk.
+    """
+    if isinstance(chunk, str):
+        return map(ord, chunk)
+    return as_searchable(chunk)
+
+
+def to_codes(pattern: Chunk) -> List[int]:
+    """
+    Convert a pattern to a list of integer code units.
+    """
+    return list(iter_codes(pattern))
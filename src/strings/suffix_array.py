@@ -2,30 +2,193 @@
 Suffix Array + LCP implementation.
 
 Includes:
-- O(n log n) suffix array construction (sorted suffixes approach)
+- O(n) suffix array construction via SA-IS (induced sorting) over integer arrays
+- O(n^2 log n) reference construction (sorted suffixes approach)
 - Kasai's algorithm for LCP construction
-- binary-search substring lookup over the suffix array
+- binary-search substring lookup over the suffix array, optionally
+  accelerated with Manber-Myers LCP-LR arrays (O(m + log n))
+- batched lookups that reuse search bounds across sorted queries
+- O(n) SA + LCP analytics: longest repeated substring, distinct substring
+  count, most frequent repeats and maximal repeats (via a bottom-up
+  enumeration of lcp-intervals, no suffix tree needed)
 
-This is sufficient for a clean course project implementation and benchmarking.
+The SA-IS builder is the default; the sorted-suffixes builder is kept behind
+``naive=True`` as a simple reference implementation for testing.
+
+Texts may be str or bytes / bytearray / memoryview / mmap; binary texts are
+indexed and searched in place as byte code units.
 """
 
-from typing import List
+import heapq
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from src.strings.streaming import as_searchable, coerce_pattern
+
+
+def _encode_text(text: str) -> Tuple[List[int], int]:
+    """
+    Map characters to dense integer ranks that preserve their ordering.
+
+    Args:
+        text: input string (or bytes-like code units)
+
+    Returns:
+        (encoded values, largest value used)
+    """
+    text = as_searchable(text)
+    alphabet = sorted(set(text))
+    ranks = {ch: i for i, ch in enumerate(alphabet)}
+    return [ranks[ch] for ch in text], max(len(alphabet) - 1, 0)
+
+
+def _sa_is(s: Sequence[int], upper: int) -> List[int]:
+    """
+    SA-IS suffix array construction over integers in [0, upper].
+
+    Suffixes are classified as S/L-type, LMS substrings are sorted by
+    induced sorting, named, and the reduced problem is solved recursively.
+    """
+    n = len(s)
+    if n == 0:
+        return []
+    if n == 1:
+        return [0]
+    if n == 2:
+        return [0, 1] if s[0] < s[1] else [1, 0]
+
+    sa = [0] * n
+    ls = [False] * n
+    for i in range(n - 2, -1, -1):
+        ls[i] = ls[i + 1] if s[i] == s[i + 1] else s[i] < s[i + 1]
+
+    # Bucket boundaries: sum_l[c] is where L-type c starts,
+    # sum_s[c] is where S-type c starts.
+    sum_l = [0] * (upper + 2)
+    sum_s = [0] * (upper + 2)
+    for i in range(n):
+        if not ls[i]:
+            sum_s[s[i]] += 1
+        else:
+            sum_l[s[i] + 1] += 1
+    for c in range(upper + 1):
+        sum_s[c] += sum_l[c]
+        sum_l[c + 1] += sum_s[c]
+
+    def induce(lms: List[int]) -> None:
+        for i in range(n):
+            sa[i] = -1
+
+        buf = sum_s[:]
+        for d in lms:
+            if d == n:
+                continue
+            sa[buf[s[d]]] = d
+            buf[s[d]] += 1
+
+        buf = sum_l[:]
+        sa[buf[s[n - 1]]] = n - 1
+        buf[s[n - 1]] += 1
+        for i in range(n):
+            v = sa[i]
+            if v >= 1 and not ls[v - 1]:
+                sa[buf[s[v - 1]]] = v - 1
+                buf[s[v - 1]] += 1
+
+        buf = sum_l[:]
+        for i in range(n - 1, -1, -1):
+            v = sa[i]
+            if v >= 1 and ls[v - 1]:
+                buf[s[v - 1] + 1] -= 1
+                sa[buf[s[v - 1] + 1]] = v - 1
+
+    lms_map = [-1] * (n + 1)
+    lms = []
+    for i in range(1, n):
+        if not ls[i - 1] and ls[i]:
+            lms_map[i] = len(lms)
+            lms.append(i)
+    m = len(lms)
+
+    induce(lms)
+
+    if m:
+        sorted_lms = [v for v in sa if lms_map[v] != -1]
+        rec_s = [0] * m
+        rec_upper = 0
+        rec_s[lms_map[sorted_lms[0]]] = 0
+
+        for i in range(1, m):
+            left = sorted_lms[i - 1]
+            right = sorted_lms[i]
+            end_l = lms[lms_map[left] + 1] if lms_map[left] + 1 < m else n
+            end_r = lms[lms_map[right] + 1] if lms_map[right] + 1 < m else n
 
+            same = True
+            if end_l - left != end_r - right:
+                same = False
+            else:
+                while left < end_l:
+                    if s[left] != s[right]:
+                        break
+                    left += 1
+                    right += 1
+                if left == n or s[left] != s[right]:
+                    same = False
 
-def build_suffix_array(text: str) -> List[int]:
+            if not same:
+                rec_upper += 1
+            rec_s[lms_map[sorted_lms[i]]] = rec_upper
+
+        rec_sa = _sa_is(rec_s, rec_upper)
+        for i in range(m):
+            sorted_lms[i] = lms[rec_sa[i]]
+        induce(sorted_lms)
+
+    return sa
+
+
+def build_suffix_array_ints(values: Sequence[int], upper: Optional[int] = None) -> List[int]:
     """
-    Build suffix array by sorting suffix start indices.
+    Build suffix array of a sequence of non-negative integers using SA-IS.
+
+    Args:
+        values: integer sequence (e.g. encoded text)
+        upper: largest value that may appear; computed when omitted
+
+    Returns:
+        list of starting indices of suffixes in lexicographic order
+    """
+    if not values:
+        return []
+    if upper is None:
+        upper = max(values)
+    if min(values) < 0:
+        raise ValueError("values must be non-negative integers")
+    return _sa_is(values, upper)
+
+
+def build_suffix_array(text: str, naive: bool = False) -> List[int]:
+    """
+    Build suffix array of text.
 
     Args:
         text: input string
+        naive: use the reference sorted-suffixes builder instead of SA-IS
 
     Returns:
         list of starting indices of suffixes in lexicographic order
     """
-    return sorted(range(len(text)), key=lambda i: text[i:])
+    text = as_searchable(text)
+    if naive:
+        if isinstance(text, memoryview):
+            text = text.tobytes()
+        return sorted(range(len(text)), key=lambda i: text[i:])
 
+    values, upper = _encode_text(text)
+    return build_suffix_array_ints(values, upper)
 
-def build_lcp_array(text: str, suffix_array: List[int]) -> List[int]:
+
+def build_lcp_array(text: str, suffix_array: Sequence[int]) -> List[int]:
     """
     Build LCP array using Kasai's algorithm.
 
@@ -40,6 +203,7 @@ def build_lcp_array(text: str, suffix_array: List[int]) -> List[int]:
     Returns:
         LCP array
     """
+    text = as_searchable(text)
     n = len(text)
     if n == 0:
         return []
@@ -69,54 +233,381 @@ def build_lcp_array(text: str, suffix_array: List[int]) -> List[int]:
     return lcp
 
 
-def suffix_array_search(text: str, pattern: str, suffix_array: List[int]) -> List[int]:
+def build_lcp_lr(lcp_array: Sequence[int]) -> Tuple[List[int], List[int]]:
+    """
+    Build Manber-Myers LCP-LR arrays for accelerated binary search.
+
+    The binary search over the open interval (-1, n) always visits the
+    same midpoints, so each index M is the midpoint of exactly one
+    interval (L, R). Then llcp[M] = lcp(suffix L, suffix M) and
+    rlcp[M] = lcp(suffix M, suffix R), with the out-of-range sentinels
+    L = -1 and R = n contributing 0.
+
+    Args:
+        lcp_array: Kasai LCP array
+
+    Returns:
+        (llcp, rlcp) arrays of length n
+    """
+    n = len(lcp_array)
+    llcp = [0] * n
+    rlcp = [0] * n
+
+    def fill(left: int, right: int) -> int:
+        if right - left == 1:
+            return 0 if left < 0 or right >= n else lcp_array[right]
+        mid = (left + right) // 2
+        llcp[mid] = fill(left, mid)
+        rlcp[mid] = fill(mid, right)
+        return min(llcp[mid], rlcp[mid])
+
+    # Recursion depth is O(log n)
+    fill(-1, n)
+    return llcp, rlcp
+
+
+def _extend_match(text: str, pattern: str, start: int, k: int) -> int:
+    """
+    Extend a known common prefix of length k between pattern and text[start:].
+    """
+    m = len(pattern)
+    n = len(text)
+    while k < m and start + k < n and text[start + k] == pattern[k]:
+        k += 1
+    return k
+
+
+def _goes_right(text: str, pattern: str, start: int, k: int, upper: bool) -> bool:
+    """
+    Decide whether suffix text[start:] sorts at/after pattern given their lcp k.
+
+    For lower bounds a suffix starting with pattern goes right; for upper
+    bounds it goes left.
+    """
+    if k == len(pattern):
+        return not upper
+    if start + k >= len(text):
+        return False
+    return text[start + k] > pattern[k]
+
+
+def _lcp_lr_bound(
+    text: str,
+    pattern: str,
+    suffix_array: Sequence[int],
+    llcp: Sequence[int],
+    rlcp: Sequence[int],
+    upper: bool,
+) -> int:
+    """
+    Binary search with LCP-LR skipping, O(m + log n) character comparisons.
+    """
+    left = -1
+    right = len(suffix_array)
+    l_lcp = 0
+    r_lcp = 0
+
+    while right - left > 1:
+        mid = (left + right) // 2
+
+        if l_lcp >= r_lcp:
+            if llcp[mid] > l_lcp:
+                left = mid
+                continue
+            if llcp[mid] < l_lcp:
+                right = mid
+                r_lcp = llcp[mid]
+                continue
+            k = l_lcp
+        else:
+            if rlcp[mid] > r_lcp:
+                right = mid
+                continue
+            if rlcp[mid] < r_lcp:
+                left = mid
+                l_lcp = rlcp[mid]
+                continue
+            k = r_lcp
+
+        start = suffix_array[mid]
+        k = _extend_match(text, pattern, start, k)
+        if _goes_right(text, pattern, start, k, upper):
+            right = mid
+            r_lcp = k
+        else:
+            left = mid
+            l_lcp = k
+
+    return right
+
+
+def _mlr_bound(
+    text: str,
+    pattern: str,
+    suffix_array: Sequence[int],
+    left: int,
+    right: int,
+    upper: bool,
+) -> int:
+    """
+    Binary search over suffix_array[left:right] skipping min(lcp(L), lcp(R))
+    characters per comparison (no LCP-LR arrays needed).
+    """
+    left -= 1
+    l_lcp = 0
+    r_lcp = 0
+
+    while right - left > 1:
+        mid = (left + right) // 2
+        start = suffix_array[mid]
+        k = _extend_match(text, pattern, start, min(l_lcp, r_lcp))
+        if _goes_right(text, pattern, start, k, upper):
+            right = mid
+            r_lcp = k
+        else:
+            left = mid
+            l_lcp = k
+
+    return right
+
+
+def suffix_array_range(
+    text: str,
+    pattern: str,
+    suffix_array: Sequence[int],
+    lcp_lr: Optional[Tuple[Sequence[int], Sequence[int]]] = None,
+) -> Tuple[int, int]:
+    """
+    Return the half-open suffix array interval [lo, hi) of suffixes
+    starting with pattern.
+
+    Args:
+        text: input text
+        pattern: non-empty pattern to search
+        suffix_array: precomputed suffix array
+        lcp_lr: optional (llcp, rlcp) arrays from build_lcp_lr
+
+    Returns:
+        (lo, hi) interval; hi - lo is the number of occurrences
+    """
+    text = as_searchable(text)
+    pattern = coerce_pattern(text, pattern)
+    if lcp_lr is not None:
+        llcp, rlcp = lcp_lr
+        lo = _lcp_lr_bound(text, pattern, suffix_array, llcp, rlcp, upper=False)
+        hi = _lcp_lr_bound(text, pattern, suffix_array, llcp, rlcp, upper=True)
+    else:
+        n = len(suffix_array)
+        lo = _mlr_bound(text, pattern, suffix_array, 0, n, upper=False)
+        hi = _mlr_bound(text, pattern, suffix_array, lo, n, upper=True)
+    return lo, hi
+
+
+def suffix_array_search(
+    text: str,
+    pattern: str,
+    suffix_array: Sequence[int],
+    lcp_lr: Optional[Tuple[Sequence[int], Sequence[int]]] = None,
+) -> List[int]:
     """
     Search for all occurrences of pattern using binary search over suffix array.
 
+    With lcp_lr (see build_lcp_lr) the search costs O(m + log n) character
+    comparisons; without it, the simpler min(lcp) skip is used.
+
     Args:
         text: input text
         pattern: pattern to search
         suffix_array: precomputed suffix array
+        lcp_lr: optional (llcp, rlcp) arrays
 
     Returns:
         sorted list of match starting indices
     """
-    if pattern == "":
+    if len(pattern) == 0:
         return list(range(len(text) + 1))
 
+    lo, hi = suffix_array_range(text, pattern, suffix_array, lcp_lr)
+    return sorted(suffix_array[lo:hi])
+
+
+def suffix_array_search_batch(
+    text: str,
+    patterns: Iterable[str],
+    suffix_array: Sequence[int],
+    lcp_lr: Optional[Tuple[Sequence[int], Sequence[int]]] = None,
+) -> Dict[str, List[int]]:
+    """
+    Search many patterns against one suffix array.
+
+    Patterns are deduplicated and processed in sorted order. With lcp_lr
+    every query uses the O(m + log n) LCP-LR search; its llcp / rlcp values
+    belong to the midpoints of a search over the whole array, so it cannot
+    also start from the previous bound. Without lcp_lr, lower bounds are
+    monotone in the pattern, so each search starts from the previous
+    pattern's lower bound instead of the full array.
+
+    Args:
+        text: input text
+        patterns: patterns to search
+        suffix_array: precomputed suffix array
+        lcp_lr: optional (llcp, rlcp) arrays from build_lcp_lr
+
+    Returns:
+        dict mapping each distinct pattern to its sorted match indices
+    """
+    text = as_searchable(text)
     n = len(suffix_array)
-    m = len(pattern)
+    results: Dict[str, List[int]] = {}
+    lo = 0
 
-    # Find left boundary
-    left = 0
-    right = n
-    while left < right:
-        mid = (left + right) // 2
-        suffix = text[suffix_array[mid]:suffix_array[mid] + m]
-        if suffix < pattern:
-            left = mid + 1
+    queries = {pattern: coerce_pattern(text, pattern) for pattern in patterns}
+    for pattern, query in sorted(queries.items(), key=lambda item: item[1]):
+        if len(query) == 0:
+            results[pattern] = list(range(len(text) + 1))
+            continue
+        if lcp_lr is not None:
+            lo = _lcp_lr_bound(text, query, suffix_array, lcp_lr[0], lcp_lr[1], upper=False)
+            hi = _lcp_lr_bound(text, query, suffix_array, lcp_lr[0], lcp_lr[1], upper=True)
         else:
-            right = mid
+            lo = _mlr_bound(text, query, suffix_array, lo, n, upper=False)
+            hi = _mlr_bound(text, query, suffix_array, lo, n, upper=True)
+        results[pattern] = sorted(suffix_array[lo:hi])
 
-    start = left
+    return results
 
-    # Find right boundary
-    left = 0
-    right = n
-    while left < right:
-        mid = (left + right) // 2
-        suffix = text[suffix_array[mid]:suffix_array[mid] + m]
-        if suffix <= pattern:
-            left = mid + 1
+
+_NO_LEFT = object()
+_DIVERSE = object()
+
+
+def _substring(text, start: int, length: int):
+    piece = text[start:start + length]
+    return piece.tobytes() if isinstance(piece, memoryview) else piece
+
+
+def _lcp_intervals(
+    text,
+    suffix_array: Sequence[int],
+    lcp_array: Sequence[int],
+) -> Iterator[Tuple[int, int, int, bool]]:
+    """
+    Enumerate the lcp-intervals (internal nodes of the implicit suffix tree)
+    bottom-up in O(n) with a single stack.
+
+    Yields:
+        (lcp value, left bound, right bound inclusive, left-diverse) where
+        left-diverse means the characters preceding the interval's
+        occurrences differ (or one occurrence starts the text)
+    """
+    n = len(suffix_array)
+
+    def leaf_left(row: int):
+        position = suffix_array[row]
+        return _DIVERSE if position == 0 else text[position - 1]
+
+    def combine(a, b):
+        if a is _NO_LEFT:
+            return b
+        if b is _NO_LEFT or a is b or a == b:
+            return a
+        return _DIVERSE
+
+    # Stack entries: [lcp value, left bound, left state]
+    stack = [[0, 0, _NO_LEFT]]
+    for i in range(1, n + 1):
+        h = lcp_array[i] if i < n else 0
+        left = leaf_left(i - 1)
+        lb = i - 1
+        while h < stack[-1][0]:
+            top = stack.pop()
+            left = combine(top[2], left)
+            yield top[0], top[1], i - 1, left is _DIVERSE
+            lb = top[1]
+        if h > stack[-1][0]:
+            stack.append([h, lb, left])
         else:
-            right = mid
+            stack[-1][2] = combine(stack[-1][2], left)
 
-    end = left
 
-    matches = [
-        suffix_array[i]
-        for i in range(start, end)
-        if text[suffix_array[i]:suffix_array[i] + m] == pattern
+def longest_repeated_substring(text, suffix_array: Sequence[int], lcp_array: Sequence[int]):
+    """
+    Return one longest substring occurring at least twice ("" if none).
+
+    The answer is the prefix shared by the adjacent suffixes with the
+    largest LCP value, found in O(n).
+    """
+    best_row = 0
+    best = 0
+    for row, value in enumerate(lcp_array):
+        if value > best:
+            best = value
+            best_row = row
+    text = as_searchable(text)
+    if best == 0:
+        return _substring(text, 0, 0)
+    return _substring(text, suffix_array[best_row], best)
+
+
+def count_distinct_substrings(text, lcp_array: Sequence[int]) -> int:
+    """
+    Count distinct non-empty substrings as n(n+1)/2 - sum(LCP).
+    """
+    n = len(text)
+    return n * (n + 1) // 2 - sum(lcp_array)
+
+
+def most_frequent_repeats(
+    text,
+    suffix_array: Sequence[int],
+    lcp_array: Sequence[int],
+    k: int = 10,
+    min_length: int = 1,
+) -> List[Tuple[Any, int]]:
+    """
+    Return the k most frequent repeated substrings of length >= min_length.
+
+    Each lcp-interval is reported once by its longest string (the shorter
+    strings with the same occurrence count are its prefixes). Ties in
+    count are broken by length, longer first.
+
+    Returns:
+        list of (substring, occurrence count), most frequent first
+    """
+    text = as_searchable(text)
+    candidates = (
+        (rb - lb + 1, h, -suffix_array[lb])
+        for h, lb, rb, _ in _lcp_intervals(text, suffix_array, lcp_array)
+        if h >= min_length
+    )
+    return [
+        (_substring(text, -neg_start, h), count)
+        for count, h, neg_start in heapq.nlargest(k, candidates)
     ]
 
-    return sorted(matches)
\ No newline at end of file
+
+def maximal_repeats(
+    text,
+    suffix_array: Sequence[int],
+    lcp_array: Sequence[int],
+    min_length: int = 1,
+) -> List[Tuple[Any, int]]:
+    """
+    Return every maximal repeat of length >= min_length.
+
+    A maximal repeat occurs at least twice and cannot be extended to the
+    left or right without losing an occurrence: it is an lcp-interval
+    (right-maximal) whose occurrences are not all preceded by the same
+    character (left-maximal).
+
+    Returns:
+        list of (substring, occurrence count), longest first
+    """
+    text = as_searchable(text)
+    repeats = [
+        (h, suffix_array[lb], rb - lb + 1)
+        for h, lb, rb, left_diverse in _lcp_intervals(text, suffix_array, lcp_array)
+        if left_diverse and h >= min_length
+    ]
+    repeats.sort(key=lambda item: (-item[0], item[1]))
+    return [(_substring(text, start, h), count) for h, start, count in repeats]
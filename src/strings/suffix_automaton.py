@@ -0,0 +1,149 @@
+"""
+Suffix automaton (DAWG) of a string.
+
+Implements:
+- online O(n) construction (at most 2n - 1 states)
+- substring membership
+- longest common substring with one or many other strings
+
+States are stored in parallel lists (length, suffix link, transitions,
+first end position) rather than node objects.
+"""
+
+from typing import Dict, List, Sequence, Tuple
+
+
+class SuffixAutomaton:
+    def __init__(self, text: str):
+        self.text = text
+        self.length: List[int] = [0]
+        self.link: List[int] = [-1]
+        self.next: List[Dict[str, int]] = [{}]
+        self.first_end: List[int] = [-1]
+        self._last = 0
+
+        for ch in text:
+            self._extend(ch)
+
+    def _new_state(self, length: int, link: int, transitions: Dict[str, int], first_end: int) -> int:
+        self.length.append(length)
+        self.link.append(link)
+        self.next.append(transitions)
+        self.first_end.append(first_end)
+        return len(self.length) - 1
+
+    def _extend(self, ch: str) -> None:
+        length = self.length
+        link = self.link
+        nxt = self.next
+
+        cur = self._new_state(length[self._last] + 1, -1, {}, length[self._last])
+        p = self._last
+        while p != -1 and ch not in nxt[p]:
+            nxt[p][ch] = cur
+            p = link[p]
+
+        if p == -1:
+            link[cur] = 0
+        else:
+            q = nxt[p][ch]
+            if length[p] + 1 == length[q]:
+                link[cur] = q
+            else:
+                clone = self._new_state(length[p] + 1, link[q], dict(nxt[q]), self.first_end[q])
+                while p != -1 and nxt[p].get(ch) == q:
+                    nxt[p][ch] = clone
+                    p = link[p]
+                link[q] = clone
+                link[cur] = clone
+
+        self._last = cur
+
+    @property
+    def num_states(self) -> int:
+        return len(self.length)
+
+    def contains(self, pattern: str) -> bool:
+        """
+        Return True if pattern is a substring of the text.
+        """
+        state = 0
+        for ch in pattern:
+            state = self.next[state].get(ch, -1)
+            if state == -1:
+                return False
+        return True
+
+    def _match_lengths(self, other: str) -> List[int]:
+        """
+        For each state, the longest suffix of its strings occurring in other.
+        """
+        length = self.length
+        link = self.link
+        nxt = self.next
+
+        best = [0] * len(length)
+        state = 0
+        current = 0
+
+        for ch in other:
+            while state and ch not in nxt[state]:
+                state = link[state]
+                current = length[state]
+            if ch in nxt[state]:
+                state = nxt[state][ch]
+                current += 1
+            else:
+                current = 0
+            if current > best[state]:
+                best[state] = current
+
+        return best
+
+    def _states_by_length_desc(self) -> List[int]:
+        # Counting sort on state length
+        buckets = [0] * (len(self.text) + 2)
+        for value in self.length:
+            buckets[value] += 1
+        for i in range(1, len(buckets)):
+            buckets[i] += buckets[i - 1]
+        order = [0] * len(self.length)
+        for state in range(len(self.length) - 1, -1, -1):
+            buckets[self.length[state]] -= 1
+            order[buckets[self.length[state]]] = state
+        order.reverse()
+        return order
+
+    def longest_common_substring(self, others: Sequence[str]) -> Tuple[int, int]:
+        """
+        Longest substring of the text that occurs in every string of others.
+
+        Args:
+            others: strings to intersect with
+
+        Returns:
+            (end index in text, length); the substring is
+            text[end - length + 1:end + 1], and length is 0 if none exists
+        """
+        length = self.length
+        link = self.link
+        common = list(length)
+        order = self._states_by_length_desc()
+
+        for other in others:
+            best = self._match_lengths(other)
+            # A match reaching a state also reaches its suffix-link parent
+            for state in order:
+                parent = link[state]
+                if parent > 0 and best[state] > best[parent]:
+                    best[parent] = min(best[state], length[parent])
+            for state in range(len(common)):
+                if best[state] < common[state]:
+                    common[state] = best[state]
+
+        best_state = 0
+        for state in range(1, len(common)):
+            if common[state] > common[best_state]:
+                best_state = state
+
+        return self.first_end[best_state], common[best_state]
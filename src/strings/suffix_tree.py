@@ -1,105 +1,214 @@
 """
-Compressed suffix trie / suffix-tree-style structure.
-
-This is the simpler project-acceptable option:
-- compressed trie built from all suffixes
-- supports substring queries
-- prefix matching
+Compressed suffix tree built with Ukkonen's online algorithm.
+
+Features:
+- O(n) construction using suffix links and the active-point technique
+- edge labels stored as (start, end) index pairs into the shared text
+- __slots__ nodes to keep per-node memory small
+- substring queries / prefix matching
+- occurrence counting from cached per-node leaf counts
 - longest repeated substring
 - count distinct substrings
 
-It is not Ukkonen's linear-time suffix tree, but it satisfies the
-compressed-trie option described in the project brief.
+A unique terminal symbol is appended internally so that every suffix ends
+at a leaf; it is never exposed through the public methods.
 """
 
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, Iterator, List, Tuple
+
+from src.strings.streaming import as_searchable, to_codes
+
+_TERMINAL = -1
+_LEAF_END = -1
 
 
 class SuffixTreeNode:
-    def __init__(self):
-        self.children: Dict[str, Tuple[str, "SuffixTreeNode"]] = {}
-        self.suffix_indices: List[int] = []
+    __slots__ = ("start", "end", "children", "link", "suffix_index", "leaf_count")
+
+    def __init__(self, start: int, end: int):
+        self.start = start
+        self.end = end
+        self.children: Dict[int, "SuffixTreeNode"] = {}
+        self.link = None
+        self.suffix_index = -1
+        self.leaf_count = 0
 
 
 class CompressedSuffixTree:
     def __init__(self, text: str):
-        self.text = text
-        self.root = SuffixTreeNode()
-        if text:
-            for i in range(len(text)):
-                self._insert_suffix(text[i:], i)
-
-    def _common_prefix_length(self, a: str, b: str) -> int:
-        length = 0
-        limit = min(len(a), len(b))
-        while length < limit and a[length] == b[length]:
-            length += 1
-        return length
-
-    def _insert_suffix(self, suffix: str, index: int) -> None:
+        text = as_searchable(text)
+        # The tree outlives this call and already holds a code list of the
+        # whole text, so copy views rather than pin an mmap behind them
+        self.text = bytes(text) if isinstance(text, memoryview) else text
+        self._codes: List[int] = to_codes(self.text)
+        self._codes.append(_TERMINAL)
+        self._leaf_end = 0
+        self.root = SuffixTreeNode(-1, -1)
+        self._leaf_counts_ready = False
+        self._build()
+
+    def _edge_end(self, node: SuffixTreeNode) -> int:
+        return self._leaf_end if node.end == _LEAF_END else node.end
+
+    def _build(self) -> None:
+        s = self._codes
+        root = self.root
+        root.link = root
+
+        active_node = root
+        active_edge = 0
+        active_length = 0
+        remaining = 0
+
+        for i, code in enumerate(s):
+            self._leaf_end = i + 1
+            remaining += 1
+            last_new = None
+
+            while remaining > 0:
+                if active_length == 0:
+                    active_edge = i
+
+                edge_key = s[active_edge]
+                nxt = active_node.children.get(edge_key)
+
+                if nxt is None:
+                    leaf = SuffixTreeNode(i, _LEAF_END)
+                    leaf.suffix_index = i - remaining + 1
+                    active_node.children[edge_key] = leaf
+                    if last_new is not None:
+                        last_new.link = active_node
+                        last_new = None
+                else:
+                    edge_len = self._edge_end(nxt) - nxt.start
+                    if active_length >= edge_len:
+                        # Walk down (skip/count trick)
+                        active_edge += edge_len
+                        active_length -= edge_len
+                        active_node = nxt
+                        continue
+
+                    if s[nxt.start + active_length] == code:
+                        # Rule 3: current suffix is already implicit in the tree
+                        if last_new is not None and active_node is not root:
+                            last_new.link = active_node
+                            last_new = None
+                        active_length += 1
+                        break
+
+                    split = SuffixTreeNode(nxt.start, nxt.start + active_length)
+                    split.link = root
+                    active_node.children[edge_key] = split
+
+                    leaf = SuffixTreeNode(i, _LEAF_END)
+                    leaf.suffix_index = i - remaining + 1
+                    split.children[code] = leaf
+
+                    nxt.start += active_length
+                    split.children[s[nxt.start]] = nxt
+
+                    if last_new is not None:
+                        last_new.link = split
+                    last_new = split
+
+                remaining -= 1
+                if active_node is root and active_length > 0:
+                    active_length -= 1
+                    active_edge = i - remaining + 1
+                elif active_node is not root:
+                    active_node = active_node.link
+
+    def _locate(self, pattern: str):
+        """
+        Return the node at or below the end of pattern's path, or None.
+        """
+        s = self._codes
+        codes = to_codes(pattern)
         node = self.root
-        node.suffix_indices.append(index)
-        remaining = suffix
+        i = 0
+        m = len(codes)
+
+        while i < m:
+            child = node.children.get(codes[i])
+            if child is None:
+                return None
+
+            j = child.start
+            end = self._edge_end(child)
+            while j < end and i < m:
+                if s[j] != codes[i]:
+                    return None
+                i += 1
+                j += 1
+            node = child
 
-        while remaining:
-            first_char = remaining[0]
+        return node
 
-            if first_char not in node.children:
-                leaf = SuffixTreeNode()
-                leaf.suffix_indices.append(index)
-                node.children[first_char] = (remaining, leaf)
-                return
+    def _iter_leaf_indices(self, node: SuffixTreeNode) -> Iterator[int]:
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            if current.suffix_index >= 0:
+                yield current.suffix_index
+            else:
+                stack.extend(current.children.values())
+
+    def _ensure_leaf_counts(self) -> None:
+        if self._leaf_counts_ready:
+            return
+
+        # Iterative post-order: children are finished before their parent
+        order = []
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            order.append(node)
+            stack.extend(node.children.values())
+
+        for node in reversed(order):
+            if node.suffix_index >= 0:
+                node.leaf_count = 1
+            else:
+                node.leaf_count = sum(child.leaf_count for child in node.children.values())
 
-            edge_label, child = node.children[first_char]
-            match_len = self._common_prefix_length(remaining, edge_label)
+        self._leaf_counts_ready = True
 
-            if match_len == len(edge_label):
-                node = child
-                node.suffix_indices.append(index)
-                remaining = remaining[match_len:]
-            else:
-                split_node = SuffixTreeNode()
-                split_node.suffix_indices.extend(child.suffix_indices)
-                split_node.suffix_indices.append(index)
+    def count(self, pattern: str) -> int:
+        """
+        Return the number of occurrences of pattern without listing them.
+        """
+        if len(pattern) == 0:
+            return len(self.text) + 1
 
-                old_suffix = edge_label[match_len:]
-                split_node.children[old_suffix[0]] = (old_suffix, child)
+        node = self._locate(pattern)
+        if node is None:
+            return 0
+        self._ensure_leaf_counts()
+        return node.leaf_count
 
-                new_suffix = remaining[match_len:]
-                if new_suffix:
-                    new_leaf = SuffixTreeNode()
-                    new_leaf.suffix_indices.append(index)
-                    split_node.children[new_suffix[0]] = (new_suffix, new_leaf)
+    def iter_search(self, pattern: str) -> Iterator[int]:
+        """
+        Lazily yield start indices where pattern occurs, in tree order.
+        """
+        if len(pattern) == 0:
+            yield from range(len(self.text) + 1)
+            return
 
-                node.children[first_char] = (edge_label[:match_len], split_node)
-                return
+        node = self._locate(pattern)
+        if node is not None:
+            yield from self._iter_leaf_indices(node)
 
     def search(self, pattern: str) -> List[int]:
         """
         Return all start indices where pattern occurs.
         """
-        if pattern == "":
+        if len(pattern) == 0:
             return list(range(len(self.text) + 1))
 
-        node = self.root
-        remaining = pattern
-
-        while remaining:
-            first_char = remaining[0]
-            if first_char not in node.children:
-                return []
-
-            edge_label, child = node.children[first_char]
-            match_len = self._common_prefix_length(remaining, edge_label)
-
-            if match_len == len(remaining):
-                return sorted(set(child.suffix_indices))
-            if match_len < len(edge_label):
-                return []
-            node = child
-            remaining = remaining[match_len:]
-
-        return sorted(set(node.suffix_indices))
+        node = self._locate(pattern)
+        if node is None:
+            return []
+        return sorted(self._iter_leaf_indices(node))
 
     def prefix_search(self, prefix: str) -> List[int]:
         """
@@ -110,48 +219,68 @@ class CompressedSuffixTree:
     def longest_repeated_substring(self) -> str:
         """
         Return one longest repeated substring in the text.
-        """
-        best = ""
-
-        def dfs(node: SuffixTreeNode, path: str):
-            nonlocal best
-            if len(set(node.suffix_indices)) >= 2 and len(path) > len(best):
-                best = path
-
-            for _, (edge_label, child) in node.children.items():
-                dfs(child, path + edge_label)
 
-        dfs(self.root, "")
-        return best
+        This is the path label of the deepest internal node.
+        """
+        best_depth = 0
+        best_end = 0
+        stack = [(self.root, 0)]
+
+        while stack:
+            node, depth = stack.pop()
+            for child in node.children.values():
+                if child.suffix_index >= 0:
+                    continue
+                child_depth = depth + child.end - child.start
+                if child_depth > best_depth:
+                    best_depth = child_depth
+                    best_end = child.end
+                stack.append((child, child_depth))
+
+        return self.text[best_end - best_depth:best_end]
 
     def count_distinct_substrings(self) -> int:
         """
-        Count distinct substrings via sum of edge lengths in compressed trie.
+        Count distinct substrings via sum of edge lengths.
+
+        Every leaf edge ends with the internal terminal symbol, which is
+        excluded from the count.
         """
         total = 0
+        leaves = 0
+        stack = [self.root]
 
-        def dfs(node: SuffixTreeNode):
-            nonlocal total
-            for _, (edge_label, child) in node.children.items():
-                total += len(edge_label)
-                dfs(child)
+        while stack:
+            node = stack.pop()
+            for child in node.children.values():
+                total += self._edge_end(child) - child.start
+                if child.suffix_index >= 0:
+                    leaves += 1
+                else:
+                    stack.append(child)
 
-        dfs(self.root)
-        return total
+        return total - leaves
 
     def edge_list(self) -> List[Tuple[str, str]]:
         """
         Return a simple list of edges for debugging/visualization.
+
+        Edges that consist only of the internal terminal symbol are omitted.
         """
         edges = []
+        n = len(self.text)
+        stack = [(self.root, "root")]
 
-        def dfs(node: SuffixTreeNode, node_name: str):
+        while stack:
+            node, node_name = stack.pop()
             child_counter = 0
-            for _, (edge_label, child) in node.children.items():
+            for child in node.children.values():
+                label = self.text[child.start:min(self._edge_end(child), n)]
+                if not label:
+                    continue
                 child_name = f"{node_name}.{child_counter}"
-                edges.append((node_name, f"{child_name}:{edge_label}"))
-                dfs(child, child_name)
+                edges.append((node_name, f"{child_name}:{label}"))
+                stack.append((child, child_name))
                 child_counter += 1
 
-        dfs(self.root, "root")
-        return edges
\ No newline at end of file
+        return edges
@@ -0,0 +1,39 @@
+import random
+
+from src.strings.aho_corasick import AhoCorasick, aho_corasick_search_all
+from src.strings.kmp import kmp_search_all
+
+
+def test_aho_corasick_classic_example():
+    result = aho_corasick_search_all("ushers", ["he", "she", "his", "hers"])
+    assert result == {"he": [2], "she": [1], "his": [], "hers": [2]}
+
+
+def test_aho_corasick_overlapping_and_nested_patterns():
+    result = aho_corasick_search_all("aaaa", ["a", "aa", "aaa"])
+    assert result["a"] == [0, 1, 2, 3]
+    assert result["aa"] == [0, 1, 2]
+    assert result["aaa"] == [0, 1]
+
+
+def test_aho_corasick_characters_outside_pattern_alphabet():
+    result = aho_corasick_search_all("ab-ab_ab", ["ab"])
+    assert result["ab"] == [0, 3, 6]
+
+
+def test_aho_corasick_reuse_and_agreement_with_kmp():
+    rng = random.Random(11)
+    patterns = ["".join(rng.choice("ACGT") for _ in range(rng.randint(1, 6))) for _ in range(50)]
+    automaton = AhoCorasick(patterns)
+
+    for _ in range(3):
+        text = "".join(rng.choice("ACGT") for _ in range(300))
+        result = automaton.search(text)
+        for pattern in patterns:
+            assert result[pattern] == kmp_search_all(text, pattern)
+
+
+def test_aho_corasick_empty_pattern_and_duplicates():
+    automaton = AhoCorasick(["", "ab", "ab"])
+    assert automaton.patterns == ["", "ab"]
+    assert automaton.search("abc") == {"": [0, 1, 2, 3], "ab": [0]}
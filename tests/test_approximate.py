@@ -0,0 +1,37 @@
+from src.strings.approximate import bitap_hamming_search, myers_edit_search
+
+
+def test_bitap_exact_and_one_mismatch():
+    text = "ACGTACGAACGT"
+    assert bitap_hamming_search(text, "ACGT", 0) == [(0, 0), (8, 0)]
+    assert bitap_hamming_search(text, "ACGT", 1) == [(0, 0), (4, 1), (8, 0)]
+
+
+def test_bitap_long_pattern_beyond_word_size():
+    pattern = "ACGT" * 20
+    text = "TT" + pattern[:40] + "G" + pattern[41:] + "TT"
+    assert bitap_hamming_search(text, pattern, 1) == [(2, 1)]
+    assert bitap_hamming_search(text, pattern, 0) == []
+
+
+def test_myers_edit_distance_insertion_and_deletion():
+    text = "xxACGGTxxACTxx"
+    # ACGGT contains ACGT with one insertion, ACT is ACGT with one deletion
+    ends = {end: distance for end, distance in myers_edit_search(text, "ACGT", 1)}
+    assert ends[6] == 1
+    assert ends[11] == 1
+    assert all(distance <= 1 for distance in ends.values())
+
+
+def test_myers_exact_match_has_zero_distance():
+    assert myers_edit_search("abcabcd", "bcd", 0) == [(6, 0)]
+    assert myers_edit_search("aaaa", "bbb", 2) == []
+
+
+def test_invalid_arguments():
+    for search in (bitap_hamming_search, myers_edit_search):
+        try:
+            search("abc", "", 1)
+            assert False, "Expected ValueError"
+        except ValueError:
+            assert True
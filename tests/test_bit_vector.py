@@ -54,4 +54,56 @@ def test_invalid_bit_vector():
         BitVector([1, 0, 2, 1])
         assert False, "Expected ValueError"
     except ValueError:
-        assert True
\ No newline at end of file
+        assert True
+
+
+def test_bit_vector_matches_brute_force_across_words():
+    import random
+
+    rng = random.Random(21)
+    for n in (0, 63, 64, 65, 511, 512, 513, 2500):
+        bits = [1 if rng.random() < 0.3 else 0 for _ in range(n)]
+        bv = BitVector(bits)
+        assert len(bv) == n
+        assert list(bv) == bits
+
+        ones = 0
+        for i, bit in enumerate(bits):
+            ones += bit
+            assert bv.access(i) == bit
+            assert bv.rank1(i) == ones
+            assert bv.rank0(i) == i + 1 - ones
+
+        one_positions = [i for i, bit in enumerate(bits) if bit]
+        zero_positions = [i for i, bit in enumerate(bits) if not bit]
+        assert [bv.select1(k) for k in range(1, len(one_positions) + 1)] == one_positions
+        assert [bv.select0(k) for k in range(1, len(zero_positions) + 1)] == zero_positions
+        assert bv.select1(len(one_positions) + 1) == -1
+        assert bv.select0(len(zero_positions) + 1) == -1
+
+
+def test_bit_vector_is_word_packed():
+    bv = BitVector([1, 0] * 5000)
+    # Packed bits plus rank/select directories stay well under 2 bits per bit
+    assert bv.size_in_bits < 2 * len(bv)
+
+
+def test_bit_vector_select_on_sparse_intervals():
+    import random
+
+    rng = random.Random(22)
+    # A dense prefix, then ones too far apart for the sampled superblocks
+    # to bracket them closely
+    bits = [1 if rng.random() < 0.5 else 0 for _ in range(5000)]
+    bits += [1 if i % 997 == 0 else 0 for i in range(600000)]
+    bv = BitVector(bits)
+
+    one_positions = [i for i, bit in enumerate(bits) if bit]
+    assert [bv.select1(k) for k in range(1, len(one_positions) + 1)] == one_positions
+    zero_positions = [i for i, bit in enumerate(bits) if not bit]
+    for k in range(1, len(zero_positions) + 1, 331):
+        assert bv.select0(k) == zero_positions[k - 1]
+
+    inverted = BitVector(1 - bit for bit in bits)
+    assert [inverted.select0(k) for k in range(1, len(one_positions) + 1)] == one_positions
+    assert bv.size_in_bits < 2 * len(bits)
@@ -0,0 +1,39 @@
+from src.strings.cost_model import CostModel
+
+
+def test_cost_model_defers_index_until_queries_pay_for_it():
+    model = CostModel({"kmp_scan": 1.0, "rk_scan": 2.0, "sa_build": 10.0, "sa_query": 0.01})
+
+    choices = [model.choose(n=100, m=5, sigma=4, queries_seen=q) for q in range(12)]
+    assert choices[0] == "kmp"
+    assert "sa" in choices
+    first_sa = choices.index("sa")
+    assert all(choice == "kmp" for choice in choices[:first_sa])
+    # 100 chars * 10 per char to build vs 105 * (1 + 1/4) per KMP scan:
+    # break-even on query 8
+    assert first_sa == 7
+
+
+def test_cost_model_prefers_existing_index():
+    model = CostModel()
+    assert model.choose(n=10**6, m=8, sigma=4, queries_seen=0, built=["sa"]) == "sa"
+    assert model.choose(n=10**6, m=8, sigma=300, queries_seen=0, built=["fm"]) == "fm"
+
+
+def test_cost_model_scales_estimates_with_alphabet_size():
+    model = CostModel({"kmp_scan": 1.0, "rk_scan": 1.2, "fm_build": 1.0, "sa_build": 10.0})
+
+    assert model.scan_cost("kmp", 100, 0, sigma=2) > model.scan_cost("kmp", 100, 0, sigma=64)
+    assert model.scan_cost("rk", 100, 0, sigma=2) == model.scan_cost("rk", 100, 0, sigma=64)
+    assert model.build_cost("fm", 64, sigma=4) < model.build_cost("fm", 64, sigma=250)
+    # Binary text: KMP fallbacks make Rabin-Karp the cheaper scan
+    assert model.choose(n=100, m=5, sigma=2, queries_seen=0) == "rk"
+    assert model.choose(n=100, m=5, sigma=26, queries_seen=0) == "kmp"
+
+
+def test_cost_model_calibration_measures_every_method():
+    text = "the quick brown fox jumps over the lazy dog " * 50
+    model = CostModel.calibrate(text, sample_size=1024, repeats=1)
+
+    for key in ("kmp_scan", "rk_scan", "sa_build", "tree_build", "sa_query", "fm_query"):
+        assert model.coefficients[key] > 0
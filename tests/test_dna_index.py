@@ -40,4 +40,40 @@ def test_dna_empty_or_long_pattern():
     dna = DNAIndex("ACGT")
 
     assert dna.pattern_frequency("") == 0
-    assert dna.pattern_frequency("ACGTA") == 0
\ No newline at end of file
+    assert dna.pattern_frequency("ACGTA") == 0
+
+
+def test_dna_pattern_positions():
+    dna = DNAIndex("ACGTACGTAC")
+
+    assert dna.pattern_positions("AC") == [0, 4, 8]
+    assert dna.pattern_positions("TT") == []
+
+
+def test_dna_lowercase_sequence_and_queries():
+    dna = DNAIndex("acgtacgt")
+
+    assert dna.pattern_frequency("ac") == 2
+    assert dna.pattern_frequency("AC") == 2
+    assert dna.pattern_positions("cg") == [1, 5]
+    assert dna.range_count("a", 0, 7) == 2
+    assert dna.range_count("N", 0, 7) == 0
+    assert dna.pattern_frequency("an") == 0
+
+
+def test_dna_rejects_non_acgt_sequence():
+    try:
+        DNAIndex("ACGTN")
+        assert False, "Expected ValueError"
+    except ValueError:
+        assert True
+
+
+def test_dna_wavelet_tree_built_from_packed_codes():
+    dna = DNAIndex("GATTACA")
+    tree = dna.wavelet_tree
+
+    assert tree.alphabet == ["A", "C", "G", "T"]
+    assert [tree.access(i) for i in range(len(tree))] == list("GATTACA")
+    assert tree.top_k(0, 6, 2) == [("A", 3), ("T", 2)]
+    assert dna.kth_smallest(0, 6, 5) == "G"
@@ -1,4 +1,5 @@
 from src.strings.dna_search import DNASearchEngine, validate_dna_sequence
+from src.strings.search_engine import StringSearchEngine
 
 
 def test_validate_dna_sequence_accepts_valid_input():
@@ -26,4 +27,68 @@ def test_dna_search_engine_batch_search():
     results = engine.find_many(["ACG", "CGT"], method="kmp")
 
     assert results["ACG"]["matches"] == [0, 4, 8]
-    assert results["CGT"]["matches"] == [1, 5, 9]
\ No newline at end of file
+    assert results["CGT"]["matches"] == [1, 5, 9]
+
+
+def test_dna_search_engine_batch_search_aho_corasick():
+    engine = DNASearchEngine("ACGTACGTACGT")
+    results = engine.find_many(["acg", "GTA", "TTT"])
+
+    assert results["acg"]["matches"] == [0, 4, 8]
+    assert results["GTA"]["matches"] == [2, 6]
+    assert results["TTT"]["match_count"] == 0
+    assert results["acg"]["method"] == "ac"
+
+
+def test_dna_search_engine_fm_index():
+    engine = DNASearchEngine("ACGTACGTACGT")
+    result = engine.find_gene("cgt", method="fm")
+
+    assert result["matches"] == [1, 5, 9]
+    assert result["method"] == "fm"
+    assert engine.engine.fm_index is not None
+
+
+def test_dna_search_engine_find_approx():
+    engine = DNASearchEngine("ACGTACGAACGT")
+
+    hamming = engine.find_approx("acgt", 1)
+    assert hamming["matches"] == [0, 4, 8]
+    assert hamming["distances"] == [0, 1, 0]
+
+    edit = engine.find_approx("ACGGT", 1, metric="edit")
+    assert edit["position"] == "end"
+    assert 3 in edit["matches"]
+
+
+def test_dna_search_engine_packed_genome():
+    engine = DNASearchEngine("acgtacgt")
+
+    assert engine.packed.nbytes == 2
+    assert engine.genome == "ACGTACGT"
+    assert engine.find_gene("GTA")["matches"] == [2]
+
+
+def test_dna_search_engine_chunked_scans_match_engine():
+    import random
+
+    rng = random.Random(14)
+    genome = "".join(rng.choice("ACGT") for _ in range(500))
+    chunked = DNASearchEngine(genome, chunk_size=37)
+    reference = DNASearchEngine(genome)
+
+    for pattern in ("ACG", "GATTA", "T", genome[100:140]):
+        expected = reference.find_gene(pattern, method="sa")["matches"]
+        assert chunked.find_gene(pattern, method="kmp")["matches"] == expected
+        assert chunked.find_gene(pattern, method="rk")["matches"] == expected
+        assert chunked.find_gene(pattern, method="ac")["matches"] == expected
+
+    many = chunked.find_many(["ACG", "GATTACA", "TT"])
+    assert many["TT"]["matches"] == reference.find_gene("TT", method="sa")["matches"]
+
+    for metric in ("hamming", "edit"):
+        result = chunked.find_approx("ACGTAC", 2, metric=metric)
+        expected = StringSearchEngine(genome).find_approx("ACGTAC", 2, metric=metric)
+        assert result["matches"] == expected["matches"]
+        assert result["distances"] == expected["distances"]
+    assert chunked._engine is None
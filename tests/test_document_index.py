@@ -0,0 +1,42 @@
+import random
+
+from src.strings.document_index import DocumentIndex
+
+
+def test_document_index_lists_documents_and_counts():
+    docs = {"a": "banana bandana", "b": "cabana", "c": "no match here", "d": "ana ana ana ana"}
+    index = DocumentIndex(docs)
+
+    assert index.documents("ana") == ["a", "b", "d"]
+    assert index.count("ana") == 3 + 1 + 4
+    assert index.document_counts("ana") == {"a": 3, "b": 1, "d": 4}
+    assert index.top_k("ana", 2) == [("d", 4), ("a", 3)]
+    assert index.documents("zzz") == []
+
+
+def test_document_index_matches_do_not_cross_documents():
+    index = DocumentIndex(["abc", "def"])
+
+    assert index.documents("cd") == []
+    assert index.search("c") == [(0, 2)]
+    assert index.search("d") == [(1, 0)]
+
+
+def test_document_index_matches_brute_force():
+    random.seed(3)
+    docs = ["".join(random.choice("ab") for _ in range(random.randint(0, 12))) for _ in range(30)]
+    index = DocumentIndex(docs)
+
+    for pattern in ("a", "ab", "bba", "abab"):
+        expected = {i: sum(1 for j in range(len(d)) if d.startswith(pattern, j)) for i, d in enumerate(docs)}
+        expected = {i: c for i, c in expected.items() if c}
+        assert index.document_counts(pattern) == expected
+        assert index.documents(pattern) == sorted(expected)
+
+
+def test_document_index_rejects_separator():
+    try:
+        DocumentIndex(["ok", "bad\x00doc"])
+        assert False, "Expected ValueError for separator in document"
+    except ValueError:
+        assert True
@@ -0,0 +1,37 @@
+import random
+
+from src.strings.fm_index import FMIndex
+from src.strings.kmp import kmp_search_all
+from src.strings.suffix_array import build_suffix_array
+
+
+def test_fm_index_bwt_banana():
+    assert FMIndex("banana").bwt() == "annb$aa"
+
+
+def test_fm_index_count_and_locate():
+    fm = FMIndex("ACGTACGTACGT")
+    assert fm.count("ACG") == 3
+    assert fm.locate("ACG") == [0, 4, 8]
+    assert fm.count("TTT") == 0
+    assert fm.locate("X") == []
+
+
+def test_fm_index_empty_pattern_and_text():
+    assert FMIndex("abc").locate("") == [0, 1, 2, 3]
+    empty = FMIndex("")
+    assert empty.count("a") == 0
+    assert empty.locate("") == [0]
+
+
+def test_fm_index_sampling_rates_agree_with_kmp():
+    rng = random.Random(5)
+    text = "".join(rng.choice("ACGT") for _ in range(400))
+    sa = build_suffix_array(text)
+
+    for sa_rate, occ_rate in ((1, 1), (3, 5), (16, 64), (7, 200)):
+        fm = FMIndex(text, sa_sample_rate=sa_rate, occ_sample_rate=occ_rate, suffix_array=sa)
+        for pattern in ("A", "CG", "TAC", text[100:106]):
+            expected = kmp_search_all(text, pattern)
+            assert fm.count(pattern) == len(expected)
+            assert fm.locate(pattern) == expected
@@ -1,4 +1,4 @@
-from src.strings.kmp import compute_lps, kmp_search, kmp_search_all
+from src.strings.kmp import compute_lps, kmp_search, kmp_search_all, kmp_search_stream
 
 
 def test_compute_lps_basic():
@@ -30,4 +30,34 @@ def test_kmp_empty_pattern():
 
 def test_kmp_no_match():
     assert kmp_search("abcdefgh", "xyz") == -1
-    assert kmp_search_all("abcdefgh", "xyz") == []
\ No newline at end of file
+    assert kmp_search_all("abcdefgh", "xyz") == []
+
+
+def test_kmp_stream_matches_across_chunk_boundaries():
+    chunks = ["aba", "bab", "a", "bab"]
+    text = "".join(chunks)
+    assert list(kmp_search_stream(iter(chunks), "abab")) == kmp_search_all(text, "abab")
+
+
+def test_kmp_stream_file_and_bytes(tmp_path):
+    path = tmp_path / "log.txt"
+    path.write_bytes(b"xxERRORyyERRORzz" * 3)
+
+    with open(path, "rb") as f:
+        matches = list(kmp_search_stream(f, b"ERROR", chunk_size=4))
+
+    assert matches == kmp_search_all("xxERRORyyERRORzz" * 3, "ERROR")
+
+
+def test_kmp_stream_empty_pattern():
+    assert list(kmp_search_stream(["ab", "c"], "")) == [0, 1, 2, 3]
+
+
+def test_kmp_search_all_binary_inputs():
+    data = b"abracadabra caf\xc3\xa9 abra"
+    for text in (data, bytearray(data), memoryview(data)):
+        assert kmp_search_all(text, b"abra") == [0, 7, 18]
+        assert kmp_search_all(text, "abra") == [0, 7, 18]
+        # str patterns are UTF-8 encoded; offsets are byte offsets
+        assert kmp_search_all(text, "é") == [15]
+    assert kmp_search(data, "cad") == 4
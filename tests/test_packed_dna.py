@@ -0,0 +1,47 @@
+from src.strings.packed_dna import PackedDNA
+
+
+def test_packed_dna_round_trip_and_size():
+    genome = "ACGTTGCAAC" * 10 + "GAT"
+    packed = PackedDNA(genome.lower())
+
+    assert len(packed) == len(genome)
+    assert str(packed) == genome
+    assert packed.nbytes == (len(genome) + 3) // 4
+    assert packed == genome
+
+
+def test_packed_dna_indexing_and_slicing():
+    packed = PackedDNA("ACGTACGTA")
+
+    assert packed[0] == "A"
+    assert packed[3] == "T"
+    assert packed[-1] == "A"
+    assert packed[2:7] == "GTACG"
+    assert packed[::2] == "AGAGA"
+    assert list(packed) == list("ACGTACGTA")
+
+
+def test_packed_dna_rejects_invalid_characters():
+    try:
+        PackedDNA("ACGTN")
+        assert False, "Expected ValueError for invalid DNA sequence"
+    except ValueError as e:
+        assert "N" in str(e)
+
+
+def test_packed_dna_kmers():
+    packed = PackedDNA("ACGTA")
+
+    assert list(packed.iter_kmers(3)) == [
+        PackedDNA.encode_kmer("ACG"),
+        PackedDNA.encode_kmer("CGT"),
+        PackedDNA.encode_kmer("GTA"),
+    ]
+    assert packed.kmer_at(1, 3) == PackedDNA.encode_kmer("CGT")
+    assert PackedDNA.encode_kmer("AC") == 0b0001
+
+
+def test_packed_dna_chunks():
+    packed = PackedDNA("ACGT" * 5)
+    assert "".join(packed.iter_chunks(6)) == "ACGT" * 5
@@ -0,0 +1,29 @@
+from src.strings.kmp import kmp_search_all
+from src.strings.parallel_search import parallel_search_all, shard_bounds
+
+
+def test_shard_bounds_cover_every_start_once():
+    n, m = 23, 4
+    bounds = shard_bounds(n, m, 3)
+    starts = [i for lo, hi in bounds for i in range(lo, hi - m + 1)]
+
+    assert starts == list(range(n - m + 1))
+    assert all(hi <= n for _, hi in bounds)
+
+
+def test_parallel_search_matches_across_shard_boundaries():
+    text = "abaab" * 400
+    for method in ("kmp", "rk"):
+        result = parallel_search_all(text, "aaba", method=method, workers=4, min_shard_size=64)
+        assert result == kmp_search_all(text, "aaba")
+
+
+def test_parallel_search_non_ascii_text():
+    text = "héllo wörld " * 50
+    result = parallel_search_all(text, "wörld", workers=2, min_shard_size=16)
+    assert result == kmp_search_all(text, "wörld")
+
+
+def test_parallel_search_small_text_runs_serially():
+    assert parallel_search_all("abcabc", "bc", workers=8) == [1, 4]
+    assert parallel_search_all("abc", "", workers=2) == [0, 1, 2, 3]
@@ -47,4 +47,17 @@ def test_persistent_tree_subrange_queries():
     v1 = pst.update(0, 1, 10)  # [5,10,7,3,2]
 
     assert pst.query(0, 1, 3) == 11
-    assert pst.query(v1, 1, 3) == 20
\ No newline at end of file
+    assert pst.query(v1, 1, 3) == 20
+
+
+def test_persistent_tree_update_many_creates_one_version():
+    arr = [1, 2, 3, 4, 5]
+    pst = PersistentSegmentTree(arr)
+
+    v1 = pst.update_many(0, [(4, 0), (1, 7), (4, 1)])  # [1,7,3,4,1]
+
+    assert v1 == 1
+    assert len(pst.versions) == 2
+    assert pst.query(v1, 0, 4) == 16
+    assert pst.query(v1, 4, 4) == 1
+    assert pst.query(0, 0, 4) == 15
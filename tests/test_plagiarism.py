@@ -1,4 +1,10 @@
-from src.strings.plagiarism import plagiarism_similarity, longest_common_substring
+from src.strings.plagiarism import (
+    plagiarism_similarity,
+    longest_common_substring,
+    longest_common_substring_dp,
+    longest_common_substring_many,
+)
+from src.strings.suffix_automaton import SuffixAutomaton
 
 
 def test_longest_common_substring_basic():
@@ -24,4 +30,33 @@ def test_plagiarism_similarity_partial_overlap():
     result = plagiarism_similarity(text1, text2, shingle_size=2)
 
     assert 0.0 < result["similarity_score"] < 1.0
-    assert len(result["longest_common_substring"]) > 0
\ No newline at end of file
+    assert len(result["longest_common_substring"]) > 0
+
+
+def test_longest_common_substring_matches_dp_length():
+    pairs = [
+        ("abcdxyz", "xyzabcd"),
+        ("zxabcdezy", "yzabcdezx"),
+        ("aaaa", "aa"),
+        ("abc", "def"),
+    ]
+    for text1, text2 in pairs:
+        assert len(longest_common_substring(text1, text2)) == len(longest_common_substring_dp(text1, text2))
+
+
+def test_longest_common_substring_many_documents():
+    docs = [
+        "students copied the introduction paragraph verbatim",
+        "the introduction paragraph was copied",
+        "see the introduction paragraph below",
+    ]
+    assert longest_common_substring_many(docs).strip() == "the introduction paragraph"
+    assert longest_common_substring_many(docs + [""]) == ""
+
+
+def test_suffix_automaton_contains():
+    sam = SuffixAutomaton("banana")
+    assert sam.contains("nan")
+    assert sam.contains("")
+    assert not sam.contains("nab")
+    assert sam.num_states <= 2 * len("banana")
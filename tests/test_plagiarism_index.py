@@ -0,0 +1,84 @@
+from src.strings.plagiarism_index import PlagiarismIndex, kgram_hashes, winnow_fingerprints
+
+
+CORPUS = {
+    "essay_a": "The industrial revolution transformed manufacturing and transport across Europe.",
+    "essay_b": "Photosynthesis converts light energy into chemical energy stored in glucose.",
+    "essay_c": "Rivers shape valleys through erosion, carrying sediment toward the sea.",
+}
+
+
+def build_index():
+    index = PlagiarismIndex(k=5, window=4)
+    index.add_documents(CORPUS.items())
+    return index
+
+
+def test_kgram_hashes_are_rolling_and_deterministic():
+    text = "abcabc"
+    hashes = kgram_hashes(text, 3)
+    assert len(hashes) == 4
+    assert hashes[0] == hashes[3]
+    assert kgram_hashes("ab", 3) == []
+
+
+def test_winnowing_guarantee_for_shared_substrings():
+    shared = "a long enough shared passage"
+    left = winnow_fingerprints("xxxx " + shared + " yyyy", k=5, window=4)
+    right = winnow_fingerprints("zz " + shared + " qqqqqq", k=5, window=4)
+    assert {h for h, _ in left} & {h for h, _ in right}
+
+
+def test_query_ranks_copied_document_first():
+    index = build_index()
+    submission = "As we know, photosynthesis converts light energy into chemical energy stored in glucose!"
+
+    results = index.query(submission, top_k=2)
+
+    assert results[0]["doc_id"] == "essay_b"
+    assert results[0]["containment"] > 0.5
+    assert results[0]["spans"]
+    assert len(results) <= 2
+
+
+def test_query_with_unrelated_text_returns_nothing():
+    index = build_index()
+    assert index.query("zzzzzzzzzzzzzzzzzzzzzz") == []
+
+
+def test_index_save_and_load(tmp_path):
+    index = build_index()
+    path = str(tmp_path / "corpus.json")
+    index.save(path)
+
+    loaded = PlagiarismIndex.load(path)
+    assert len(loaded) == 3
+    submission = CORPUS["essay_c"]
+    assert loaded.query(submission, top_k=1) == index.query(submission, top_k=1)
+
+
+def test_duplicate_document_id_rejected():
+    index = build_index()
+    try:
+        index.add_document("essay_a", "anything")
+        assert False, "Expected ValueError"
+    except ValueError:
+        assert True
+
+
+def test_index_save_and_load_tuple_document_ids(tmp_path):
+    index = PlagiarismIndex(k=5, window=4)
+    index.add_document(("course", 1), CORPUS["essay_a"])
+    index.add_document(("course", 2), CORPUS["essay_b"])
+    path = str(tmp_path / "tuples.json")
+    index.save(path)
+
+    loaded = PlagiarismIndex.load(path)
+    assert loaded.doc_ids == [("course", 1), ("course", 2)]
+    assert loaded.query(CORPUS["essay_b"], top_k=1)[0]["doc_id"] == ("course", 2)
+
+    try:
+        loaded.add_document(("course", 1), "duplicate")
+        assert False, "Expected ValueError"
+    except ValueError:
+        assert True
@@ -1,4 +1,17 @@
-from src.strings.rabin_karp import rolling_hash, rabin_karp_search, rabin_karp_search_all
+import mmap
+import random
+
+import pytest
+
+from src.strings.rabin_karp import (
+    rolling_hash,
+    rabin_karp_search,
+    rabin_karp_search_all,
+    rabin_karp_search_many,
+    rabin_karp_search_stats,
+    rabin_karp_search_stream,
+    window_hashes,
+)
 
 
 def test_rolling_hash_deterministic():
@@ -37,4 +50,127 @@ def test_rabin_karp_handles_collisions_by_verification():
     text = "abracadabra"
     pattern = "cad"
     # Small modulus increases collision chances, but verification should keep result correct
-    assert rabin_karp_search(text, pattern, modulus=5) == 4
\ No newline at end of file
+    assert rabin_karp_search(text, pattern, modulus=5) == 4
+
+
+def test_rabin_karp_stream_matches_across_chunk_boundaries():
+    chunks = ["aa", "a", "aa"]
+    assert list(rabin_karp_search_stream(chunks, "aa", modulus=5)) == [0, 1, 2, 3]
+
+
+def test_rabin_karp_stream_mmap(tmp_path):
+    path = tmp_path / "genome.txt"
+    path.write_bytes(b"ACGTACGTTTACG")
+
+    with open(path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            matches = list(rabin_karp_search_stream(mm, "ACG", chunk_size=5))
+
+    assert matches == [0, 4, 10]
+
+
+def test_stream_search_same_mmap_twice(tmp_path):
+    from src.strings.kmp import kmp_search_stream
+
+    path = tmp_path / "genome.txt"
+    path.write_bytes(b"ACGTACGTTTACG")
+
+    with open(path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            mm.seek(6)
+            first = list(kmp_search_stream(mm, b"ACG", chunk_size=4))
+            second = list(kmp_search_stream(mm, b"ACG", chunk_size=4))
+            third = list(rabin_karp_search_stream(mm, "ACG", chunk_size=4))
+            assert mm.tell() == 6
+
+    assert first == second == third == [0, 4, 10]
+
+
+def test_rabin_karp_default_modulus_avoids_collisions():
+    text = "abcd" * 2000
+    stats = rabin_karp_search_stats(text, "dabcdabx")
+    assert stats["matches"] == []
+    assert stats["collisions"] == 0
+
+
+def test_rabin_karp_stats_counts_small_modulus_collisions():
+    text = "the quick brown fox jumps over the lazy dog " * 20
+    stats = rabin_karp_search_stats(text, "lazy", modulus=7)
+    assert stats["matches"] == rabin_karp_search_all(text, "lazy")
+    assert stats["collisions"] > 0
+    assert stats["hash_hits"] == len(stats["matches"]) + stats["collisions"]
+
+
+def test_rabin_karp_double_hash():
+    text = "abracadabra"
+    assert rabin_karp_search_all(text, "abra", modulus=5, double_hash=True) == [0, 7]
+    assert rabin_karp_search(text, "cad", double_hash=True) == 4
+
+
+def test_rabin_karp_search_many_kmers():
+    text = "ACGTACGTTTACGA"
+    result = rabin_karp_search_many(text, ["ACG", "GTT", "CCC", "ACG"])
+    assert result == {"ACG": [0, 4, 10], "GTT": [6], "CCC": []}
+
+
+def test_rabin_karp_search_many_rejects_mixed_lengths():
+    try:
+        rabin_karp_search_many("abc", ["ab", "abc"])
+        assert False, "Expected ValueError"
+    except ValueError:
+        assert True
+
+
+def test_rabin_karp_search_many_numpy_path():
+    pytest.importorskip("numpy")
+    text = "the cat sat on the mat with the hat"
+    patterns = ["the", "at ", "xyz"]
+    assert rabin_karp_search_many(text, patterns, use_numpy=True) == rabin_karp_search_many(text, patterns)
+
+
+def test_rabin_karp_search_many_binary_text():
+    text = b"ACGTACGTTTACG"
+    expected = {"ACG": [0, 4, 10], b"TTA": [8]}
+    assert rabin_karp_search_many(text, ["ACG", b"TTA"]) == expected
+    assert rabin_karp_search_many(memoryview(text), ["ACG", b"TTA"]) == expected
+
+    pytest.importorskip("numpy")
+    assert rabin_karp_search_many(text, ["ACG", b"TTA"], use_numpy=True) == expected
+
+
+def test_rabin_karp_search_many_numpy_long_windows():
+    pytest.importorskip("numpy")
+    rng = random.Random(12)
+    text = "".join(rng.choice("ab\u00e9\U0001f600") for _ in range(3000))
+    patterns = [text[i:i + 40] for i in (0, 17, 1500, 2960)] + ["a" * 40]
+    assert rabin_karp_search_many(text, patterns, use_numpy=True) == rabin_karp_search_many(text, patterns)
+
+
+def test_rabin_karp_search_many_numpy_falls_back_on_lone_surrogates():
+    pytest.importorskip("numpy")
+    text = "ab\ud800ab\ud800"
+    assert rabin_karp_search_many(text, ["b\ud800", "ab"], use_numpy=True) == {
+        "b\ud800": [1, 4],
+        "ab": [0, 3],
+    }
+
+
+def test_rabin_karp_search_all_mmap_in_place(tmp_path):
+    path = tmp_path / "genome.txt"
+    path.write_bytes(b"ACGTACGTTTACG")
+
+    with open(path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            assert rabin_karp_search_all(mm, "ACG") == [0, 4, 10]
+            assert rabin_karp_search_all(memoryview(mm), b"TTT") == [7]
+            assert rabin_karp_search_stats(mm, b"GT")["matches"] == [2, 6]
+
+
+def test_window_hashes_match_rolling_hash():
+    text = "abracadabra"
+    hashes = window_hashes(text, 4)
+
+    assert len(hashes) == len(text) - 3
+    assert hashes == [rolling_hash(text[i:i + 4]) for i in range(len(hashes))]
+    assert window_hashes(b"abracadabra", 4) == hashes
+    assert window_hashes("abc", 4) == []
@@ -37,4 +37,93 @@ def test_range_query_engine_min_max():
     engine = RangeQueryEngine(arr)
 
     assert engine.range_min(1, 4) == 1
-    assert engine.range_max(1, 4) == 10
\ No newline at end of file
+    assert engine.range_max(1, 4) == 10
+
+
+def test_range_query_engine_min_max_after_updates():
+    import random
+
+    rng = random.Random(23)
+    arr = [rng.randint(0, 100) for _ in range(60)]
+    engine = RangeQueryEngine(arr)
+
+    for step in range(200):
+        left = rng.randint(0, len(arr) - 1)
+        right = rng.randint(left, len(arr) - 1)
+        assert engine.range_min(left, right) == min(arr[left:right + 1])
+        assert engine.range_max(left, right) == max(arr[left:right + 1])
+
+        if step % 3 == 0:
+            index = rng.randint(0, len(arr) - 1)
+            arr[index] = rng.randint(0, 100)
+            engine.point_update(index, arr[index])
+
+
+def test_range_query_engine_min_invalid_range():
+    engine = RangeQueryEngine([3, 1, 2])
+
+    try:
+        engine.range_min(2, 1)
+        assert False, "Expected ValueError"
+    except ValueError:
+        assert True
+
+
+def test_range_query_engine_selected_backends():
+    engine = RangeQueryEngine([1, 3, 5, 7, 9], backends=("fenwick",))
+
+    assert engine.segment_tree is None
+    assert engine.persistent_tree is None
+    assert engine.point_update(2, 10) is None
+    assert engine.range_sum_fenwick(0, 4) == 30
+
+    try:
+        engine.range_sum_segment(0, 4)
+        assert False, "Expected ValueError"
+    except ValueError:
+        assert True
+
+    try:
+        RangeQueryEngine([1, 2], backends=("btree",))
+        assert False, "Expected ValueError"
+    except ValueError:
+        assert True
+
+
+def test_range_query_engine_apply_updates_coalesces_into_one_version():
+    engine = RangeQueryEngine([1, 3, 5, 7, 9])
+
+    version = engine.apply_updates([(2, 10), (0, 4), (2, 6)])  # [4,3,6,7,9]
+
+    assert version == 1
+    assert engine.arr == [4, 3, 6, 7, 9]
+    assert engine.range_sum_segment(0, 4) == 29
+    assert engine.range_sum_fenwick(0, 4) == 29
+    assert engine.time_travel_sum(0, 0, 4) == 25
+    assert engine.time_travel_sum(version, 0, 4) == 29
+    assert engine.range_min(0, 2) == 3
+    assert engine.apply_updates([]) == 1
+
+
+def test_range_query_engine_apply_updates_matches_point_updates():
+    import random
+
+    rng = random.Random(25)
+    arr = [rng.randint(0, 50) for _ in range(40)]
+    batched = RangeQueryEngine(arr)
+    single = RangeQueryEngine(arr)
+    batched.range_max(0, 39)
+
+    for size in (3, 80, 1, 200):
+        updates = [(rng.randrange(len(arr)), rng.randint(0, 50)) for _ in range(size)]
+        version = batched.apply_updates(updates)
+        for index, value in updates:
+            single.point_update(index, value)
+
+        assert batched.arr == single.arr
+        for left, right in [(0, 39), (5, 17), (30, 30)]:
+            expected = sum(single.arr[left:right + 1])
+            assert batched.range_sum_segment(left, right) == expected
+            assert batched.range_sum_fenwick(left, right) == expected
+            assert batched.time_travel_sum(version, left, right) == expected
+            assert batched.range_max(left, right) == max(single.arr[left:right + 1])
@@ -1,3 +1,4 @@
+from src.strings.cost_model import CostModel
 from src.strings.search_engine import StringSearchEngine
 
 
@@ -55,4 +56,241 @@ def test_search_engine_empty_pattern():
 def test_search_engine_recommendation():
     engine = StringSearchEngine("banana")
     rec = engine.recommend("tree")
-    assert "Suffix Trees" in rec
\ No newline at end of file
+    assert "Suffix Trees" in rec
+
+
+def test_search_engine_save_and_load_index(tmp_path):
+    path = str(tmp_path / "banana.idx")
+    engine = StringSearchEngine("banana")
+    engine.save_index(path)
+
+    loaded = StringSearchEngine.load_index(path)
+    assert loaded.text == "banana"
+    assert list(loaded.suffix_array) == [5, 3, 1, 0, 4, 2]
+    assert list(loaded.lcp_array) == [0, 1, 3, 0, 0, 2]
+    assert loaded.find("ana", method="sa")["matches"] == [1, 3]
+
+
+def test_search_engine_save_and_load_binary_index(tmp_path):
+    import mmap
+
+    expected = [0, 13]
+    data = b"to be or not to be"
+    for name, text in (("bytes", data), ("view", memoryview(data))):
+        path = str(tmp_path / f"{name}.idx")
+        StringSearchEngine(text).save_index(path)
+
+        loaded = StringSearchEngine.load_index(path)
+        assert bytes(loaded.text) == data
+        assert loaded.find("to be", method="sa")["matches"] == expected
+        assert loaded.count(b"be", method="sa") == 2
+        assert loaded.find("to be", method="kmp")["matches"] == expected
+
+    path = tmp_path / "corpus.bin"
+    path.write_bytes(data)
+    with open(path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            StringSearchEngine(mm).save_index(str(tmp_path / "mmap.idx"))
+    loaded = StringSearchEngine.load_index(str(tmp_path / "mmap.idx"))
+    assert loaded.find("be", method="sa")["matches"] == [3, 16]
+
+
+def test_search_engine_load_index_maps_lcp_lr(tmp_path):
+    from src.strings.index_file import load_suffix_index
+    from src.strings.suffix_array import build_lcp_lr
+
+    path = str(tmp_path / "mississippi.idx")
+    StringSearchEngine("mississippi").save_index(path)
+
+    _, _, lcp, (llcp, rlcp), _ = load_suffix_index(path)
+    assert isinstance(llcp, memoryview) and isinstance(rlcp, memoryview)
+    assert (list(llcp), list(rlcp)) == build_lcp_lr(list(lcp))
+
+    loaded = StringSearchEngine.load_index(path)
+    batch = loaded.find_batch(["ssi", "issi", "p", "zzz"])
+    assert batch["ssi"]["matches"] == [2, 5]
+    assert batch["issi"]["matches"] == [1, 4]
+    assert batch["p"]["matches"] == [8, 9]
+    assert batch["zzz"]["matches"] == []
+    assert loaded.find("issi", method="sa")["matches"] == [1, 4]
+
+
+def test_load_suffix_index_closes_mapping_on_invalid_files(tmp_path, monkeypatch):
+    import mmap
+
+    from src.strings import index_file
+
+    opened = []
+
+    class RecordingMmap(mmap.mmap):
+        def __init__(self, *args, **kwargs):
+            opened.append(self)
+
+    monkeypatch.setattr(index_file.mmap, "mmap", RecordingMmap)
+
+    path = tmp_path / "banana.idx"
+    StringSearchEngine("banana").save_index(str(path))
+    full = path.read_bytes()
+    for data in (b"hello world, definitely not an index file", full[:-8]):
+        path.write_bytes(data)
+        try:
+            index_file.load_suffix_index(str(path))
+            assert False, "Expected ValueError"
+        except ValueError:
+            assert opened[-1].closed
+
+    assert len(opened) == 2
+
+
+def test_search_engine_load_index_rejects_other_files(tmp_path):
+    path = tmp_path / "not_an_index.bin"
+    path.write_bytes(b"hello world, definitely not an index file")
+    try:
+        StringSearchEngine.load_index(str(path))
+        assert False, "Expected ValueError"
+    except ValueError:
+        assert True
+
+
+def test_search_engine_ac():
+    engine = StringSearchEngine("banana")
+    result = engine.find("ana", method="ac")
+    assert result["matches"] == [1, 3]
+    assert result["method"] == "ac"
+
+
+def test_search_engine_find_many_single_scan():
+    engine = StringSearchEngine("abracadabra")
+    results = engine.find_many(["abra", "bra", "cad", "zzz", ""])
+
+    assert results["abra"]["matches"] == [0, 7]
+    assert results["bra"]["matches"] == [1, 8]
+    assert results["cad"]["matches"] == [4]
+    assert results["zzz"]["matches"] == []
+    assert results[""]["match_count"] == 12
+
+
+def test_search_engine_find_batch():
+    engine = StringSearchEngine("banana")
+    results = engine.find_batch(["ana", "na", "ana", "x"])
+
+    assert set(results) == {"ana", "na", "x"}
+    assert results["ana"]["matches"] == [1, 3]
+    assert results["na"]["matches"] == [2, 4]
+    assert results["x"]["match_count"] == 0
+
+
+def test_search_engine_count_all_methods():
+    engine = StringSearchEngine("abracadabra")
+    for method in ("kmp", "rk", "sa", "tree", "ac", "fm"):
+        assert engine.count("abra", method=method) == 2
+        assert engine.count("a", method=method) == 5
+        assert engine.count("zz", method=method) == 0
+        assert engine.count("", method=method) == 12
+
+
+def test_search_engine_iter_matches_lazy_and_limited():
+    engine = StringSearchEngine("aaaaaaaaaa")
+    assert list(engine.iter_matches("aa", method="kmp", limit=3)) == [0, 1, 2]
+
+    for method in ("kmp", "rk", "sa", "tree", "ac", "fm"):
+        assert sorted(engine.iter_matches("aaa", method=method)) == list(range(8))
+        assert len(list(engine.iter_matches("aaa", method=method, limit=2))) == 2
+
+
+def test_search_engine_count_invalid_method():
+    engine = StringSearchEngine("banana")
+    try:
+        engine.count("a", method="bad")
+        assert False
+    except ValueError:
+        assert True
+
+
+def test_search_engine_rk_reports_collisions():
+    engine = StringSearchEngine("banana")
+    result = engine.find("ana", method="rk")
+    assert result["hash_collisions"] == 0
+
+
+def test_parallel_find_matches_serial_find():
+    text = "the cat sat on the mat " * 200
+    engine = StringSearchEngine(text)
+
+    result = engine.parallel_find("at on", workers=3, min_shard_size=100)
+    assert result["matches"] == engine.find("at on", method="kmp")["matches"]
+    assert result["method"] == "kmp"
+
+
+def test_append_extends_suffix_array_queries():
+    engine = StringSearchEngine("abracadabra", append_buffer_size=4)
+    assert engine.find("abra", method="sa")["matches"] == [0, 7]
+
+    engine.append("cad")
+    engine.append("abracad")
+    text = "abracadabracadabracad"
+
+    assert engine.text == text
+    assert engine.segments is not None
+    assert engine.find("abra", method="sa")["matches"] == [0, 7, 14]
+    assert engine.count("racad", method="sa") == 3
+    assert engine.find("cad", method="tree")["matches"] == [4, 11, 18]
+    assert sorted(engine.iter_matches("bra", method="sa")) == [1, 8, 15]
+
+
+def test_append_keeps_text_in_segments_until_merged():
+    engine = StringSearchEngine(b"abracadabra", append_buffer_size=4)
+    engine.find("abra", method="sa")
+    engine.append("cad")
+    engine.append(b"abracad")
+
+    assert engine.count("abra", method="sa") == 3
+    assert engine.text == engine.segments.text == b"abracadabracadabracad"
+    assert engine.longest_repeated_substring() == b"abracadabracad"
+    assert engine.segments is None
+    assert engine.text == b"abracadabracadabracad"
+    assert engine.find("cad", method="kmp")["matches"] == [4, 11, 18]
+
+
+def test_auto_method_scans_first_then_builds_suffix_array():
+    model = CostModel({"kmp_scan": 1.0, "rk_scan": 2.0, "sa_build": 3.0, "sa_query": 0.1})
+    engine = StringSearchEngine("abracadabra" * 10, cost_model=model)
+
+    methods = [engine.find("abra", method="auto")["method"] for _ in range(4)]
+    assert methods[0] == "kmp"
+    assert methods[-1] == "sa"
+    assert engine.suffix_array is not None
+    assert engine.count("cad", method="auto") == 10
+    assert engine.find("cad", method="auto")["matches"] == engine.find("cad", method="kmp")["matches"]
+
+
+def test_engine_accepts_binary_text(tmp_path):
+    import mmap
+
+    path = tmp_path / "corpus.bin"
+    path.write_bytes(b"to be or not to be")
+
+    with open(path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            engine = StringSearchEngine(mm)
+            for method in ("kmp", "rk", "sa", "tree", "fm", "ac"):
+                result = engine.find("to be", method=method)
+                assert result["matches"] == [0, 13], method
+            assert engine.count(b"be", method="sa") == 2
+            assert engine.find_many(["be", b"or"])["be"]["matches"] == [3, 16]
+            assert engine.find_approx("nut", 1)["matches"] == [9]
+            assert engine.longest_repeated_substring() == b"to be"
+
+    # The engine holds the mmap, not a view of it, so closing was allowed
+    assert mm.closed
+    assert engine.find("be", method="tree")["matches"] == [3, 16]
+
+
+def test_engine_repeat_analytics_without_suffix_tree():
+    engine = StringSearchEngine("banana")
+
+    assert engine.longest_repeated_substring() == "ana"
+    assert engine.count_distinct_substrings() == 15
+    assert engine.most_frequent_repeats(k=1) == [("a", 3)]
+    assert engine.maximal_repeats() == [("ana", 2), ("a", 3)]
+    assert engine.suffix_tree is None
@@ -65,4 +65,75 @@ def test_segment_tree_lazy_edge_cases():
     assert st.query(2, 2) == 11
 
     # query outside update
-    assert st.query(0, 1) == 2
\ No newline at end of file
+    assert st.query(0, 1) == 2
+
+
+def test_segment_tree_point_update():
+    st = SegmentTree([1, 3, 5, 7, 9, 11])
+
+    st.update(1, 10)
+    st.update(5, 0)
+
+    assert st.query(1, 3) == 22
+    assert st.query(0, 5) == 32
+
+
+def test_segment_tree_min_max_gcd():
+    arr = [8, 2, 6, 1, 10, 4]
+
+    assert SegmentTree(arr, "min").query(0, 2) == 2
+    assert SegmentTree(arr, "max").query(2, 5) == 10
+    assert SegmentTree([12, 18, 24, 9], "gcd").query(0, 2) == 6
+
+
+def test_segment_tree_custom_op_keeps_order():
+    st = SegmentTree(list("abcde"), lambda a, b: a + b, "")
+
+    assert st.query(1, 3) == "bcd"
+    st.update(2, "X")
+    st.range_assign(3, 4, "z")
+    assert st.query(0, 4) == "abXzz"
+
+
+def test_segment_tree_range_assign_and_add():
+    st = SegmentTree([5, 1, 4, 2, 3], "min")
+
+    st.range_assign(1, 3, 7)   # [5, 7, 7, 7, 3]
+    st.range_add(0, 2, -4)     # [1, 3, 3, 7, 3]
+    assert st.query(0, 4) == 1
+    assert st.query(1, 3) == 3
+    assert st.query(3, 3) == 7
+
+
+def test_segment_tree_range_add_unsupported_op():
+    st = SegmentTree([4, 6], "gcd")
+
+    try:
+        st.range_add(0, 1, 1)
+        assert False, "Expected ValueError"
+    except ValueError:
+        assert True
+
+
+def test_segment_tree_batches_match_brute_force():
+    import random
+
+    rng = random.Random(24)
+    arr = [rng.randint(-20, 20) for _ in range(37)]
+    st = SegmentTree(arr)
+
+    for _ in range(20):
+        updates = [(rng.randrange(len(arr)), rng.randint(-20, 20)) for _ in range(rng.choice([2, 200]))]
+        st.update_many(updates)
+        for index, value in updates:
+            arr[index] = value
+
+        left = rng.randrange(len(arr))
+        right = rng.randrange(left, len(arr))
+        delta = rng.randint(-5, 5)
+        st.range_add(left, right, delta)
+        for i in range(left, right + 1):
+            arr[i] += delta
+
+        ranges = [sorted((rng.randrange(len(arr)), rng.randrange(len(arr)))) for _ in range(10)]
+        assert st.query_many(ranges) == [sum(arr[l:r + 1]) for l, r in ranges]
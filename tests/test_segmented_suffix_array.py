@@ -0,0 +1,39 @@
+import random
+
+from src.strings.kmp import kmp_search_all
+from src.strings.segmented_suffix_array import SegmentedSuffixArray
+
+
+def test_segmented_suffix_array_matches_across_segments():
+    rng = random.Random(7)
+    index = SegmentedSuffixArray(buffer_size=8)
+    text = ""
+    for _ in range(60):
+        chunk = "".join(rng.choice("ab") for _ in range(rng.randint(1, 6)))
+        index.append(chunk)
+        text += chunk
+
+    assert index.text == text
+    assert len(index.segment_bounds) > 1
+    for pattern in ("a", "ab", "abba", "babab", "aaaaaaaaaaaa"):
+        assert index.search(pattern) == kmp_search_all(text, pattern)
+        assert index.count(pattern) == len(kmp_search_all(text, pattern))
+
+
+def test_segmented_suffix_array_merges_to_geometric_sizes():
+    index = SegmentedSuffixArray(buffer_size=4)
+    for _ in range(7):
+        index.append("abcd")
+
+    sizes = [end - start for start, end in index.segment_bounds]
+    assert sizes == [16, 8, 4]
+
+
+def test_segmented_suffix_array_merged_index():
+    index = SegmentedSuffixArray("banana", buffer_size=2)
+    index.append("band")
+    sa, lcp, _ = index.merged()
+
+    text = "bananaband"
+    assert list(sa) == sorted(range(len(text)), key=lambda i: text[i:])
+    assert index.segment_bounds == [(0, len(text))]
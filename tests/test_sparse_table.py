@@ -0,0 +1,51 @@
+from math import gcd
+
+from advds.trees.sparse_table import SparseTable
+
+
+def test_sparse_table_min_max():
+    arr = [8, 2, 6, 1, 10, 4, 7]
+    mins = SparseTable(arr)
+    maxs = SparseTable(arr, op=max)
+
+    assert mins.query(0, 6) == 1
+    assert mins.query(4, 6) == 4
+    assert mins.query(2, 2) == 6
+    assert maxs.query(0, 3) == 8
+    assert maxs.query(5, 6) == 7
+
+
+def test_sparse_table_matches_brute_force():
+    import random
+
+    rng = random.Random(23)
+    arr = [rng.randint(-50, 50) for _ in range(130)]
+    table = SparseTable(arr)
+
+    for left in range(len(arr)):
+        for right in range(left, len(arr)):
+            assert table.query(left, right) == min(arr[left:right + 1])
+
+
+def test_sparse_table_gcd():
+    table = SparseTable([12, 18, 24, 9, 27], op=gcd)
+
+    assert table.query(0, 2) == 6
+    assert table.query(3, 4) == 9
+    assert table.query(0, 4) == 3
+
+
+def test_sparse_table_invalid_range():
+    table = SparseTable([1, 2, 3])
+
+    try:
+        table.query(2, 1)
+        assert False, "Expected ValueError"
+    except ValueError:
+        assert True
+
+    try:
+        table.query(0, 3)
+        assert False, "Expected ValueError"
+    except ValueError:
+        assert True
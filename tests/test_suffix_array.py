@@ -1,5 +1,15 @@
+import random
+
 from src.strings.suffix_array import (
     build_suffix_array,
+    count_distinct_substrings,
+    longest_repeated_substring,
+    maximal_repeats,
+    most_frequent_repeats,
+    build_suffix_array_ints,
+    build_lcp_lr,
+    suffix_array_range,
+    suffix_array_search_batch,
     build_lcp_array,
     suffix_array_search,
 )
@@ -51,4 +61,99 @@ def test_suffix_array_empty_text():
     sa = build_suffix_array(text)
     lcp = build_lcp_array(text, sa)
     assert sa == []
-    assert lcp == []
\ No newline at end of file
+    assert lcp == []
+
+
+def test_sais_matches_naive_builder():
+    rng = random.Random(7)
+    for _ in range(200):
+        length = rng.randint(0, 40)
+        text = "".join(rng.choice("abc") for _ in range(length))
+        assert build_suffix_array(text) == build_suffix_array(text, naive=True)
+
+
+def test_sais_repetitive_text():
+    text = "aaaaaaaaaa"
+    assert build_suffix_array(text) == list(range(9, -1, -1))
+    text = "mississippi"
+    assert build_suffix_array(text) == build_suffix_array(text, naive=True)
+
+
+def test_build_suffix_array_ints():
+    assert build_suffix_array_ints([1, 0, 2, 0, 2, 0]) == [5, 3, 1, 0, 4, 2]
+    assert build_suffix_array_ints([]) == []
+
+
+def test_suffix_array_search_with_lcp_lr_matches_plain_search():
+    rng = random.Random(9)
+    text = "".join(rng.choice("ab") for _ in range(300))
+    sa = build_suffix_array(text)
+    lcp_lr = build_lcp_lr(build_lcp_array(text, sa))
+
+    for length in (1, 3, 6, 10):
+        for _ in range(10):
+            start = rng.randint(0, len(text) - length)
+            pattern = text[start:start + length]
+            assert suffix_array_search(text, pattern, sa, lcp_lr) == suffix_array_search(text, pattern, sa)
+    assert suffix_array_search(text, "c", sa, lcp_lr) == []
+
+
+def test_suffix_array_range_counts():
+    text = "banana"
+    sa = build_suffix_array(text)
+    lcp_lr = build_lcp_lr(build_lcp_array(text, sa))
+    lo, hi = suffix_array_range(text, "an", sa, lcp_lr)
+    assert hi - lo == 2
+    assert sorted(sa[lo:hi]) == [1, 3]
+
+
+def test_suffix_array_search_batch():
+    text = "abracadabra"
+    sa = build_suffix_array(text)
+    results = suffix_array_search_batch(text, ["bra", "abra", "a", "zz", "abra"], sa)
+    assert results == {"a": [0, 3, 5, 7, 10], "abra": [0, 7], "bra": [1, 8], "zz": []}
+
+
+def test_suffix_array_binary_text(tmp_path):
+    import mmap
+
+    data = b"mississippi"
+    path = tmp_path / "text.bin"
+    path.write_bytes(data)
+
+    expected = build_suffix_array("mississippi")
+    assert build_suffix_array(data) == expected
+    assert build_lcp_array(memoryview(data), expected) == build_lcp_array("mississippi", expected)
+
+    with open(path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            sa = build_suffix_array(mm)
+            assert sa == expected
+            assert suffix_array_search(mm, "ssi", sa) == [2, 5]
+            assert suffix_array_search(mm, b"ppi", sa) == [8]
+
+
+def test_suffix_array_repeat_analytics():
+    text = "abracadabra"
+    sa = build_suffix_array(text)
+    lcp = build_lcp_array(text, sa)
+
+    assert longest_repeated_substring(text, sa, lcp) == "abra"
+    assert count_distinct_substrings(text, lcp) == len(
+        {text[i:j] for i in range(len(text)) for j in range(i + 1, len(text) + 1)}
+    )
+    assert most_frequent_repeats(text, sa, lcp, k=2) == [("a", 5), ("abra", 2)]
+    assert maximal_repeats(text, sa, lcp) == [("abra", 2), ("a", 5)]
+    assert maximal_repeats(text, sa, lcp, min_length=2) == [("abra", 2)]
+
+
+def test_maximal_repeats_excludes_left_extendable():
+    text = "xabcyabcz"
+    sa = build_suffix_array(text)
+    lcp = build_lcp_array(text, sa)
+
+    # "bc" and "c" always follow "a", so only "abc" is maximal
+    assert maximal_repeats(text, sa, lcp) == [("abc", 2)]
+
+    sa = build_suffix_array("abcd")
+    assert longest_repeated_substring("abcd", sa, build_lcp_array("abcd", sa)) == ""
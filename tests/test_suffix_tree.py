@@ -1,3 +1,6 @@
+import random
+
+from src.strings.kmp import kmp_search_all
 from src.strings.suffix_tree import CompressedSuffixTree
 
 
@@ -29,4 +32,31 @@ def test_longest_repeated_substring():
 def test_count_distinct_substrings():
     tree = CompressedSuffixTree("aba")
     # distinct substrings: a, b, ab, ba, aba
-    assert tree.count_distinct_substrings() == 5
\ No newline at end of file
+    assert tree.count_distinct_substrings() == 5
+
+
+def test_suffix_tree_matches_kmp_on_random_text():
+    rng = random.Random(3)
+    text = "".join(rng.choice("acgt") for _ in range(500))
+    tree = CompressedSuffixTree(text)
+
+    for length in (1, 2, 4, 7):
+        for _ in range(10):
+            start = rng.randint(0, len(text) - length)
+            pattern = text[start:start + length]
+            assert tree.search(pattern) == kmp_search_all(text, pattern)
+
+
+def test_suffix_tree_suffix_that_is_prefix_of_another():
+    tree = CompressedSuffixTree("aaaa")
+    assert tree.search("aa") == [0, 1, 2]
+    assert tree.longest_repeated_substring() == "aaa"
+    assert tree.count_distinct_substrings() == 4
+
+
+def test_suffix_tree_count_uses_leaf_counts():
+    tree = CompressedSuffixTree("mississippi")
+    assert tree.count("ssi") == 2
+    assert tree.count("i") == 4
+    assert tree.count("x") == 0
+    assert sorted(tree.iter_search("ss")) == [2, 5]
@@ -49,4 +49,48 @@ def test_wavelet_tree_invalid_quantile():
         wt.quantile(0, 2, 4)
         assert False, "Expected ValueError"
     except ValueError:
-        assert True
\ No newline at end of file
+        assert True
+
+
+def test_wavelet_tree_access_and_select():
+    data = [3, 1, 4, 1, 5, 9, 2, 6, 5]
+    wt = WaveletTree(data)
+
+    assert [wt.access(i) for i in range(len(data))] == data
+    assert wt.select(1, 1) == 1
+    assert wt.select(1, 2) == 3
+    assert wt.select(5, 2) == 8
+    assert wt.select(1, 3) == -1
+    assert wt.select(7, 1) == -1
+
+
+def test_wavelet_tree_range_freq_and_top_k():
+    data = [3, 1, 4, 1, 5, 9, 2, 6, 5]
+    wt = WaveletTree(data)
+
+    assert wt.range_freq(0, 8, 1, 4) == 5
+    assert wt.range_freq(2, 6, 5, 9) == 2
+    assert wt.range_freq(0, 8, 7, 8) == 0
+    assert wt.top_k(0, 8, 2) == [(1, 2), (5, 2)]
+    assert wt.top_k(4, 8, 1) == [(5, 2)]
+
+
+def test_wavelet_tree_matches_brute_force():
+    import random
+    from collections import Counter
+
+    rng = random.Random(22)
+    data = [rng.randint(0, 12) for _ in range(300)]
+    wt = WaveletTree(data)
+
+    for _ in range(100):
+        left = rng.randint(0, len(data) - 1)
+        right = rng.randint(left, len(data) - 1)
+        window = data[left:right + 1]
+        k = rng.randint(1, len(window))
+        low, high = sorted((rng.randint(0, 12), rng.randint(0, 12)))
+
+        assert wt.quantile(left, right, k) == sorted(window)[k - 1]
+        assert wt.range_freq(left, right, low, high) == sum(low <= x <= high for x in window)
+        expected = sorted(Counter(window).items(), key=lambda item: (-item[1], item[0]))[:3]
+        assert wt.top_k(left, right, 3) == expected